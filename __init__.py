@@ -31,6 +31,10 @@ def classFactory(iface):  # pylint: disable=invalid-name
     :param iface: A QGIS interface instance.
     :type iface: QgsInterface
     """
-    #
+    from time import perf_counter
+    t0 = perf_counter()
     from .unique_values_viewer import UniqueValuesViewer
-    return UniqueValuesViewer(iface)
+    import_time = perf_counter() - t0
+    plugin = UniqueValuesViewer(iface)
+    plugin.startup_time['import'] = import_time
+    return plugin
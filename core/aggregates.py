@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from itertools import islice
+
+from unique_values_viewer.core.utils import is_null, value_to_str
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Number of features aggregated at once with numpy
+CHUNK_SIZE = 100000
+
+
+class GroupAggregates:
+    """ Aggregates of a field B for the features with one value of a
+    field A: the number of features, and the sum, mean, minimum, maximum
+    and number of distinct values of the values of B that are not NULL.
+    Sum and mean are None if B is not numeric. """
+
+    def __init__(self, count: int = 0, total=None, minimum=None, maximum=None,
+                 distinct_count: int = 0, value_count: int = 0):
+        """ Constructor.
+
+        @param count: Number of features
+        @param total: Sum of the values of B
+        @param value_count: Number of values of B that are not NULL
+        """
+        self.count = count
+        self.sum = total
+        self.minimum = minimum
+        self.maximum = maximum
+        self.distinct_count = distinct_count
+        self.value_count = value_count
+
+    @property
+    def mean(self):
+        """ The mean of the values of B, None if B is not numeric or all
+        values are NULL """
+        if self.sum is None or not self.value_count:
+            return None
+        return self.sum / self.value_count
+
+
+def group_aggregates(features, idx_a: int, idx_b: int, numeric: bool) -> dict:
+    """ Returns the GroupAggregates of field B per value of field A, as
+    strings, of ``features´´ in a single pass.
+
+    For numeric fields B and if numpy is installed, the features are
+    aggregated in chunks of CHUNK_SIZE: the values of A are mapped to group
+    codes and the aggregates of a chunk are computed per code with
+    numpy.bincount and the ufuncs minimum.at and maximum.at.
+
+    @param features: Features with both attributes
+    @type features: QgsFeatureIterator
+    @param idx_a: Index of field A
+    @param idx_b: Index of field B
+    @param numeric: True if field B is numeric
+    """
+    pairs = ((value_to_str(attributes[idx_a]), attributes[idx_b])
+             for attributes in (feat.attributes() for feat in features))
+    if numeric and np is not None:
+        return _aggregate_chunks(pairs)
+
+    groups = {}
+    distinct = {}
+    for a, b in pairs:
+        group = groups.get(a)
+        if group is None:
+            group = groups[a] = GroupAggregates(total=0 if numeric else None)
+            distinct[a] = set()
+        group.count += 1
+        if is_null(b):
+            continue
+        group.value_count += 1
+        if numeric:
+            group.sum += b
+        distinct[a].add(value_to_str(b))
+        try:
+            if group.minimum is None or b < group.minimum:
+                group.minimum = b
+            if group.maximum is None or b > group.maximum:
+                group.maximum = b
+        except TypeError:
+            pass
+    for a, group in groups.items():
+        group.distinct_count = len(distinct[a])
+    return groups
+
+
+def _aggregate_chunks(pairs) -> dict:
+    """ Aggregates the pairs of a value of A and a number or NULL of B with
+    numpy, chunk by chunk """
+    codes = {}
+    keys = []
+    counts = np.zeros(0, dtype=np.int64)
+    value_counts = np.zeros(0, dtype=np.int64)
+    sums = np.zeros(0)
+    minima = np.zeros(0)
+    maxima = np.zeros(0)
+    distinct = set()
+
+    while True:
+        chunk = list(islice(pairs, CHUNK_SIZE))
+        if not chunk:
+            break
+        chunk_codes = np.empty(len(chunk), dtype=np.int64)
+        values = np.empty(len(chunk))
+        for i, (a, b) in enumerate(chunk):
+            code = codes.get(a)
+            if code is None:
+                code = codes[a] = len(keys)
+                keys.append(a)
+            chunk_codes[i] = code
+            values[i] = np.nan if is_null(b) else b
+
+        # grow the arrays for the new groups of the chunk
+        grow = len(keys) - len(counts)
+        if grow:
+            counts = np.concatenate([counts, np.zeros(grow, dtype=np.int64)])
+            value_counts = np.concatenate([value_counts, np.zeros(grow, dtype=np.int64)])
+            sums = np.concatenate([sums, np.zeros(grow)])
+            minima = np.concatenate([minima, np.full(grow, np.inf)])
+            maxima = np.concatenate([maxima, np.full(grow, -np.inf)])
+
+        counts += np.bincount(chunk_codes, minlength=len(keys))
+        valid = ~np.isnan(values)
+        chunk_codes, values = chunk_codes[valid], values[valid]
+        value_counts += np.bincount(chunk_codes, minlength=len(keys))
+        sums += np.bincount(chunk_codes, weights=values, minlength=len(keys))
+        np.minimum.at(minima, chunk_codes, values)
+        np.maximum.at(maxima, chunk_codes, values)
+        distinct.update(zip(chunk_codes.tolist(), values.tolist()))
+
+    distinct_counts = np.bincount(np.fromiter((code for code, _ in distinct), dtype=np.int64,
+                                              count=len(distinct)), minlength=len(keys))
+    groups = {}
+    for code, a in enumerate(keys):
+        has_values = value_counts[code] > 0
+        groups[a] = GroupAggregates(int(counts[code]), float(sums[code]),
+                                    float(minima[code]) if has_values else None,
+                                    float(maxima[code]) if has_values else None,
+                                    int(distinct_counts[code]), int(value_counts[code]))
+    return groups
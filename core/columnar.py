@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from collections import Counter
+
+from unique_values_viewer.core.ogr_sql import MAX_FIDS, gdal, open_layer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow.compute as pc
+except ImportError:
+    pc = None
+
+# The Arrow stream of OGR layers is available since GDAL 3.6
+MIN_GDAL_VERSION = 3060000
+BATCH_SIZE = 65536
+
+
+def arrow_available() -> bool:
+    """ Returns True if GDAL supports Arrow streams and pyarrow or numpy is
+    installed to read them """
+    return (gdal is not None and int(gdal.VersionInfo()) >= MIN_GDAL_VERSION
+            and (pc is not None or np is not None))
+
+
+def arrow_value_counts(path: str, layer_name: str, field_name: str, subset: str = '',
+                       fids=None) -> Counter:
+    """ Returns the number of features per value of ``field_name´´, read
+    column by column from the Arrow stream of the OGR layer. Only the
+    field is read, without geometries and feature ids, and each batch is
+    counted by the vectorized ``value_counts´´ of pyarrow or ``numpy.unique´´.
+    NULL values are returned as None.
+
+    Returns None if GDAL is older than 3.6, neither pyarrow nor numpy is
+    installed, or the data source or the subset string is not supported.
+    The caller then falls back to the feature iterator.
+
+    @param path: Path of the data source
+    @param layer_name: Name of the layer, None for single layer data sources
+    @param field_name: Name of the field
+    @param subset: Subset string of the QGIS layer, used as attribute filter
+    @param fids: Ids of the features to count, e.g. the selected features
+    """
+    if not arrow_available():
+        return None
+    if subset and subset.lstrip().upper().startswith('SELECT'):
+        return None
+    if fids is not None and len(fids) > MAX_FIDS:
+        return None
+    opened = open_layer(path, layer_name, drivers=None)
+    if opened is None:
+        return None
+    dataset, layer_name = opened
+    layer = dataset.GetLayerByName(layer_name)
+    definition = layer.GetLayerDefn()
+    if definition.GetFieldIndex(field_name) < 0:
+        return None
+
+    conditions = [f"({subset})"] if subset else []
+    if fids is not None:
+        conditions.append(f"FID IN ({','.join(str(int(fid)) for fid in fids) or '-1'})")
+    other_fields = [definition.GetFieldDefn(i).GetName() for i in range(definition.GetFieldCount())
+                    if definition.GetFieldDefn(i).GetName() != field_name]
+    try:
+        if conditions:
+            layer.SetAttributeFilter(' AND '.join(conditions))
+        layer.SetIgnoredFields(other_fields + ['OGR_GEOMETRY', 'OGR_STYLE'])
+        options = ['INCLUDE_FID=NO', f'MAX_FEATURES_IN_BATCH={BATCH_SIZE}']
+        if pc is not None:
+            return _count_pyarrow(layer.GetArrowStreamAsPyArrow(options), field_name)
+        return _count_numpy(layer.GetArrowStreamAsNumPy(options), field_name)
+    except RuntimeError:
+        return None
+
+
+def _count_pyarrow(stream, field_name: str) -> Counter:
+    """ Counts the values of the column ``field_name´´ of the pyarrow
+    record batches of ``stream´´ """
+    counts = Counter()
+    for batch in stream:
+        column = batch.column(batch.schema.get_field_index(field_name))
+        result = pc.value_counts(column)
+        counts.update(dict(zip(result.field('values').to_pylist(),
+                               result.field('counts').to_pylist())))
+    return counts
+
+
+def _count_numpy(stream, field_name: str) -> Counter:
+    """ Counts the values of the column ``field_name´´ of the batches of
+    numpy arrays of ``stream´´. Columns with NULL values are masked arrays. """
+    counts = Counter()
+    for batch in stream:
+        column = batch[field_name]
+        if np.ma.isMaskedArray(column):
+            null_count = int(np.ma.count_masked(column))
+            if null_count:
+                counts[None] += null_count
+            column = column.compressed()
+        if column.dtype == object:
+            # strings are object arrays of bytes, possibly with None
+            for value, count in Counter(column.tolist()).items():
+                counts[value.decode('utf-8') if isinstance(value, bytes) else value] += count
+        elif len(column):
+            values, value_counts = np.unique(column, return_counts=True)
+            counts.update(dict(zip(values.tolist(), value_counts.tolist())))
+    return counts
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from collections import Counter
+
+from qgis.core import QgsExpression
+
+from unique_values_viewer.core.utils import is_null, value_to_str
+
+
+class CoOccurrenceIndex:
+    """ Index of the values of a field B occurring together with each
+    value of a field A, built in a single scan of the features. The values
+    of B for any selection of values of A are then looked up without
+    accessing the layer again.
+    """
+
+    def __init__(self):
+        """ Constructor."""
+        # value of A -> Counter of the values of B
+        self.pairs = {}
+        # displayed values -> raw attribute values, to build expressions
+        self.raw_a = {}
+        self.raw_b = {}
+
+    def build(self, features, idx_a: int, idx_b: int) -> None:
+        """ Adds the value pairs of the fields with index ``idx_a´´ and
+        ``idx_b´´ of ``features´´
+
+        @param features: Features with both attributes
+        @type features: QgsFeatureIterator
+        """
+        pairs, raw_a, raw_b = self.pairs, self.raw_a, self.raw_b
+        for feat in features:
+            attributes = feat.attributes()
+            a, b = attributes[idx_a], attributes[idx_b]
+            text_a, text_b = value_to_str(a), value_to_str(b)
+            counts = pairs.get(text_a)
+            if counts is None:
+                counts = pairs[text_a] = Counter()
+                raw_a[text_a] = a
+            if text_b not in raw_b:
+                raw_b[text_b] = b
+            counts[text_b] += 1
+
+    def values_a(self) -> Counter:
+        """ Returns the values of A with their number of features """
+        return Counter({a: sum(counts.values()) for a, counts in self.pairs.items()})
+
+    def values_b(self, values_a) -> Counter:
+        """ Returns the values of B of the features with one of ``values_a´´
+        with their number of features """
+        result = Counter()
+        for a in values_a:
+            result.update(self.pairs.get(a, ()))
+        return result
+
+
+def values_expression(field_name: str, raw_values) -> str:
+    """ Returns an expression for the features with one of the raw
+    attribute ``raw_values´´ in the field ``field_name´´ """
+    column = QgsExpression.quotedColumnRef(field_name)
+    values = [value for value in raw_values if not is_null(value)]
+    parts = []
+    if values:
+        parts.append(f"{column} in ({','.join(QgsExpression.quotedValue(value) for value in values)})")
+    if len(values) < len(raw_values):
+        parts.append(f"{column} is Null")
+    return ' or '.join(parts)
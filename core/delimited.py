@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import csv
+from collections import Counter
+from itertools import islice
+
+from qgis.PyQt.QtCore import QUrl, QUrlQuery
+
+from unique_values_viewer.core.utils import FieldTypes
+
+# Number of values converted and counted at once
+CHUNK_SIZE = 100000
+# Special characters of the delimiter, quote and escape options
+CHARACTERS = {'\\t': '\t', 't': '\t', 'tab': '\t', 'space': ' '}
+
+
+class DelimitedTextSource:
+    """ The file and the options of a layer of the delimitedtext provider,
+    parsed from its URI, e.g.
+    ``file:///data.csv?type=csv&delimiter=;&encoding=UTF-8&xField=x&yField=y´´
+    """
+
+    def __init__(self, uri: str):
+        """ Constructor.
+
+        @param uri: Source of the layer
+        """
+        url = QUrl(uri)
+        query = QUrlQuery(url)
+
+        def option(key, default=''):
+            return query.queryItemValue(key, QUrl.FullyDecoded) if query.hasQueryItem(key) else default
+
+        self.path = url.toLocalFile()
+        self.type = option('type', 'csv').lower()
+        self.encoding = option('encoding', 'UTF-8')
+        # skip a byte order mark like the provider
+        if self.encoding.upper().replace('-', '') == 'UTF8':
+            self.encoding = 'utf-8-sig'
+        self.delimiter = CHARACTERS.get(option('delimiter', ','), option('delimiter', ','))
+        self.quote = CHARACTERS.get(option('quote', '"'), option('quote', '"'))
+        self.escape = CHARACTERS.get(option('escape', '"'), option('escape', '"'))
+        self.skip_lines = int(option('skipLines', '0') or 0)
+        self.use_header = option('useHeader', 'yes').lower() not in ('no', 'false', '0')
+        self.trim_fields = option('trimFields', 'no').lower() in ('yes', 'true', '1')
+        self.decimal_comma = option('decimalPoint', '.') == ','
+
+    @property
+    def supported(self) -> bool:
+        """ True if the file can be read with the csv module: a local file
+        with a single character delimiter, quote and escape character.
+        Regular expression and whitespace delimiters are not supported. """
+        return (bool(self.path) and self.type in ('csv', 'plain')
+                and len(self.delimiter) == 1 and len(self.quote) <= 1 and len(self.escape) <= 1)
+
+    def reader(self, file):
+        """ Returns a csv reader of the rows of the open ``file´´ """
+        options = {'delimiter': self.delimiter}
+        if self.quote:
+            options['quotechar'] = self.quote
+            # an escape character equal to the quote doubles the quote
+            options['doublequote'] = self.escape == self.quote
+            if self.escape and self.escape != self.quote:
+                options['escapechar'] = self.escape
+        else:
+            options['quoting'] = csv.QUOTE_NONE
+            if self.escape:
+                options['escapechar'] = self.escape
+        return csv.reader(file, **options)
+
+
+def text_converter(field_type: FieldTypes, trim: bool = False, decimal_comma: bool = False):
+    """ Returns a function converting the text of a value to the string
+    displayed for the field type, like the providers do, e.g. '1.50' to
+    '1.5' for decimal fields. Empty values and values that cannot be
+    converted are NULL (None).
+
+    @param field_type: Type of the field, STRING, INTEGER or DECIMAL
+    @param trim: True to strip whitespace from strings
+    @param decimal_comma: True if decimal numbers use a comma
+    """
+    def to_text(text):
+        if trim:
+            text = text.strip()
+        return text if text else None
+
+    if field_type == FieldTypes.STRING:
+        return to_text
+
+    convert = int if field_type == FieldTypes.INTEGER else float
+
+    def to_number(text):
+        text = text.strip()
+        if not text:
+            return None
+        if decimal_comma:
+            text = text.replace(',', '.')
+        try:
+            return str(convert(text))
+        except ValueError:
+            return None
+
+    return to_number
+
+
+def _convert_counts(counts: Counter, convert) -> Counter:
+    """ Converts the distinct texts of ``counts´´ once, different texts of
+    the same value, e.g. '1.0' and '1', are merged """
+    converted = Counter()
+    for text, count in counts.items():
+        converted[convert(text)] += count
+    return converted
+
+
+def delimited_value_counts(uri: str, field_name: str, field_type: FieldTypes) -> Counter:
+    """ Returns the number of rows per value of the column ``field_name´´
+    of the delimited text file of a layer, or None if the options of the
+    file are not supported. NULL values are returned as None.
+
+    The file is streamed row by row and only the values of the column are
+    kept, they are converted and counted in chunks of CHUNK_SIZE values.
+    No features or geometries are created.
+
+    @param uri: Source of the layer
+    @param field_name: Name of the field
+    @param field_type: Type of the field, STRING, INTEGER or DECIMAL
+    """
+    source = DelimitedTextSource(uri)
+    if not source.supported:
+        return None
+    convert = text_converter(field_type, source.trim_fields, source.decimal_comma)
+    counts = Counter()
+    try:
+        with open(source.path, encoding=source.encoding, newline='') as file:
+            for _ in range(source.skip_lines):
+                file.readline()
+            rows = source.reader(file)
+            if source.use_header:
+                header = [name.strip() for name in next(rows, [])]
+                if field_name not in header:
+                    return None
+                column = header.index(field_name)
+            elif field_name.startswith('field_') and field_name[6:].isdigit():
+                column = int(field_name[6:]) - 1
+            else:
+                return None
+
+            # short rows have NULL values for the missing columns
+            values = (row[column] if len(row) > column else '' for row in rows if row)
+            while True:
+                chunk = list(islice(values, CHUNK_SIZE))
+                if not chunk:
+                    break
+                counts.update(_convert_counts(Counter(chunk), convert))
+    except (OSError, LookupError, UnicodeDecodeError, csv.Error):
+        return None
+    return counts
+
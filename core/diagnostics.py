@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+STAGES = ('fetch', 'dedup', 'format', 'sort', 'populate', 'expression', 'selection')
+
+
+class UVVProfiler:
+    """ Opt-in instrumentation for the hot paths of the plugin.
+
+    Every user action (update of values, selection, ...) is recorded as a
+    run, which holds the time spent in each stage and the number of fetched
+    features. With ``trace_memory´´, runs record the peak of the memory
+    allocated by Python instead. Tracing slows down the Python code but
+    not the data providers, so the times of traced runs are not recorded.
+    When the profiler is disabled, all methods return immediately, so the
+    instrumented code does not get slower.
+    """
+
+    MAX_RUNS = 20
+
+    def __init__(self, enabled: bool = False, trace_memory: bool = False):
+        """ Constructor."""
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.finished_callback = None
+        self.runs = []
+        self._run = None
+        self._stack = []
+
+    @property
+    def last_run(self) -> dict:
+        """ The last finished run or None """
+        return self.runs[-1] if self.runs else None
+
+    def start(self, action: str, **info) -> None:
+        """ Starts a new run for ``action´´, additional ``info´´ (layer,
+        field, provider, ...) is stored with the run
+        """
+        if not self.enabled:
+            return None
+        if self._run is not None:
+            # nested actions are recorded in the run that is already active
+            self._run['nested'] += 1
+            return None
+        self._run = {'action': action,
+                     'started': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                     'stages': {},
+                     'features': 0,
+                     'nested': 0}
+        self._run.update(info)
+        self._stack = []
+        self._run['_tracing'] = self.trace_memory and not tracemalloc.is_tracing()
+        if self._run['_tracing']:
+            tracemalloc.start()
+        elif self.trace_memory and hasattr(tracemalloc, 'reset_peak'):
+            # Python >= 3.9, otherwise the peak of the running trace is used
+            tracemalloc.reset_peak()
+        self._run['_t0'] = time.perf_counter()
+
+    def finish(self) -> dict:
+        """ Finishes the active run and returns it """
+        if not self.enabled or self._run is None:
+            return None
+        run = self._run
+        if run['nested'] > 0:
+            run['nested'] -= 1
+            return None
+        run['total'] = time.perf_counter() - run.pop('_t0')
+        if self.trace_memory and tracemalloc.is_tracing():
+            run['peak_memory_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+            # the times are distorted by tracing
+            run['stages'] = {}
+            run['total'] = None
+        else:
+            run['peak_memory_kb'] = None
+        if run.pop('_tracing'):
+            tracemalloc.stop()
+        fetch_time = run['stages'].get('fetch', 0.0)
+        if run['features'] and fetch_time > 0:
+            run['features_per_sec'] = int(run['features'] / fetch_time)
+        else:
+            run['features_per_sec'] = None
+        del run['nested']
+        self._run = None
+        self.runs.append(run)
+        del self.runs[:-self.MAX_RUNS]
+        return run
+
+    @contextmanager
+    def run(self, action: str, **info):
+        """ Context manager recording a run for ``action´´ """
+        self.start(action, **info)
+        try:
+            yield
+        finally:
+            if self.finish() is not None and self.finished_callback:
+                self.finished_callback()
+
+    def _add_time(self, name: str, elapsed: float) -> None:
+        """ Adds ``elapsed´´ seconds to the stage ``name´´ of the active run """
+        stages = self._run['stages']
+        stages[name] = stages.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def stage(self, name: str):
+        """ Context manager measuring the time of the stage ``name´´.
+        Time spent in nested stages or iterators is not counted twice.
+        """
+        if not self.enabled or self._run is None:
+            yield
+            return
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[0]
+            self._add_time(name, elapsed - frame[1])
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def iterate(self, name: str, iterable):
+        """ Wraps ``iterable´´ and measures the time spent waiting for its
+        items, e.g. to separate the time the data provider needs to fetch
+        features from the time of the Python loop consuming them.
+        """
+        if not self.enabled or self._run is None:
+            return iterable
+        return self._timed_iter(name, iterable)
+
+    def _timed_iter(self, name: str, iterable):
+        """ Generator for iterate() """
+        clock = time.perf_counter
+        iterator = iter(iterable)
+        count = 0
+        fetched = 0.0
+        try:
+            while True:
+                t0 = clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    fetched += clock() - t0
+                    break
+                fetched += clock() - t0
+                count += 1
+                yield item
+        finally:
+            if self._run is not None:
+                self._add_time(name, fetched)
+                self._run['features'] += count
+                if self._stack:
+                    self._stack[-1][1] += fetched
+
+    def count_features(self, count: int) -> None:
+        """ Adds ``count´´ features to the active run, for stages that
+        do not iterate the features in Python, e.g. provider functions
+        """
+        if self.enabled and self._run is not None:
+            self._run['features'] += count
+
+    def annotate(self, key: str, value) -> None:
+        """ Stores additional information ``value´´ as ``key´´ in the
+        active run, e.g. the number of expression evaluations
+        """
+        if self.enabled and self._run is not None:
+            self._run[key] = value
+
+    def clear(self) -> None:
+        """ Removes all recorded runs """
+        self.runs = []
+
+    def report(self, run: dict = None) -> str:
+        """ Returns a human readable summary of ``run´´, by default
+        of the last finished run
+        """
+        run = run or self.last_run
+        if run is None:
+            return ''
+        lines = [f"{run['action']} ({run['started']})"]
+        for key in ('layer', 'provider', 'field', 'scope'):
+            if run.get(key) is not None:
+                lines.append(f"{key.capitalize()}: {run[key]}")
+        for name in STAGES + tuple(sorted(set(run['stages']) - set(STAGES))):
+            if name in run['stages']:
+                lines.append(f"  {name:<12}{run['stages'][name] * 1000:>10.1f} ms")
+        if run['total'] is not None:
+            lines.append(f"  {'total':<12}{run['total'] * 1000:>10.1f} ms")
+        lines.append(f"Features: {run['features']}")
+        if run.get('evaluations') is not None:
+            lines.append(f"Expression evaluations: {run['evaluations']}")
+        if run['features_per_sec'] is not None:
+            lines.append(f"Features/sec: {run['features_per_sec']}")
+        if run['peak_memory_kb'] is not None:
+            lines.append(f"Peak memory (Python): {run['peak_memory_kb']} KB")
+        return '\n'.join(lines)
+
+    def to_json(self) -> str:
+        """ Returns all recorded runs as JSON string """
+        return json.dumps(self.runs, indent=2, default=str)
+
+    def export_json(self, path: str) -> None:
+        """ Writes all recorded runs as JSON to the file ``path´´ """
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtWidgets import (QAbstractItemView,
+                                 QApplication,
+                                 QComboBox,
+                                 QDialog,
+                                 QDialogButtonBox,
+                                 QFormLayout,
+                                 QGridLayout,
+                                 QLabel,
+                                 QLineEdit,
+                                 QListWidget,
+                                 QListWidgetItem,
+                                 QTreeWidget,
+                                 QTreeWidgetItem,
+                                 QVBoxLayout)
+from qgis.gui import QgsFieldComboBox, QgsMapLayerComboBox
+from qgis.core import (QgsApplication,
+                       QgsFeatureRequest,
+                       QgsMapLayerProxyModel,
+                       QgsProject,
+                       QgsVectorLayer,
+                       QgsVectorLayerFeatureSource)
+
+from unique_values_viewer.core.crossfilter import CoOccurrenceIndex, values_expression
+from unique_values_viewer.core.duplicates import DuplicateValuesTask
+from unique_values_viewer.core.multilayer import (OPERATIONS,
+                                                  MultiLayerValuesTask,
+                                                  combine_layer_values)
+from unique_values_viewer.core.pointcloud import (PointCloudValuesTask,
+                                                  metadata_value_counts,
+                                                  point_cloud_file)
+from unique_values_viewer.core.profile import LayerProfileTask
+from unique_values_viewer.core.utils import value_to_str
+
+
+class MultiLayerDialog(QDialog):
+    """ Dialog to combine the unique values of a field across several
+    layers by union, intersection or difference.
+    """
+
+    def __init__(self, field_name: str, parent=None):
+        """ Constructor.
+
+        @param field_name: Name of the field preset in the dialog
+        @type field_name: str
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr('Unique Values of Several Layers'))
+        self.resize(420, 520)
+
+        self.layerList = QListWidget()
+        for layer in QgsProject.instance().mapLayers().values():
+            if not isinstance(layer, QgsVectorLayer):
+                continue
+            item = QListWidgetItem(layer.name())
+            item.setData(Qt.UserRole, layer.id())
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            has_field = layer.fields().indexFromName(field_name or '') >= 0
+            item.setCheckState(Qt.Checked if has_field else Qt.Unchecked)
+            self.layerList.addItem(item)
+
+        self.fieldEdit = QLineEdit(field_name or '')
+        self.operationBox = QComboBox()
+        self.operationBox.addItems(OPERATIONS)
+        self.operationBox.setToolTip(self.tr('The difference contains the values '
+                                             'of the first checked layer only.'))
+
+        form = QFormLayout()
+        form.addRow(self.tr('Field'), self.fieldEdit)
+        form.addRow(self.tr('Operation'), self.operationBox)
+
+        self.resultTree = QTreeWidget()
+        self.resultTree.setHeaderLabels([self.tr('Value'), self.tr('Features'), self.tr('Layers')])
+        self.resultTree.setSortingEnabled(True)
+        self.resultLbl = QLabel()
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.computeBtn = buttons.addButton(self.tr('Compute'), QDialogButtonBox.ActionRole)
+        self.computeBtn.clicked.connect(self.compute)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(self.tr('Layers')))
+        layout.addWidget(self.layerList)
+        layout.addLayout(form)
+        layout.addWidget(self.resultTree)
+        layout.addWidget(self.resultLbl)
+        layout.addWidget(buttons)
+
+        self.task = None
+        self.rejected.connect(self.cancel_task)
+
+    def cancel_task(self) -> None:
+        """ Cancels the running scan, if any """
+        if self.task is not None:
+            self.task.cancel()
+
+    def checked_layers(self) -> list:
+        """ Returns the checked layers in the order of the list """
+        project = QgsProject.instance()
+        layers = []
+        for i in range(self.layerList.count()):
+            item = self.layerList.item(i)
+            if item.checkState() == Qt.Checked:
+                layer = project.mapLayer(item.data(Qt.UserRole))
+                if layer is not None:
+                    layers.append(layer)
+        return layers
+
+    def compute(self) -> None:
+        """ Scans the checked layers concurrently in a background task,
+        the combined values are shown when it is completed """
+        self.cancel_task()
+        self.task = MultiLayerValuesTask(self.checked_layers(), self.fieldEdit.text())
+        task = self.task
+        task.taskCompleted.connect(lambda: self.show_values(task))
+        task.taskTerminated.connect(lambda: self.show_canceled(task))
+        self.resultLbl.setText(self.tr('Scanning {} layers…').format(len(task.jobs)))
+        QgsApplication.taskManager().addTask(task)
+
+    def show_canceled(self, task) -> None:
+        """ Tells that the scan of ``task´´ was canceled, unless it was
+        replaced by a new one """
+        if task is self.task:
+            self.task = None
+            self.resultLbl.setText(self.tr('Scan canceled'))
+
+    def show_values(self, task) -> None:
+        """ Shows the values combined from the value counts of ``task´´ """
+        if task is not self.task:
+            return None
+        self.task = None
+        names = task.names
+        layer_counts = task.layer_counts
+        result = combine_layer_values(layer_counts, self.operationBox.currentText())
+
+        self.resultTree.clear()
+        self.resultTree.setSortingEnabled(False)
+        items = []
+        for value, counts in result.items():
+            item = QTreeWidgetItem([value, '', ', '.join(names[layer_id] for layer_id in counts)])
+            item.setData(1, Qt.DisplayRole, sum(counts.values()))
+            item.setToolTip(2, '\n'.join(f"{names[layer_id]}: {count}"
+                                         for layer_id, count in counts.items()))
+            items.append(item)
+        self.resultTree.addTopLevelItems(items)
+        self.resultTree.setSortingEnabled(True)
+        self.resultTree.sortByColumn(0, Qt.AscendingOrder)
+        self.resultLbl.setText(self.tr('{} values in {} of {} layers').format(len(result),
+                                                                             len(layer_counts),
+                                                                             len(names)))
+
+
+class DuplicatesDialog(QDialog):
+    """ Dialog listing clusters of values that differ only by whitespace,
+    case, accents or a small edit distance. The clusters are searched in
+    a background task.
+    """
+
+    def __init__(self, layer, field_name: str, values, request, select_values, parent=None):
+        """ Constructor.
+
+        @param layer: The vector layer
+        @type layer: QgsVectorLayer
+        @param field_name: Name of the field
+        @param values: The unique values of the field as strings
+        @param request: Request for the features in scope
+        @type request: QgsFeatureRequest
+        @param select_values: Function selecting the features with a list of values
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr('Duplicate Values of {}').format(field_name))
+        self.resize(420, 520)
+        self.select_values = select_values
+
+        self.resultTree = QTreeWidget()
+        self.resultTree.setHeaderLabels([self.tr('Value'), self.tr('Features')])
+        self.resultTree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.resultLbl = QLabel(self.tr('Searching duplicate values…'))
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.selectBtn = buttons.addButton(self.tr('Select Features'), QDialogButtonBox.ActionRole)
+        self.selectBtn.setToolTip(self.tr('Selects the features of all values of the selected clusters'))
+        self.selectBtn.setEnabled(False)
+        self.selectBtn.clicked.connect(self.select_clusters)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.resultTree)
+        layout.addWidget(self.resultLbl)
+        layout.addWidget(buttons)
+
+        idx = layer.fields().indexFromName(field_name)
+        self.task = DuplicateValuesTask(QgsVectorLayerFeatureSource(layer), idx, request, values)
+        self.task.taskCompleted.connect(self.show_clusters)
+        self.task.taskTerminated.connect(lambda: self.resultLbl.setText(self.tr('Search canceled')))
+        self.rejected.connect(self.task.cancel)
+        QgsApplication.taskManager().addTask(self.task)
+
+    def show_clusters(self) -> None:
+        """ Adds the clusters found by the task to the tree """
+        counts = self.task.counts
+        items = []
+        for cluster in self.task.clusters:
+            item = QTreeWidgetItem([', '.join(cluster), str(sum(counts[value] for value in cluster))])
+            item.setData(0, Qt.UserRole, cluster)
+            for value in cluster:
+                child = QTreeWidgetItem([value, str(counts[value])])
+                child.setData(0, Qt.UserRole, [value])
+                item.addChild(child)
+            items.append(item)
+        self.resultTree.addTopLevelItems(items)
+        self.resultLbl.setText(self.tr('{} clusters of similar values').format(len(items)))
+        self.selectBtn.setEnabled(bool(items))
+
+    def select_clusters(self) -> None:
+        """ Selects the features of the selected clusters or values """
+        values = []
+        for item in self.resultTree.selectedItems():
+            values.extend(item.data(0, Qt.UserRole))
+        if values:
+            self.select_values(sorted(set(values)))
+
+
+class LayerProfileDialog(QDialog):
+    """ Dialog showing the cardinality profile of all fields of a layer,
+    computed in a single scan by a background task.
+    """
+
+    def __init__(self, layer, show_field, parent=None):
+        """ Constructor.
+
+        @param layer: The vector layer to profile
+        @type layer: QgsVectorLayer
+        @param show_field: Function showing the values of a field, called
+            with the layer, the field name and the set of its values or None
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr('Profile of {}').format(layer.name()))
+        self.resize(640, 480)
+        self.layer = layer
+        self.show_field = show_field
+
+        self.resultTree = QTreeWidget()
+        self.resultTree.setHeaderLabels([self.tr('Field'), self.tr('Distinct'), self.tr('NULL'),
+                                         self.tr('Minimum'), self.tr('Maximum'),
+                                         self.tr('Most frequent')])
+        self.resultTree.setRootIsDecorated(False)
+        self.resultTree.itemDoubleClicked.connect(self.show_values)
+        self.resultLbl = QLabel(self.tr('Profiling {} features…').format(layer.featureCount()))
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.showBtn = buttons.addButton(self.tr('Show Values'), QDialogButtonBox.ActionRole)
+        self.showBtn.setEnabled(False)
+        self.showBtn.clicked.connect(lambda: self.show_values(self.resultTree.currentItem()))
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.resultTree)
+        layout.addWidget(self.resultLbl)
+        layout.addWidget(buttons)
+
+        self.task = LayerProfileTask(QgsVectorLayerFeatureSource(layer), layer.fields(),
+                                     layer.featureCount())
+        self.task.taskCompleted.connect(self.show_profiles)
+        self.task.taskTerminated.connect(lambda: self.resultLbl.setText(self.tr('Profiling canceled')))
+        self.rejected.connect(self.task.cancel)
+        QgsApplication.taskManager().addTask(self.task)
+
+    def show_profiles(self) -> None:
+        """ Adds the profiles of the fields computed by the task to the tree """
+        self.profiles = {profile.name: profile for profile in self.task.profiles}
+        items = []
+        for profile in self.task.profiles:
+            distinct = str(profile.distinct_count) if profile.exact else f"≈ {profile.distinct_count}"
+            top = ', '.join(f"{value} ({count})" for value, count in profile.top())
+            item = QTreeWidgetItem([profile.name, distinct, str(profile.null_count),
+                                    '' if profile.minimum is None else value_to_str(profile.minimum),
+                                    '' if profile.maximum is None else value_to_str(profile.maximum),
+                                    top])
+            item.setToolTip(5, top)
+            items.append(item)
+        self.resultTree.addTopLevelItems(items)
+        self.resultLbl.setText(self.tr('Double-click a field to show its values'))
+        self.showBtn.setEnabled(bool(items))
+
+    def show_values(self, item) -> None:
+        """ Shows the values of the field of ``item´´ in the dock widget """
+        if item is not None:
+            profile = self.profiles[item.text(0)]
+            self.show_field(self.layer, profile.name, profile.values)
+
+
+class CrossFilterDialog(QDialog):
+    """ Dialog with two linked lists of values: selecting values of field A
+    shows the values of field B of the same features. The co-occurring
+    values are indexed in a single scan, so the selection in the first
+    list filters the second list without accessing the layer.
+    """
+
+    def __init__(self, layer, field_name: str, scoped_features, select_by_expression, parent=None):
+        """ Constructor.
+
+        @param layer: The vector layer
+        @type layer: QgsVectorLayer
+        @param field_name: Name of the field preset as field A
+        @param scoped_features: Function returning the features in scope for a request
+        @param select_by_expression: Function selecting the features matching an expression
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr('Cross Filter'))
+        self.resize(560, 520)
+        self.layer = layer
+        self.scoped_features = scoped_features
+        self.select_by_expression = select_by_expression
+        self.index = CoOccurrenceIndex()
+
+        self.fieldABox = QgsFieldComboBox()
+        self.fieldABox.setLayer(layer)
+        self.fieldABox.setField(field_name)
+        self.fieldBBox = QgsFieldComboBox()
+        self.fieldBBox.setLayer(layer)
+        self.listA = QListWidget()
+        self.listA.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.listA.setSortingEnabled(True)
+        self.listA.itemSelectionChanged.connect(self.filter_values)
+        self.listB = QListWidget()
+        self.listB.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.listB.setSortingEnabled(True)
+        self.resultLbl = QLabel()
+
+        grid = QGridLayout()
+        grid.addWidget(self.fieldABox, 0, 0)
+        grid.addWidget(self.fieldBBox, 0, 1)
+        grid.addWidget(self.listA, 1, 0)
+        grid.addWidget(self.listB, 1, 1)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.computeBtn = buttons.addButton(self.tr('Compute'), QDialogButtonBox.ActionRole)
+        self.computeBtn.clicked.connect(self.compute)
+        self.selectBtn = buttons.addButton(self.tr('Select Features'), QDialogButtonBox.ActionRole)
+        self.selectBtn.setToolTip(self.tr('Selects the features with the selected values of both fields'))
+        self.selectBtn.clicked.connect(self.select_features)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(grid)
+        layout.addWidget(self.resultLbl)
+        layout.addWidget(buttons)
+
+    def compute(self) -> None:
+        """ Indexes the value pairs of both fields in a single scan """
+        fields = self.layer.fields()
+        idx_a = fields.indexFromName(self.fieldABox.currentField())
+        idx_b = fields.indexFromName(self.fieldBBox.currentField())
+        if idx_a < 0 or idx_b < 0:
+            return None
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([idx_a, idx_b])
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.index = CoOccurrenceIndex()
+            self.index.build(self.scoped_features(request), idx_a, idx_b)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.listA.clear()
+        self.listB.clear()
+        self.add_values(self.listA, self.index.values_a())
+        self.resultLbl.setText(self.tr('{} values of {}').format(self.listA.count(),
+                                                                 self.fieldABox.currentField()))
+
+    @staticmethod
+    def add_values(list_widget, counts) -> None:
+        """ Adds the values of ``counts´´ with their number of features """
+        for value, count in counts.items():
+            item = QListWidgetItem(f"{value} ({count})")
+            item.setData(Qt.UserRole, value)
+            list_widget.addItem(item)
+
+    def filter_values(self) -> None:
+        """ Shows the values of field B of the selected values of field A """
+        values_a = [item.data(Qt.UserRole) for item in self.listA.selectedItems()]
+        values_b = self.index.values_b(values_a)
+        self.listB.clear()
+        self.add_values(self.listB, values_b)
+        self.resultLbl.setText(self.tr('{} values of {} for {} values of {}').format(
+            len(values_b), self.fieldBBox.currentField(), len(values_a), self.fieldABox.currentField()))
+
+    def select_features(self) -> None:
+        """ Selects the features with the selected values of field A and,
+        if values of field B are selected, with these values of field B """
+        values_a = [self.index.raw_a[item.data(Qt.UserRole)] for item in self.listA.selectedItems()]
+        values_b = [self.index.raw_b[item.data(Qt.UserRole)] for item in self.listB.selectedItems()]
+        if not values_a:
+            return None
+        expr = f"({values_expression(self.fieldABox.currentField(), values_a)})"
+        if values_b:
+            expr += f" and ({values_expression(self.fieldBBox.currentField(), values_b)})"
+        self.select_by_expression(expr)
+
+
+class PointCloudValuesDialog(QDialog):
+    """ Dialog listing the values of an attribute of a point cloud layer,
+    e.g. the classification codes, return numbers or point source ids, with
+    their number of points. The values are taken from the statistics or the
+    metadata of the layer if available, otherwise the attribute is read
+    chunk by chunk from the local file by a background task.
+    """
+
+    def __init__(self, parent=None):
+        """ Constructor."""
+        super().__init__(parent)
+        self.setWindowTitle(self.tr('Point Cloud Values'))
+        self.resize(420, 520)
+        self.task = None
+
+        self.layerBox = QgsMapLayerComboBox()
+        self.layerBox.setFilters(QgsMapLayerProxyModel.PointCloudLayer)
+        self.layerBox.layerChanged.connect(self.change_layer)
+        self.attributeBox = QComboBox()
+        self.resultTree = QTreeWidget()
+        self.resultTree.setHeaderLabels([self.tr('Value'), self.tr('Points')])
+        self.resultTree.setRootIsDecorated(False)
+        self.resultTree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.resultLbl = QLabel()
+
+        form = QFormLayout()
+        form.addRow(self.tr('Layer'), self.layerBox)
+        form.addRow(self.tr('Attribute'), self.attributeBox)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.computeBtn = buttons.addButton(self.tr('Compute'), QDialogButtonBox.ActionRole)
+        self.computeBtn.clicked.connect(self.compute)
+        self.filterBtn = buttons.addButton(self.tr('Filter Layer'), QDialogButtonBox.ActionRole)
+        self.filterBtn.setToolTip(self.tr('Shows only the points with the selected values'))
+        self.filterBtn.clicked.connect(self.filter_layer)
+        buttons.rejected.connect(self.reject)
+        self.rejected.connect(self.cancel_task)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addWidget(self.resultTree)
+        layout.addWidget(self.resultLbl)
+        layout.addWidget(buttons)
+        self.change_layer(self.layerBox.currentLayer())
+
+    def cancel_task(self) -> None:
+        """ Cancels reading the file """
+        if self.task is not None:
+            task, self.task = self.task, None
+            task.cancel()
+
+    def change_layer(self, layer) -> None:
+        """ Lists the attributes of the point cloud ``layer´´, with the
+        classification preselected """
+        self.cancel_task()
+        self.attributeBox.clear()
+        self.resultTree.clear()
+        if layer is None:
+            return None
+        names = [attribute.name() for attribute in layer.attributes().attributes()]
+        self.attributeBox.addItems(names)
+        if 'Classification' in names:
+            self.attributeBox.setCurrentText('Classification')
+        self.filterBtn.setEnabled(hasattr(layer, 'setSubsetString'))
+
+    def compute(self) -> None:
+        """ Counts the values of the attribute from the metadata or the file """
+        layer = self.layerBox.currentLayer()
+        attribute = self.attributeBox.currentText()
+        if layer is None or not attribute:
+            return None
+        self.cancel_task()
+        self.resultTree.clear()
+
+        counts = metadata_value_counts(layer, attribute)
+        if counts is not None:
+            self.show_counts(counts, self.tr('from the statistics of the layer'))
+            return None
+
+        path = point_cloud_file(layer)
+        if path is None:
+            self.resultLbl.setText(self.tr('No statistics of {} and no local LAS/LAZ file '
+                                           '(requires laspy and numpy)').format(attribute))
+            return None
+        self.resultLbl.setText(self.tr('Reading {}…').format(attribute))
+        task = PointCloudValuesTask(path, attribute)
+        task.taskCompleted.connect(lambda: self.show_task_counts(task))
+        task.taskTerminated.connect(lambda: self.show_task_counts(task))
+        self.task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def show_task_counts(self, task) -> None:
+        """ Shows the values counted by ``task´´ """
+        if task is not self.task:
+            return None
+        self.task = None
+        if task.error is not None or task.isCanceled():
+            self.resultLbl.setText(task.error or self.tr('Reading canceled'))
+        else:
+            self.show_counts(task.counts, self.tr('read from the file'))
+
+    def show_counts(self, counts, origin: str) -> None:
+        """ Adds the values of ``counts´´ with their number of points """
+        items = []
+        for value, count in sorted(counts.items()):
+            item = QTreeWidgetItem([str(value), str(count)])
+            item.setData(0, Qt.UserRole, value)
+            item.setTextAlignment(1, Qt.AlignRight)
+            items.append(item)
+        self.resultTree.addTopLevelItems(items)
+        self.resultLbl.setText(self.tr('{} values, {}').format(len(items), origin))
+
+    def filter_layer(self) -> None:
+        """ Filters the layer to the points with the selected values """
+        layer = self.layerBox.currentLayer()
+        values = [item.data(0, Qt.UserRole) for item in self.resultTree.selectedItems()]
+        if layer is None or not hasattr(layer, 'setSubsetString'):
+            return None
+        attribute = self.attributeBox.currentText()
+        subset = f"{attribute} IN ({', '.join(str(value) for value in values)})" if values else ''
+        layer.setSubsetString(subset)
+
+
+class GroupStatisticsDialog(QDialog):
+    """ Dialog showing aggregates of another field for each value of the
+    active field: number of features, sum, mean, minimum, maximum and
+    number of distinct values.
+    """
+
+    COLUMNS = ('count', 'sum', 'mean', 'minimum', 'maximum', 'distinct_count')
+
+    def __init__(self, layer, field_name: str, calc_group_aggregates, select_values, parent=None):
+        """ Constructor.
+
+        @param layer: The vector layer
+        @type layer: QgsVectorLayer
+        @param field_name: Name of the active field, whose values are grouped
+        @param calc_group_aggregates: Function returning the GroupAggregates
+            per value of the active field for the name of the other field
+        @param select_values: Function selecting the features with the given values
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr('Statistics by Value of {}').format(field_name))
+        self.resize(640, 520)
+        self.field_name = field_name
+        self.calc_group_aggregates = calc_group_aggregates
+        self.select_values = select_values
+
+        self.fieldBox = QgsFieldComboBox()
+        self.fieldBox.setLayer(layer)
+        self.resultTree = QTreeWidget()
+        self.resultTree.setHeaderLabels([field_name, self.tr('Features'), self.tr('Sum'), self.tr('Mean'),
+                                         self.tr('Minimum'), self.tr('Maximum'), self.tr('Distinct')])
+        self.resultTree.setRootIsDecorated(False)
+        self.resultTree.setSortingEnabled(True)
+        self.resultTree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.resultTree.itemDoubleClicked.connect(lambda item: self.select_values([item.text(0)]))
+        self.resultLbl = QLabel()
+
+        form = QFormLayout()
+        form.addRow(self.tr('Aggregated field'), self.fieldBox)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.computeBtn = buttons.addButton(self.tr('Compute'), QDialogButtonBox.ActionRole)
+        self.computeBtn.clicked.connect(self.compute)
+        self.selectBtn = buttons.addButton(self.tr('Select Features'), QDialogButtonBox.ActionRole)
+        self.selectBtn.setToolTip(self.tr('Selects the features with the selected values'))
+        self.selectBtn.clicked.connect(
+            lambda: self.select_values([item.text(0) for item in self.resultTree.selectedItems()]))
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addWidget(self.resultTree)
+        layout.addWidget(self.resultLbl)
+        layout.addWidget(buttons)
+
+    def compute(self) -> None:
+        """ Computes the aggregates of the chosen field per value """
+        other_field = self.fieldBox.currentField()
+        if not other_field:
+            return None
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            groups = self.calc_group_aggregates(other_field)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.resultTree.setSortingEnabled(False)
+        self.resultTree.clear()
+        items = []
+        for value, group in groups.items():
+            item = QTreeWidgetItem([value])
+            for column, name in enumerate(self.COLUMNS, 1):
+                aggregate = getattr(group, name)
+                if aggregate is not None:
+                    # numbers are sorted numerically, other values as text
+                    if not isinstance(aggregate, (int, float)):
+                        aggregate = value_to_str(aggregate)
+                    elif isinstance(aggregate, float) and aggregate.is_integer():
+                        aggregate = int(aggregate)
+                    item.setData(column, Qt.DisplayRole, aggregate)
+                    item.setTextAlignment(column, Qt.AlignRight)
+            items.append(item)
+        self.resultTree.addTopLevelItems(items)
+        self.resultTree.setSortingEnabled(True)
+        self.resultTree.sortItems(1, Qt.DescendingOrder)
+        self.resultLbl.setText(self.tr('{} values of {}, aggregates of {}').format(
+            len(items), self.field_name, other_field))
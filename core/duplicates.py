@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from collections import Counter
+
+from qgis.core import QgsTask
+
+from unique_values_viewer.core.search import normalize
+from unique_values_viewer.core.utils import value_to_str
+
+# Number of following keys each key is compared with in the sorted neighbourhood
+WINDOW = 5
+# Keys shorter than this are only grouped if they are equal
+MIN_FUZZY_LENGTH = 4
+
+
+def blocking_key(value: str) -> str:
+    """ Returns the key of ``value´´ without differences in whitespace,
+    case and accents, e.g. ' Main  Street' and 'main street' """
+    return normalize(' '.join(value.split()))
+
+
+def max_distance(key: str) -> int:
+    """ Returns the maximum edit distance of keys similar to ``key´´ """
+    if len(key) < MIN_FUZZY_LENGTH or not any(c.isalpha() for c in key):
+        return 0
+    return 1 if len(key) < 10 else 2
+
+
+def within_distance(a: str, b: str, k: int) -> bool:
+    """ Returns True if the Levenshtein distance of ``a´´ and ``b´´ is at
+    most ``k´´. Only a band of width 2k + 1 of the matrix is computed and
+    the computation stops as soon as the distance exceeds ``k´´. """
+    if abs(len(a) - len(b)) > k:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [k + 1] * len(b)
+        for j in range(max(1, i - k), min(len(b), i + k) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+        if min(current) > k:
+            return False
+        previous = current
+    return previous[-1] <= k
+
+
+def find_clusters(values) -> list:
+    """ Groups values that differ only by whitespace, case, accents or a
+    small edit distance.
+
+    Values are blocked by their normalized key first, so values with equal
+    keys form a cluster without being compared. The distinct keys are then
+    sorted, forwards and by their reversed text, and each key is only
+    compared with the next WINDOW keys (sorted neighbourhood), which keeps
+    the number of comparisons linear in the number of keys.
+
+    @param values: The unique values as strings
+    @return: List of clusters with more than one value, the largest first
+    """
+    blocks = {}
+    for value in values:
+        blocks.setdefault(blocking_key(value), []).append(value)
+
+    keys = list(blocks)
+    parent = {key: key for key in keys}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for order in (sorted(keys), sorted(keys, key=lambda k: k[::-1])):
+        for i, key in enumerate(order):
+            k = max_distance(key)
+            if not k:
+                continue
+            for other in order[i + 1:i + WINDOW + 1]:
+                if max_distance(other) and find(key) != find(other) and within_distance(key, other, k):
+                    parent[find(other)] = find(key)
+
+    clusters = {}
+    for key in keys:
+        clusters.setdefault(find(key), []).extend(blocks[key])
+    return sorted((sorted(cluster) for cluster in clusters.values() if len(cluster) > 1),
+                  key=len, reverse=True)
+
+
+class DuplicateValuesTask(QgsTask):
+    """ Background task finding clusters of duplicate values and counting
+    the features of the values in the clusters. """
+
+    def __init__(self, source, idx: int, request, values):
+        """ Constructor.
+
+        @param source: Feature source of the layer, created in the main thread
+        @type source: QgsVectorLayerFeatureSource
+        @param idx: Index of the field
+        @param request: Request for the features in scope
+        @type request: QgsFeatureRequest
+        @param values: The unique values as strings
+        """
+        super().__init__('Find duplicate values', QgsTask.CanCancel)
+        self.source = source
+        self.idx = idx
+        self.request = request
+        self.values = list(values)
+        self.clusters = []
+        self.counts = Counter()
+
+    def run(self) -> bool:
+        """ Finds the clusters and counts the features of their values """
+        self.clusters = find_clusters(self.values)
+        self.setProgress(50)
+        if not self.clusters or self.isCanceled():
+            return not self.isCanceled()
+
+        wanted = {value for cluster in self.clusters for value in cluster}
+        idx = self.idx
+        for feat in self.source.getFeatures(self.request):
+            if self.isCanceled():
+                return False
+            value = value_to_str(feat.attributes()[idx])
+            if value in wanted:
+                self.counts[value] += 1
+        self.setProgress(100)
+        return True
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from qgis.core import (QgsExpression,
+                       QgsExpressionContext,
+                       QgsExpressionContextUtils,
+                       QgsFeatureRequest)
+
+# Functions whose result does not only depend on the attribute values
+FEATURE_FUNCTIONS = {'$id', '$currentfeature', 'get_feature_by_id', 'is_selected',
+                     'num_selected', 'rand', 'randf', 'uuid', '$uuid', 'now', '$now'}
+# Variables whose value does not only depend on the attribute values
+FEATURE_VARIABLES = {'feature', 'id', 'geometry', 'row_number'}
+
+
+class ExpressionFieldEvaluator:
+    """ Evaluates the expression of a virtual field of a layer.
+
+    The expression is prepared once and a single expression context is
+    reused for all features. Only the columns referenced by the expression
+    are requested and no geometry if it is not needed. If the expression
+    depends on attribute values only, features with equal input values
+    are deduplicated first, so the expression is evaluated once per
+    distinct combination of input values instead of once per feature.
+    """
+
+    def __init__(self, layer, idx: int):
+        """ Constructor.
+
+        @param layer: The vector layer containing the virtual field
+        @type layer: QgsVectorLayer
+        @param idx: Index of the virtual field
+        @type idx: int
+        """
+        self.layer = layer
+        self.expression = QgsExpression(layer.expressionField(idx))
+        self.context = QgsExpressionContext(QgsExpressionContextUtils.globalProjectLayerScopes(layer))
+        self.expression.prepare(self.context)
+        self.columns = self.expression.referencedColumns()
+        self.evaluations = 0
+
+    @property
+    def attributes_only(self) -> bool:
+        """ True if the result only depends on the referenced attributes """
+        expression = self.expression
+        return (not expression.needsGeometry()
+                and QgsFeatureRequest.ALL_ATTRIBUTES not in self.columns
+                and not FEATURE_FUNCTIONS & set(expression.referencedFunctions())
+                and not FEATURE_VARIABLES & set(expression.referencedVariableNames()))
+
+    def request(self) -> QgsFeatureRequest:
+        """ Returns a request for the features fetching only the referenced
+        columns and the geometry only if it is needed
+        """
+        request = QgsFeatureRequest()
+        if QgsFeatureRequest.ALL_ATTRIBUTES not in self.columns:
+            request.setSubsetOfAttributes(self.columns, self.layer.fields())
+        if not self.expression.needsGeometry():
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+        return request
+
+    def evaluate(self, feature):
+        """ Returns the result of the expression for ``feature´´ """
+        self.context.setFeature(feature)
+        self.evaluations += 1
+        return self.expression.evaluate(self.context)
+
+    def unique_values(self, features, to_str=str) -> {str}:
+        """ Returns the unique results of the expression for ``features´´
+        as strings converted by ``to_str´´
+
+        @param features: Features requested with request()
+        @type features: QgsFeatureIterator
+        """
+        self.evaluations = 0
+        if not self.attributes_only:
+            return {to_str(self.evaluate(feat)) for feat in features}
+
+        fields = self.layer.fields()
+        indexes = [fields.lookupField(column) for column in self.columns]
+        representatives = {}
+        for feat in features:
+            attributes = feat.attributes()
+            key = tuple(str(attributes[i]) for i in indexes)
+            if key not in representatives:
+                representatives[key] = feat
+        return {to_str(self.evaluate(feat)) for feat in representatives.values()}
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from qgis.core import QgsExpression, QgsExpressionContext, QgsTask
+
+# Number of features written at once
+BATCH_SIZE = 10000
+
+
+class ExtractFeaturesTask(QgsTask):
+    """ Background task writing the features matching a request to a
+    feature sink, i.e. the provider of a memory layer or a file writer. The
+    features are streamed in batches of BATCH_SIZE, the selection of the
+    layer is not used. An ids filter of the request would replace a filter
+    expression, so with an ids filter the expression is evaluated by the
+    task instead. """
+
+    def __init__(self, source, request, sink, fields, expression: str = None, total: int = 0):
+        """ Constructor.
+
+        @param source: Feature source of the layer, created in the main thread
+        @type source: QgsVectorLayerFeatureSource
+        @param request: Request for the features
+        @type request: QgsFeatureRequest
+        @param sink: The sink the features are added to
+        @type sink: QgsFeatureSink
+        @param fields: Fields of the layer
+        @type fields: QgsFields
+        @param expression: Filter expression evaluated by the task, if any
+        @param total: Estimated number of features for the progress
+        """
+        super().__init__('Extract features', QgsTask.CanCancel)
+        self.source = source
+        self.request = request
+        self.sink = sink
+        self.fields = fields
+        self.expression = expression
+        self.total = max(total, 1)
+        self.count = 0
+        self.error = None
+
+    def _write(self, batch) -> bool:
+        """ Adds a batch of features to the sink """
+        added, _ = self.sink.addFeatures(batch)
+        if not added:
+            self.error = self.sink.lastError()
+            return False
+        self.count += len(batch)
+        return True
+
+    def run(self) -> bool:
+        """ Writes the features batch by batch """
+        expression = None
+        if self.expression:
+            expression = QgsExpression(self.expression)
+            context = QgsExpressionContext()
+            context.setFields(self.fields)
+            expression.prepare(context)
+
+        batch = []
+        for n, feat in enumerate(self.source.getFeatures(self.request), 1):
+            if self.isCanceled():
+                return False
+            if expression is not None:
+                context.setFeature(feat)
+                if not expression.evaluate(context):
+                    continue
+            batch.append(feat)
+            if len(batch) >= BATCH_SIZE:
+                if not self._write(batch):
+                    return False
+                batch = []
+                self.setProgress(min(100 * n / self.total, 100))
+        if batch and not self._write(batch):
+            return False
+        if not self.sink.flushBuffer():
+            self.error = self.sink.lastError()
+            return False
+        return True
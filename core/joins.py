@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from qgis.PyQt.QtCore import QVariant
+from qgis.core import (NULL,
+                       QgsFeatureRequest,
+                       QgsFields)
+
+from unique_values_viewer.core.utils import is_null
+
+
+def join_for_field(layer, field_name: str):
+    """ Returns the join and the field of the join layer for a joined field,
+    or None if ``field_name´´ is not a joined field of ``layer´´.
+
+    @param layer: The vector layer containing the field
+    @type layer: QgsVectorLayer
+    @param field_name: Name of the (joined) field
+    @type field_name: str
+
+    @return: Tuple of QgsVectorLayerJoinInfo and QgsField or None
+    """
+    fields = layer.fields()
+    idx = fields.indexFromName(field_name)
+    if idx < 0 or fields.fieldOrigin(idx) != QgsFields.OriginJoin:
+        return None
+    for join_info in layer.vectorJoins():
+        join_layer = join_info.joinLayer()
+        if join_layer is None:
+            continue
+        for field in join_layer.fields():
+            if join_info.prefixedFieldName(field) == field_name:
+                return join_info, field
+    return None
+
+
+def join_key(value) -> str:
+    """ Returns a join key as string like QGIS matches join keys, with
+    QVariant.toString(), so e.g. the integer 1, the double 1.0 and the
+    string '1' are the same key """
+    return QVariant(value).toString()
+
+
+def joined_unique_values(join_info, join_field, target_keys) -> set:
+    """ Returns the unique values of a joined field by a hash semi-join.
+
+    Instead of materializing the joined attributes of every target
+    feature, the distinct join keys of the target features are collected
+    and the join layer is scanned once for the key and the joined field
+    only. The value of the first join feature with a key present in the
+    target is kept, as QGIS joins only one partner per key. If a target
+    key has no partner in the join layer, NULL is added, because the
+    target features get NULL in the joined field.
+
+    @param join_info: The join of the field
+    @type join_info: QgsVectorLayerJoinInfo
+    @param join_field: The field of the join layer
+    @type join_field: QgsField
+    @param target_keys: Values of the target field of the join, e.g. the
+        unique values of all or of the selected features
+    @type target_keys: Iterable
+
+    @return: Set of the raw values of the joined field
+    """
+    # Keys are compared as strings, like in the join cache of QGIS,
+    # so integer keys match double and string keys with the same content
+    target_keys = set(target_keys)
+    keys = {join_key(key) for key in target_keys if not is_null(key)}
+    missing_null = any(is_null(key) for key in target_keys)
+
+    join_layer = join_info.joinLayer()
+    join_fields = join_layer.fields()
+    key_idx = join_fields.indexFromName(join_info.joinFieldName())
+    value_idx = join_fields.indexFromName(join_field.name())
+
+    request = QgsFeatureRequest()
+    request.setFlags(QgsFeatureRequest.NoGeometry)
+    request.setSubsetOfAttributes([key_idx, value_idx])
+
+    values = set()
+    matched = set()
+    for feat in join_layer.getFeatures(request):
+        attributes = feat.attributes()
+        key = join_key(attributes[key_idx])
+        if key in keys and key not in matched:
+            values.add(attributes[value_idx])
+            matched.add(key)
+
+    # Target features without a partner, or with NULL as key, are joined with NULL
+    if missing_null or len(matched) < len(keys):
+        values.add(NULL)
+    return values
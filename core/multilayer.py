@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from qgis.core import (QgsFeatureRequest,
+                       QgsTask,
+                       QgsVectorLayerFeatureSource)
+
+from unique_values_viewer.core.utils import value_to_str
+
+UNION = 'Union'
+INTERSECTION = 'Intersection'
+DIFFERENCE = 'Difference'
+OPERATIONS = (UNION, INTERSECTION, DIFFERENCE)
+
+
+def count_source_values(source, idx: int, canceled=None) -> Counter:
+    """ Counts the values of the field with index ``idx´´ of a feature
+    source. Runs in a worker thread, therefore it must not access the layer.
+
+    @param source: Feature source of a vector layer
+    @type source: QgsVectorLayerFeatureSource
+    @param idx: Index of the field
+    @type idx: int
+    @param canceled: Function returning True if the counting is canceled,
+        in which case the values counted so far are returned
+    """
+    request = QgsFeatureRequest()
+    request.setFlags(QgsFeatureRequest.NoGeometry)
+    request.setSubsetOfAttributes([idx])
+    if canceled is None:
+        return Counter(value_to_str(feat.attributes()[idx])
+                       for feat in source.getFeatures(request))
+    counts = Counter()
+    for feat in source.getFeatures(request):
+        if canceled():
+            break
+        counts[value_to_str(feat.attributes()[idx])] += 1
+    return counts
+
+
+def layer_sources(layers, field_name: str) -> {str: tuple}:
+    """ Creates the feature sources of the ``layers´´ with the field
+    ``field_name´´, layers without the field are skipped. Must be called
+    in the main thread, as required by QGIS.
+
+    @param layers: List of vector layers
+    @param field_name: Name of the field
+
+    @return: Dictionary of layer ids and the source and field index of the layer
+    """
+    jobs = {}
+    for layer in layers:
+        idx = layer.fields().indexFromName(field_name)
+        if idx >= 0:
+            jobs[layer.id()] = (QgsVectorLayerFeatureSource(layer), idx)
+    return jobs
+
+
+def scan_sources(jobs: {str: tuple}, max_workers: int = None, canceled=None) -> {str: Counter}:
+    """ Counts the values of the feature sources concurrently in a pool of
+    worker threads.
+
+    @param jobs: Dictionary of layer ids and the source and field index
+        of the layer, as returned by layer_sources
+    @param max_workers: Number of worker threads, by default the number of CPUs
+    @param canceled: Function returning True if the scan is canceled
+
+    @return: Dictionary of layer ids and the value counts of the layer
+    """
+    if not jobs:
+        return {}
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {layer_id: executor.submit(count_source_values, source, idx, canceled)
+                   for layer_id, (source, idx) in jobs.items()}
+        return {layer_id: future.result() for layer_id, future in futures.items()}
+
+
+class MultiLayerValuesTask(QgsTask):
+    """ Background task counting the values of a field of several layers
+    concurrently. The feature sources are created in the main thread by
+    the constructor. """
+
+    def __init__(self, layers, field_name: str):
+        """ Constructor.
+
+        @param layers: List of vector layers
+        @param field_name: Name of the field
+        """
+        super().__init__('Unique values of several layers', QgsTask.CanCancel)
+        self.names = {layer.id(): layer.name() for layer in layers}
+        self.jobs = layer_sources(layers, field_name)
+        self.layer_counts = {}
+
+    def run(self) -> bool:
+        """ Counts the values of all layers """
+        self.layer_counts = scan_sources(self.jobs, canceled=self.isCanceled)
+        return not self.isCanceled()
+
+
+def combine_layer_values(layer_counts: {str: Counter}, operation: str = UNION) -> {str: {str: int}}:
+    """ Merges the value counts of several layers with a set ``operation´´.
+
+    For the union all values are kept, for the intersection values
+    contained in every layer and for the difference values contained in
+    the first layer only.
+
+    @param layer_counts: Dictionary of layer ids and value counts, as
+        counted by MultiLayerValuesTask, in the order of the layers
+    @param operation: One of UNION, INTERSECTION or DIFFERENCE
+
+    @return: Dictionary of the values and the counts of the value per layer id
+    """
+    if not layer_counts:
+        return {}
+    value_sets = [set(counts) for counts in layer_counts.values()]
+    if operation == INTERSECTION:
+        values = set.intersection(*value_sets)
+    elif operation == DIFFERENCE:
+        values = value_sets[0].difference(*value_sets[1:])
+    else:
+        values = set.union(*value_sets)
+
+    result = {value: {} for value in values}
+    for layer_id, counts in layer_counts.items():
+        for value, count in counts.items():
+            if value in result:
+                result[value][layer_id] = count
+    return result
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from decimal import Decimal
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+# Number of bins of the internal histogram used for approximate quantiles
+FINE_BINS = 4096
+
+CHUNK_SIZE = 65536
+
+
+class NumericSummary:
+    """ Summary of the values of a numeric field: count, number of NULL
+    values, minimum, maximum, quantiles and a binned histogram.
+    """
+
+    def __init__(self, count: int, null_count: int, minimum, maximum,
+                 quantiles: dict, bins: list, exact: bool):
+        """ Constructor.
+
+        @param bins: List of tuples (lower edge, upper edge, count)
+        @param exact: False if the quantiles are interpolated from the histogram
+        """
+        self.count = count
+        self.null_count = null_count
+        self.minimum = minimum
+        self.maximum = maximum
+        self.quantiles = quantiles
+        self.bins = bins
+        self.exact = exact
+
+    def describe(self) -> str:
+        """ Returns the summary as multiline text """
+        lines = [f"Count: {self.count}",
+                 f"NULL: {self.null_count}",
+                 f"Minimum: {self.minimum}",
+                 f"Maximum: {self.maximum}"]
+        approx = '' if self.exact else '≈ '
+        for q, value in self.quantiles.items():
+            lines.append(f"Q{int(q * 100)}: {approx}{value:.6g}")
+        return '\n'.join(lines)
+
+
+def _chunks(values, size: int = CHUNK_SIZE):
+    """ Yields lists of ``size´´ values """
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _bin_edges(minimum: float, maximum: float, bins: int) -> list:
+    """ Returns the ``bins´´ + 1 edges of equal width bins """
+    if maximum <= minimum:
+        return [minimum, maximum]
+    width = (maximum - minimum) / bins
+    return [minimum + i * width for i in range(bins)] + [maximum]
+
+
+def _count_bins(values, minimum: float, scale: float, counts) -> None:
+    """ Adds ``values´´ to the histogram ``counts´´ with bins of width
+    1 / ``scale´´ starting at ``minimum´´, values outside are clipped """
+    last = len(counts) - 1
+    if np is not None:
+        idx = np.clip(((values - minimum) * scale).astype(np.int64), 0, last)
+        counts += np.bincount(idx, minlength=len(counts))
+    else:
+        for value in values:
+            i = int((value - minimum) * scale)
+            counts[min(max(i, 0), last)] += 1
+
+
+def _fine_quantile(fine_counts, count: int, q: float, minimum: float, width: float) -> float:
+    """ Interpolates the quantile ``q´´ from the internal histogram """
+    target = q * count
+    cumulative = 0
+    for i, c in enumerate(fine_counts):
+        if c and cumulative + c >= target:
+            return minimum + (i + (target - cumulative) / c) * width
+        cumulative += c
+    return minimum + len(fine_counts) * width
+
+
+def numeric_summary(values, bins: int = 20, minimum=None, maximum=None,
+                    quantiles=QUANTILES) -> NumericSummary:
+    """ Computes a NumericSummary of ``values´´ in a single pass.
+
+    If ``minimum´´ and ``maximum´´ are known, e.g. from the data provider,
+    the values are streamed in chunks into a fine histogram with
+    FINE_BINS bins (vectorized with numpy if available), from which the
+    displayed histogram and approximate quantiles are derived. Memory does
+    not depend on the number of values then. Otherwise the values are
+    collected and exact quantiles are computed.
+
+    @param values: Iterable of numbers, None for NULL values
+    @param bins: Number of bins of the histogram
+    @param minimum: Minimum of the values if known in advance
+    @param maximum: Maximum of the values if known in advance
+    @param quantiles: Quantiles to compute, between 0 and 1
+    """
+    null_count = 0
+
+    if minimum is None or maximum is None:
+        collected = []
+        for value in values:
+            if value is None:
+                null_count += 1
+            else:
+                collected.append(value)
+        if not collected:
+            return NumericSummary(0, null_count, None, None, {}, [], True)
+        minimum, maximum = min(collected), max(collected)
+        if np is not None:
+            arr = np.asarray(collected, dtype=np.float64)
+            q_values = np.quantile(arr, quantiles)
+            counts, _ = np.histogram(arr, bins=bins, range=(minimum, maximum))
+            counts = counts.tolist()
+        else:
+            collected.sort()
+            n = len(collected)
+            q_values = [collected[min(int(q * (n - 1) + 0.5), n - 1)] for q in quantiles]
+            counts = [0] * bins
+            width = (maximum - minimum) / bins or 1
+            for value in collected:
+                counts[min(int((value - minimum) / width), bins - 1)] += 1
+        edges = _bin_edges(minimum, maximum, bins)
+        if len(edges) == 2:
+            counts = [len(collected)]
+        bins_list = [(edges[i], edges[i + 1], int(c)) for i, c in enumerate(counts)]
+        return NumericSummary(len(collected), null_count, minimum, maximum,
+                              dict(zip(quantiles, map(float, q_values))), bins_list, True)
+
+    # Streaming pass with known range, the displayed bins are counted
+    # directly, so their counts are exact, the fine bins for the quantiles
+    width = (maximum - minimum) / FINE_BINS or 1
+    if maximum > minimum:
+        bin_scale = bins / (maximum - minimum)
+    else:
+        bins, bin_scale = 1, 0
+    if np is not None:
+        fine_counts = np.zeros(FINE_BINS, dtype=np.int64)
+        counts = np.zeros(bins, dtype=np.int64)
+    else:
+        fine_counts = [0] * FINE_BINS
+        counts = [0] * bins
+    count = 0
+    for chunk in _chunks(values):
+        non_null = [value for value in chunk if value is not None]
+        null_count += len(chunk) - len(non_null)
+        count += len(non_null)
+        if np is not None:
+            non_null = np.asarray(non_null, dtype=np.float64)
+        _count_bins(non_null, minimum, 1 / width, fine_counts)
+        _count_bins(non_null, minimum, bin_scale, counts)
+    if count == 0:
+        return NumericSummary(0, null_count, None, None, {}, [], False)
+
+    fine_counts = list(map(int, fine_counts))
+    edges = _bin_edges(minimum, maximum, bins)
+    bins_list = [(edges[i], edges[i + 1], int(c)) for i, c in enumerate(counts)]
+    q_values = {q: min(max(_fine_quantile(fine_counts, count, q, minimum, width), minimum), maximum)
+                for q in quantiles}
+    return NumericSummary(count, null_count, minimum, maximum, q_values, bins_list, False)
+
+
+def format_number(value: float) -> str:
+    """ Returns ``value´´ as string in positional notation, which can be
+    used in QGIS expressions, e.g. '0.00001' instead of '1e-05' """
+    text = repr(value)
+    if 'e' in text or 'E' in text:
+        text = format(Decimal(text), 'f')
+    return text
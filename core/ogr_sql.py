@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from collections import Counter
+
+from qgis.core import QgsProviderRegistry
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+# Drivers for which GROUP BY queries are run directly on the data source
+SUPPORTED_DRIVERS = {'GPKG', 'ESRI Shapefile', 'FlatGeobuf'}
+# Maximum number of feature ids passed in the WHERE clause of a query
+MAX_FIDS = 50000
+
+
+def ogr_layer_source(layer) -> (str, str, str):
+    """ Returns the path, layer name and subset string of a layer of the
+    ogr provider, or None if the layer has another provider.
+
+    @param layer: The vector layer
+    @type layer: QgsVectorLayer
+    """
+    if layer.dataProvider().name() != 'ogr':
+        return None
+    parts = QgsProviderRegistry.instance().decodeUri('ogr', layer.source())
+    path = parts.get('path')
+    if not path or (parts.get('layerId') is not None and not parts.get('layerName')):
+        return None
+    return path, parts.get('layerName') or None, layer.subsetString()
+
+
+def open_layer(path: str, layer_name: str = None, drivers=SUPPORTED_DRIVERS):
+    """ Opens the data source at ``path´´ read-only and returns it with
+    the name of the layer, or None if GDAL is not available, the data
+    source cannot be opened or its driver is not in ``drivers´´. Any
+    driver is accepted if ``drivers´´ is None. """
+    if gdal is None:
+        return None
+    try:
+        dataset = gdal.OpenEx(path, gdal.OF_VECTOR | gdal.OF_READONLY)
+    except RuntimeError:
+        return None
+    if dataset is None or (drivers is not None and dataset.GetDriver().ShortName not in drivers):
+        return None
+    if layer_name is None:
+        if dataset.GetLayerCount() != 1:
+            return None
+        layer_name = dataset.GetLayer(0).GetName()
+    elif dataset.GetLayerByName(layer_name) is None:
+        return None
+    return dataset, layer_name
+
+
+def quoted(name: str) -> str:
+    """ Returns ``name´´ as quoted SQL identifier """
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def group_by(path: str, layer_name: str, field_name: str, aggregates: list, subset: str = '',
+             fids=None, limit: int = None) -> list:
+    """ Runs a GROUP BY query by ``field_name´´ with the SQL ``aggregates´´
+    directly on the data source and returns the rows as lists of the value
+    and the aggregates, the groups with the most features first if
+    ``limit´´ is given. NULL values are returned as None.
+
+    Returns None if the query cannot be run, e.g. for unsupported drivers,
+    a subset string that is a complete SQL statement, a subset string that
+    is not valid SQL for the data source or more than MAX_FIDS feature ids.
+    The caller then falls back to the feature iterator.
+
+    @param path: Path of the data source
+    @param layer_name: Name of the layer, None for single layer data sources
+    @param field_name: Name of the field
+    @param aggregates: SQL expressions of the aggregates, e.g. COUNT(*)
+    @param subset: Subset string of the QGIS layer, used as WHERE clause
+    @param fids: Ids of the features, e.g. the selected features
+    @param limit: Maximum number of groups
+    """
+    if subset and subset.lstrip().upper().startswith('SELECT'):
+        return None
+    if fids is not None and len(fids) > MAX_FIDS:
+        return None
+    opened = open_layer(path, layer_name)
+    if opened is None:
+        return None
+    dataset, layer_name = opened
+
+    column = quoted(field_name)
+    gpkg = dataset.GetDriver().ShortName == 'GPKG'
+    conditions = [f"({subset})"] if subset else []
+    if fids is not None:
+        # the SQLite dialect exposes the OGR feature ids as rowid
+        fid_column = dataset.GetLayerByName(layer_name).GetFIDColumn() if gpkg else ''
+        fid_column = quoted(fid_column) if fid_column else 'rowid'
+        conditions.append(f"{fid_column} IN ({','.join(str(int(fid)) for fid in fids)})")
+
+    sql = f"SELECT {', '.join([column] + aggregates)} FROM {quoted(layer_name)}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" GROUP BY {column}"
+    if limit:
+        sql += f" ORDER BY COUNT(*) DESC LIMIT {int(limit)}"
+    # GeoPackage runs the query in SQLite itself, the others need the dialect
+    dialect = None if gpkg else 'SQLITE'
+
+    try:
+        result = dataset.ExecuteSQL(sql, dialect=dialect)
+    except RuntimeError:
+        return None
+    if result is None:
+        return None
+    try:
+        return [[feat.GetField(i) for i in range(len(aggregates) + 1)] for feat in result]
+    finally:
+        dataset.ReleaseResultSet(result)
+
+
+def grouped_value_counts(path: str, layer_name: str, field_name: str, subset: str = '',
+                         fids=None, limit: int = None) -> Counter:
+    """ Returns the number of features per value of ``field_name´´ by a
+    GROUP BY query run directly on the data source, the most frequent
+    values first if ``limit´´ is given, or None if the query cannot be run.
+    The parameters are the ones of group_by.
+    """
+    rows = group_by(path, layer_name, field_name, ['COUNT(*)'], subset, fids, limit)
+    return None if rows is None else Counter({value: count for value, count in rows})
+
+
+def grouped_aggregates(path: str, layer_name: str, field_name: str, other_field: str,
+                       subset: str = '', fids=None) -> dict:
+    """ Returns the aggregates of ``other_field´´ per value of ``field_name´´
+    by a GROUP BY query run directly on the data source, or None if the
+    query cannot be run. The aggregates are tuples of the number of
+    features and the sum, minimum, maximum, number of distinct values and
+    number of values of ``other_field´´, NULL values are ignored.
+    """
+    other = quoted(other_field)
+    rows = group_by(path, layer_name, field_name,
+                    ['COUNT(*)', f'SUM({other})', f'MIN({other})', f'MAX({other})',
+                     f'COUNT(DISTINCT {other})', f'COUNT({other})'], subset, fids)
+    return None if rows is None else {row[0]: tuple(row[1:]) for row in rows}
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import os
+from collections import Counter
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pc = pq = None
+
+PARQUET_EXTENSIONS = {'.parquet', '.geoparquet'}
+
+
+def is_parquet(path: str) -> bool:
+    """ Returns True if ``path´´ is a (Geo)Parquet file that can be read
+    with pyarrow """
+    return pq is not None and os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS
+
+
+def _open(path: str, column: str, dictionary: bool = False):
+    """ Returns the ParquetFile at ``path´´, or None if it cannot be read
+    or has no ``column´´.
+
+    @param dictionary: True to read ``column´´ as dictionary array
+    """
+    try:
+        parquet_file = pq.ParquetFile(path, read_dictionary=[column] if dictionary else None)
+    except (OSError, ValueError):
+        return None
+    if column not in parquet_file.schema_arrow.names:
+        return None
+    return parquet_file
+
+
+def _count_chunks(chunked_array, counts: Counter) -> None:
+    """ Adds the values of ``chunked_array´´ to ``counts´´. For dictionary
+    arrays the indices are counted, so each distinct value is converted to
+    a Python object only once per chunk. """
+    for chunk in chunked_array.chunks:
+        if chunk.null_count:
+            counts[None] += chunk.null_count
+        if hasattr(chunk, 'dictionary'):
+            dictionary = chunk.dictionary.to_pylist()
+            result = pc.value_counts(chunk.indices.drop_null())
+            values = [dictionary[index] for index in result.field('values').to_pylist()]
+        else:
+            result = pc.value_counts(chunk.drop_null())
+            values = result.field('values').to_pylist()
+        counts.update(dict(zip(values, result.field('counts').to_pylist())))
+
+
+def parquet_value_counts(path: str, column: str) -> Counter:
+    """ Returns the number of rows per value of ``column´´ of the Parquet
+    file at ``path´´, or None if it cannot be read. NULL values are
+    returned as None.
+
+    The column is read as dictionary array: for dictionary-encoded column
+    chunks the distinct values come from the dictionary pages and only the
+    integer indices of the rows are counted, without decoding every value.
+    """
+    parquet_file = _open(path, column, dictionary=True)
+    if parquet_file is None:
+        return None
+    counts = Counter()
+    for i in range(parquet_file.num_row_groups):
+        _count_chunks(parquet_file.read_row_group(i, columns=[column]).column(0), counts)
+    return counts
+
+
+def row_groups_in_range(metadata, column: str, lower, upper) -> list:
+    """ Returns the indices of the row groups whose minimum and maximum
+    statistics of ``column´´ overlap the range from ``lower´´ to ``upper´´.
+    Row groups without statistics are always returned.
+
+    @param metadata: Metadata of the Parquet file
+    @type metadata: pyarrow.parquet.FileMetaData
+    """
+    groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        chunks = [row_group.column(j) for j in range(row_group.num_columns)]
+        statistics = next((chunk.statistics for chunk in chunks if chunk.path_in_schema == column), None)
+        if statistics is None or not statistics.has_min_max:
+            groups.append(i)
+        elif statistics.max >= lower and statistics.min <= upper:
+            groups.append(i)
+    return groups
+
+
+def parquet_range_counts(path: str, column: str, lower, upper,
+                         include_upper: bool = False) -> Counter:
+    """ Returns the number of rows per value of ``column´´ of the Parquet
+    file at ``path´´ within the range from ``lower´´ to ``upper´´, or None
+    if it cannot be read. Row groups whose statistics lie outside the range
+    are skipped without reading them.
+
+    @param include_upper: True if ``upper´´ belongs to the range
+    """
+    parquet_file = _open(path, column)
+    if parquet_file is None:
+        return None
+    counts = Counter()
+    less = pc.less_equal if include_upper else pc.less
+    for i in row_groups_in_range(parquet_file.metadata, column, lower, upper):
+        values = parquet_file.read_row_group(i, columns=[column]).column(0)
+        mask = pc.and_(pc.greater_equal(values, lower), less(values, upper))
+        _count_chunks(pc.filter(values, mask), counts)
+    return counts
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from qgis.core import QgsMapLayerProxyModel, QgsStatisticalSummary, QgsTask
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import laspy
+except ImportError:
+    laspy = None
+
+POINT_CLOUD_EXTENSIONS = {'.las', '.laz'}
+# Number of points read at once
+CHUNK_SIZE = 1000000
+# Number of threads deduplicating chunks while the next ones are read
+WORKERS = 4
+# The dimensions X, Y and Z of laspy are the raw integers, QGIS shows the
+# coordinates scaled and offset like laspy's x, y and z
+SCALED_DIMENSIONS = {'X': 'x', 'Y': 'y', 'Z': 'z'}
+# Attributes of QGIS whose laspy dimension is not named like the attribute
+DIMENSION_NAMES = {'Infrared': 'nir'}
+
+
+def point_clouds_supported() -> bool:
+    """ True if QGIS supports point cloud layers, i.e. QGIS >= 3.18 """
+    return hasattr(QgsMapLayerProxyModel, 'PointCloudLayer')
+
+
+def metadata_value_counts(layer, attribute: str) -> Counter:
+    """ Returns the number of points per value of ``attribute´´ from the
+    precomputed statistics of the layer or the metadata of its provider,
+    e.g. the classes of the Classification attribute of EPT and COPC
+    layers. Returns None if neither knows the values of the attribute.
+
+    @param layer: The point cloud layer
+    @type layer: QgsPointCloudLayer
+    """
+    # statistics computed by QGIS or stored in the file, QGIS >= 3.26
+    try:
+        class_count = layer.statistics().statisticsOf(attribute).classCount
+    except AttributeError:
+        class_count = None
+    if class_count:
+        return Counter(dict(class_count))
+
+    provider = layer.dataProvider()
+    try:
+        classes = provider.metadataClasses(attribute)
+    except AttributeError:
+        return None
+    if not classes:
+        return None
+    return Counter({value: int(provider.metadataClassStatistic(attribute, value, QgsStatisticalSummary.Count) or 0)
+                    for value in classes})
+
+
+def point_cloud_file(layer) -> str:
+    """ Returns the path of the local LAS, LAZ or COPC file of a point cloud
+    layer, or None if it is not a local file or laspy or numpy are not
+    installed """
+    if laspy is None or np is None:
+        return None
+    path = layer.source()
+    if os.path.splitext(path)[1].lower() not in POINT_CLOUD_EXTENSIONS or not os.path.isfile(path):
+        return None
+    return path
+
+
+def dimension_name(attribute: str) -> str:
+    """ Returns the name of the laspy dimension of the QGIS ``attribute´´,
+    e.g. point_source_id for PointSourceId. Extra dimensions keep their
+    name. """
+    if attribute in DIMENSION_NAMES:
+        return DIMENSION_NAMES[attribute]
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', attribute).lower()
+
+
+def _unique_counts(values) -> Counter:
+    """ Counts the values of a numpy array, numpy releases the GIL while
+    sorting, so chunks are counted in parallel """
+    unique, counts = np.unique(values, return_counts=True)
+    return Counter(dict(zip(unique.tolist(), counts.tolist())))
+
+
+class PointCloudValuesTask(QgsTask):
+    """ Background task counting the values of one dimension of a local
+    LAS, LAZ or COPC file. The points are read in chunks of CHUNK_SIZE
+    points and only the dimension is kept, each chunk is deduplicated by
+    one of WORKERS threads while the next chunk is read. At most 2 * WORKERS
+    chunks are in memory. """
+
+    def __init__(self, path: str, attribute: str):
+        """ Constructor.
+
+        @param path: Path of the file
+        @param attribute: Name of the attribute in QGIS
+        """
+        super().__init__('Count point cloud values', QgsTask.CanCancel)
+        self.path = path
+        self.attribute = attribute
+        self.counts = Counter()
+        self.error = None
+
+    def run(self) -> bool:
+        """ Reads the dimension chunk by chunk and counts its values """
+        try:
+            with laspy.open(self.path) as reader:
+                names = set(reader.header.point_format.dimension_names)
+                dimension = self.attribute if self.attribute in names else dimension_name(self.attribute)
+                if dimension not in names:
+                    self.error = f"Dimension {self.attribute} not found"
+                    return False
+                total = max(reader.header.point_count, 1)
+                pending = []
+                read = 0
+                with ThreadPoolExecutor(WORKERS) as executor:
+                    for points in reader.chunk_iterator(CHUNK_SIZE):
+                        if self.isCanceled():
+                            return False
+                        # copy, so the chunk of all dimensions can be freed
+                        if dimension in SCALED_DIMENSIONS:
+                            values = np.array(getattr(points, SCALED_DIMENSIONS[dimension]))
+                        else:
+                            values = np.array(points[dimension])
+                        pending.append(executor.submit(_unique_counts, values))
+                        if len(pending) >= 2 * WORKERS:
+                            self.counts.update(pending.pop(0).result())
+                        read += len(values)
+                        self.setProgress(100 * read / total)
+                    for future in pending:
+                        self.counts.update(future.result())
+        except (OSError, ValueError, laspy.LaspyException) as e:
+            self.error = str(e)
+            return False
+        return True
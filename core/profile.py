@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from collections import Counter
+
+from qgis.core import QgsFeatureRequest, QgsTask
+
+from unique_values_viewer.core.sketches import HyperLogLog, SpaceSaving
+from unique_values_viewer.core.utils import is_null, value_to_str
+
+
+class FieldProfile:
+    """ Cardinality profile of a field: number of values, NULL values,
+    distinct values, most frequent values, minimum and maximum.
+
+    The distinct values are counted exactly until EXACT_LIMIT distinct
+    values are exceeded, then they are estimated with a HyperLogLog sketch
+    and the most frequent values are tracked by Space-Saving counters, so
+    the memory of a field is bounded.
+    """
+
+    EXACT_LIMIT = 100000
+    TOP_CAPACITY = 1000
+
+    def __init__(self, name: str, top_k: int = 5):
+        """ Constructor.
+
+        @param name: Name of the field
+        @param top_k: Number of most frequent values
+        """
+        self.name = name
+        self.top_k = top_k
+        self.count = 0
+        self.null_count = 0
+        self.minimum = None
+        self.maximum = None
+        self._comparable = True
+        self._counts = Counter()
+        self._hll = None
+        self._top = None
+
+    @property
+    def exact(self) -> bool:
+        """ True if the distinct values were counted exactly """
+        return self._hll is None
+
+    @property
+    def distinct_count(self) -> int:
+        """ The (estimated) number of distinct values without NULL """
+        if self._hll is None:
+            return len(self._counts) - (1 if 'NULL' in self._counts else 0)
+        return len(self._hll)
+
+    @property
+    def values(self) -> set:
+        """ The distinct values as strings, including 'NULL', if they were
+        counted exactly, otherwise None """
+        return set(self._counts) if self._hll is None else None
+
+    def add(self, value) -> None:
+        """ Adds an attribute value of a feature """
+        self.count += 1
+        if is_null(value):
+            self.null_count += 1
+        elif self._comparable:
+            try:
+                if self.minimum is None or value < self.minimum:
+                    self.minimum = value
+                if self.maximum is None or value > self.maximum:
+                    self.maximum = value
+            except TypeError:
+                self._comparable = False
+                self.minimum = self.maximum = None
+
+        text = value_to_str(value)
+        if self._hll is None:
+            self._counts[text] += 1
+            if len(self._counts) > self.EXACT_LIMIT:
+                self._switch_to_sketches()
+        else:
+            self._hll.add(text)
+            self._top.add(text)
+
+    def _switch_to_sketches(self) -> None:
+        """ Replaces the exact counts by a HyperLogLog and Space-Saving counters """
+        self._hll = HyperLogLog()
+        self._top = SpaceSaving(self.TOP_CAPACITY)
+        for text, count in self._counts.most_common():
+            self._hll.add(text)
+            self._top.add(text, count)
+        self._counts = Counter()
+
+    def top(self) -> list:
+        """ Returns the most frequent values as tuples of value and count """
+        if self._hll is None:
+            return self._counts.most_common(self.top_k)
+        return [(value, count) for value, count, _ in self._top.top(self.top_k)]
+
+
+class LayerProfileTask(QgsTask):
+    """ Background task profiling all fields of a layer in a single scan
+    of the features without geometry. """
+
+    def __init__(self, source, fields, feature_count: int, request: QgsFeatureRequest = None):
+        """ Constructor.
+
+        @param source: Feature source of the layer, created in the main thread
+        @type source: QgsVectorLayerFeatureSource
+        @param fields: The fields of the layer
+        @type fields: QgsFields
+        @param feature_count: Number of features, used for the progress
+        @param request: Request for the features, by default all features
+        """
+        super().__init__('Profile layer', QgsTask.CanCancel)
+        self.source = source
+        self.profiles = [FieldProfile(field.name()) for field in fields]
+        self.feature_count = feature_count
+        self.request = request or QgsFeatureRequest()
+        self.request.setFlags(QgsFeatureRequest.NoGeometry)
+
+    def run(self) -> bool:
+        """ Adds the attributes of all features to the field profiles """
+        adders = [profile.add for profile in self.profiles]
+        step = max(self.feature_count // 100, 1)
+        for n, feat in enumerate(self.source.getFeatures(self.request), 1):
+            for add, value in zip(adders, feat.attributes()):
+                add(value)
+            if n % step == 0:
+                if self.isCanceled():
+                    return False
+                self.setProgress(min(100 * n / max(self.feature_count, 1), 100))
+        return True
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import json
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from qgis.PyQt.QtCore import QUrl, QUrlQuery, pyqtSignal
+from qgis.PyQt.QtNetwork import QNetworkRequest
+from qgis.core import QgsDataSourceUri, QgsTask
+
+from unique_values_viewer.core.delimited import text_converter
+
+REMOTE_PROVIDERS = {'WFS', 'OAPIF'}
+# Number of values requested per page
+PAGE_SIZE = 5000
+# Maximum number of concurrent requests to a server
+MAX_CONNECTIONS = 4
+# Maximum size of the cached responses in bytes
+MAX_CACHE_SIZE = 32 * 1024 * 1024
+
+XSI_NIL = '{http://www.w3.org/2001/XMLSchema-instance}nil'
+
+
+class RemoteError(Exception):
+    """ Raised if a request fails or the response cannot be parsed """
+
+
+class ResponseCache:
+    """ Responses by URL with their ETag, sent as If-None-Match to get an
+    empty '304 Not Modified' response if the values did not change. The
+    least recently used responses are evicted when the responses exceed
+    ``max_size´´ bytes. Thread-safe, as pages are fetched concurrently. """
+
+    def __init__(self, max_size: int = MAX_CACHE_SIZE):
+        """ Constructor.
+
+        @param max_size: Maximum size of the cached responses in bytes
+        """
+        self.max_size = max_size
+        self.size = 0
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._responses)
+
+    def clear(self) -> None:
+        """ Removes all responses """
+        with self._lock:
+            self._responses.clear()
+            self.size = 0
+
+    def get(self, url: str) -> (bytes, bytes):
+        """ Returns the ETag and the content of the response of ``url´´,
+        or None if it is not cached """
+        with self._lock:
+            cached = self._responses.get(url)
+            if cached is not None:
+                self._responses.move_to_end(url)
+            return cached
+
+    def put(self, url: str, etag: bytes, content: bytes) -> None:
+        """ Caches the response of ``url´´, responses larger than the
+        cache are not cached """
+        with self._lock:
+            old = self._responses.pop(url, None)
+            if old is not None:
+                self.size -= len(old[1])
+            if len(content) > self.max_size:
+                return
+            self._responses[url] = (etag, content)
+            self.size += len(content)
+            while self.size > self.max_size:
+                _, (_, evicted) = self._responses.popitem(last=False)
+                self.size -= len(evicted)
+
+
+ETAG_CACHE = ResponseCache()
+
+
+def fetch(url: str, authcfg: str = '') -> bytes:
+    """ Returns the content of ``url´´, revalidated with the ETag of a
+    cached response. Raises a RemoteError if the request fails.
+
+    @param url: URL of the request
+    @param authcfg: Id of the authentication configuration of the layer
+    """
+    try:
+        from qgis.core import QgsBlockingNetworkRequest
+    except ImportError:
+        # QGIS < 3.6, the values are calculated from the features instead
+        raise RemoteError('QgsBlockingNetworkRequest requires QGIS 3.6')
+    cached = ETAG_CACHE.get(url)
+    request = QNetworkRequest(QUrl(url))
+    if cached is not None:
+        request.setRawHeader(b'If-None-Match', cached[0])
+    blocking = QgsBlockingNetworkRequest()
+    if authcfg:
+        blocking.setAuthCfg(authcfg)
+    if blocking.get(request) != QgsBlockingNetworkRequest.NoError:
+        raise RemoteError(blocking.errorMessage())
+    reply = blocking.reply()
+    if reply.attribute(QNetworkRequest.HttpStatusCodeAttribute) == 304 and cached is not None:
+        return cached[1]
+    content = bytes(reply.content())
+    etag = reply.rawHeader(b'ETag')
+    if etag:
+        ETAG_CACHE.put(url, bytes(etag), content)
+    return content
+
+
+def _with_query(url: str, **items) -> str:
+    """ Returns ``url´´ with the query ``items´´ added or replaced """
+    url = QUrl(url)
+    query = QUrlQuery(url)
+    for key, value in items.items():
+        query.removeAllQueryItems(key)
+        query.addQueryItem(key, str(value))
+    url.setQuery(query)
+    return url.toString()
+
+
+class RemoteSource:
+    """ Pages of the values of one field of a WFS 2.0 or OGC API Features
+    layer, requested without the geometries and the other fields. """
+
+    def __init__(self, uri: str, provider: str):
+        """ Constructor.
+
+        @param uri: Source of the layer
+        @param provider: Name of the provider, WFS or OAPIF
+        """
+        uri = QgsDataSourceUri(uri)
+        self.url = uri.param('url')
+        self.typename = uri.param('typename')
+        self.version = uri.param('version') or 'auto'
+        self.authcfg = uri.authConfigId()
+        self.provider = provider
+
+    @property
+    def supported(self) -> bool:
+        """ True for OGC API Features and WFS layers that are not limited
+        to versions without GetPropertyValue """
+        if not self.url or not self.typename:
+            return False
+        return self.provider == 'OAPIF' or self.version in ('auto', '2.0.0')
+
+    def page_url(self, field_name: str, start: int, count: int = PAGE_SIZE) -> str:
+        """ Returns the URL of the page of ``count´´ values starting at ``start´´ """
+        if self.provider == 'OAPIF':
+            return _with_query(f"{self.url.rstrip('/')}/collections/{self.typename}/items",
+                               f='json', limit=count, offset=start,
+                               properties=field_name, skipGeometry='true')
+        return _with_query(self.url, SERVICE='WFS', VERSION='2.0.0', REQUEST='GetPropertyValue',
+                           TYPENAMES=self.typename, VALUEREFERENCE=field_name,
+                           COUNT=count, STARTINDEX=start)
+
+    def parse(self, content: bytes, field_name: str) -> (list, int, str):
+        """ Returns the values of a page as strings or None, the total
+        number of values if the server reports it and the URL of the next
+        page, if any.
+
+        Raises a RemoteError for exception reports and invalid responses.
+        """
+        if self.provider == 'OAPIF':
+            try:
+                page = json.loads(content)
+                features = page['features']
+            except (ValueError, KeyError, TypeError) as e:
+                raise RemoteError(f"Invalid response: {e}")
+            values = [feature.get('properties', {}).get(field_name) for feature in features]
+            next_url = next((link.get('href') for link in page.get('links', [])
+                             if link.get('rel') == 'next'), None)
+            matched = page.get('numberMatched')
+            return values, matched if isinstance(matched, int) else None, next_url
+
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError as e:
+            raise RemoteError(f"Invalid response: {e}")
+        if root.tag.rsplit('}', 1)[-1] != 'ValueCollection':
+            text = ' '.join(' '.join(root.itertext()).split())
+            raise RemoteError(text or 'GetPropertyValue is not supported')
+        values = []
+        for member in root:
+            if member.tag.rsplit('}', 1)[-1] != 'member':
+                continue
+            nil = member.get(XSI_NIL) == 'true' or any(child.get(XSI_NIL) == 'true' for child in member)
+            values.append(None if nil else ''.join(member.itertext()).strip())
+        matched = root.get('numberMatched', '')
+        return values, int(matched) if matched.isdigit() else None, root.get('next')
+
+
+class RemoteValuesTask(QgsTask):
+    """ Background task fetching the unique values of a field of a WFS or
+    OGC API Features layer page by page. If the server reports the number
+    of values, the remaining pages are fetched concurrently by offset with
+    at most MAX_CONNECTIONS requests, otherwise the next links are followed.
+    New values are emitted with pageFetched as soon as a page arrives. """
+
+    pageFetched = pyqtSignal(list)
+
+    def __init__(self, source: RemoteSource, field_name: str, field_type):
+        """ Constructor.
+
+        @param source: The source of the layer
+        @param field_name: Name of the field
+        @param field_type: Type of the field, STRING, INTEGER or DECIMAL
+        @type field_type: FieldTypes
+        """
+        super().__init__('Fetch values', QgsTask.CanCancel)
+        self.source = source
+        self.field_name = field_name
+        self.convert = text_converter(field_type)
+        self.values = set()
+        self.error = None
+
+    def _get_page(self, url: str) -> (list, int, str):
+        """ Fetches and parses the page at ``url´´, nothing once canceled """
+        if self.isCanceled():
+            return [], None, None
+        return self.source.parse(fetch(url, self.source.authcfg), self.field_name)
+
+    def _add(self, values) -> None:
+        """ Adds the values of a page and emits the new ones """
+        new = []
+        for value in values:
+            # JSON numbers of integer fields may be encoded as 1.0
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            text = None if value is None else self.convert(str(value))
+            value = 'NULL' if text is None else text
+            if value not in self.values:
+                self.values.add(value)
+                new.append(value)
+        if new:
+            self.pageFetched.emit(new)
+
+    def run(self) -> bool:
+        """ Fetches the pages of values """
+        try:
+            values, matched, next_url = self._get_page(self.source.page_url(self.field_name, 0))
+            self._add(values)
+            # the server may return less values than requested per page
+            offsets = range(len(values), matched or 0, len(values)) if values else ()
+            if offsets and (next_url is None or 'offset=' in next_url.lower()
+                            or 'startindex=' in next_url.lower()):
+                urls = [self.source.page_url(self.field_name, offset, len(values)) for offset in offsets]
+                with ThreadPoolExecutor(MAX_CONNECTIONS) as executor:
+                    for n, (values, _, _) in enumerate(executor.map(self._get_page, urls), 1):
+                        if self.isCanceled():
+                            return False
+                        self._add(values)
+                        self.setProgress(100 * n / len(urls))
+            else:
+                while next_url and values:
+                    if self.isCanceled():
+                        return False
+                    values, _, next_url = self._get_page(next_url)
+                    self._add(values)
+        except RemoteError as e:
+            self.error = str(e)
+            return False
+        return True
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+# Largest code point, used as upper bound for prefix searches
+_MAX_CHAR = '\U0010ffff'
+
+_COMPARISON = re.compile(r'^\s*(>=|<=|>|<|=)\s*(.+?)\s*$')
+_RANGE = re.compile(r'^\s*(.*?)\s*\.\.\s*(.*?)\s*$')
+
+
+class SortedValueIndex:
+    """ The unique values of a field sorted by their typed value, e.g. as
+    numbers for numeric fields, so that ranges, comparisons, prefixes and
+    exact values are found by binary search in O(log n + k).
+    """
+
+    def __init__(self, values, key=None):
+        """ Constructor.
+
+        @param values: The unique values as strings
+        @param key: Function converting a value to its typed value, e.g.
+            float. Values that cannot be converted are not indexed.
+        """
+        self.key = key or str
+        pairs = []
+        for value in values:
+            try:
+                pairs.append((self.key(value), value))
+            except (TypeError, ValueError):
+                continue
+        pairs.sort()
+        self.keys = [k for k, _ in pairs]
+        self.values = [v for _, v in pairs]
+
+    def __len__(self):
+        return len(self.values)
+
+    def between(self, lower=None, upper=None, lower_inclusive=True, upper_inclusive=True) -> list:
+        """ Returns the values between ``lower´´ and ``upper´´, None for
+        an open bound. The bounds are converted with the key function. """
+        if lower is None:
+            start = 0
+        elif lower_inclusive:
+            start = bisect_left(self.keys, self.key(lower))
+        else:
+            start = bisect_right(self.keys, self.key(lower))
+        if upper is None:
+            end = len(self.keys)
+        elif upper_inclusive:
+            end = bisect_right(self.keys, self.key(upper))
+        else:
+            end = bisect_left(self.keys, self.key(upper))
+        return self.values[start:end]
+
+    def prefixed(self, prefix: str) -> list:
+        """ Returns the values starting with ``prefix´´ """
+        if self.key is not str:
+            return [value for value in self.values if value.startswith(prefix)]
+        return self.between(prefix, prefix + _MAX_CHAR)
+
+    def matching(self, pattern) -> list:
+        """ Returns the values matching the compiled regular expression ``pattern´´ """
+        return [value for value in self.values if pattern.search(value)]
+
+
+def normalize(text: str) -> str:
+    """ Returns ``text´´ case-folded and without accents, e.g. 'Müller'
+    and 'MULLER' are both normalized to 'muller' """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def trigrams(text: str) -> set:
+    """ Returns the trigrams of a normalized ``text´´, padded with spaces
+    so that the beginning and the end of the text have more weight """
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """ Index of normalized values for a case-, accent- and typo-tolerant
+    search.
+
+    The values are normalized once when the index is created. A search
+    returns the values containing the normalized search text, values
+    starting with it first. If there are only a few of them, values with
+    similar trigrams are appended, ranked by their similarity, to find
+    values with typos. The trigram postings are created on first use.
+    """
+
+    # Minimum Jaccard similarity of the trigrams of a fuzzy match
+    MIN_SIMILARITY = 0.3
+    # Fuzzy matches are only searched if there are less substring matches
+    FUZZY_THRESHOLD = 50
+
+    def __init__(self, values):
+        """ Constructor.
+
+        @param values: The values as strings in the order of the results
+        """
+        self.values = list(values)
+        self.keys = [normalize(value) for value in self.values]
+        self._postings = None
+        self._gram_counts = None
+
+    def __len__(self):
+        return len(self.values)
+
+    def _build_postings(self) -> None:
+        """ Maps each trigram to the indexes of the values containing it """
+        postings = {}
+        gram_counts = array('I')
+        for i, key in enumerate(self.keys):
+            grams = trigrams(key)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, array('I')).append(i)
+        self._postings = postings
+        self._gram_counts = gram_counts
+
+    def search(self, text: str) -> list:
+        """ Returns the values matching ``text´´ ranked by relevance """
+        needle = normalize(text)
+        keys = self.keys
+        prefixed, contained = [], []
+        for i, key in enumerate(keys):
+            if needle in key:
+                (prefixed if key.startswith(needle) else contained).append(i)
+        ranked = prefixed + contained
+
+        if len(ranked) < self.FUZZY_THRESHOLD and len(needle) >= 3:
+            if self._postings is None:
+                self._build_postings()
+            grams = trigrams(needle)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+            found = set(ranked)
+            similar = []
+            for i, count in shared.items():
+                if i in found:
+                    continue
+                similarity = count / (len(grams) + self._gram_counts[i] - count)
+                if similarity >= self.MIN_SIMILARITY:
+                    similar.append((-similarity, i))
+            ranked += [i for _, i in sorted(similar)]
+
+        return [self.values[i] for i in ranked]
+
+
+def stream_search(values, text: str) -> list:
+    """ Returns the ``values´´ containing the normalized ``text´´, values
+    starting with it first, like FuzzyIndex.search without the similar
+    values. The values are normalized one by one and not kept, so it is
+    used for values that do not fit into memory.
+
+    @param values: Iterable of the values as strings in the order of the results
+    """
+    needle = normalize(text)
+    prefixed, contained = [], []
+    for value in values:
+        key = normalize(value)
+        if needle in key:
+            (prefixed if key.startswith(needle) else contained).append(value)
+    return prefixed + contained
+
+
+class SearchQuery:
+    """ A query of the search bar. Supported are:
+
+    * ``a..b´´ values between a and b (inclusive), ``a..´´ or ``..b´´ for open ranges
+    * ``>a´´, ``>=a´´, ``<a´´, ``<=a´´ comparisons
+    * ``=a´´ the exact value a
+    * ``abc*´´ values starting with abc
+    * ``/re/´´ values matching the regular expression re
+    """
+
+    RANGE = 'range'
+    PREFIX = 'prefix'
+    REGEX = 'regex'
+
+    def __init__(self, kind: str, lower=None, upper=None, lower_inclusive=True,
+                 upper_inclusive=True, pattern=None):
+        self.kind = kind
+        self.lower = lower
+        self.upper = upper
+        self.lower_inclusive = lower_inclusive
+        self.upper_inclusive = upper_inclusive
+        self.pattern = pattern
+
+    def matches(self, index: SortedValueIndex) -> list:
+        """ Returns the values of ``index´´ matching the query. Bounds that
+        cannot be converted to the type of the values match nothing. """
+        try:
+            if self.kind == self.PREFIX:
+                return index.prefixed(self.pattern)
+            if self.kind == self.REGEX:
+                return index.matching(re.compile(self.pattern))
+            return index.between(self.lower, self.upper,
+                                 self.lower_inclusive, self.upper_inclusive)
+        except (TypeError, ValueError, re.error):
+            return []
+
+    def expression(self, field_name: str, literal) -> str:
+        """ Returns a filter expression selecting the features matching
+        the query.
+
+        @param field_name: Name of the field
+        @param literal: Function converting a bound to an expression literal
+            of the type of the field, e.g. quoting strings
+        """
+        # imported here, so the indexes can be used without QGIS
+        from qgis.core import QgsExpression
+
+        field = QgsExpression.quotedColumnRef(field_name)
+        if self.kind == self.PREFIX:
+            # LIKE is case-insensitive when passed to OGR, left() is compared
+            # exactly, its length is counted in UTF-16 code units like QString
+            length = len(self.pattern.encode('utf-16-le')) // 2
+            return f"left({field}, {length}) = {QgsExpression.quotedString(self.pattern)}"
+        if self.kind == self.REGEX:
+            return f"regexp_match({field}, {QgsExpression.quotedString(self.pattern)})"
+        parts = []
+        if self.lower is not None and self.lower == self.upper:
+            return f"{field} = {literal(self.lower)}"
+        if self.lower is not None:
+            parts.append(f"{field} {'>=' if self.lower_inclusive else '>'} {literal(self.lower)}")
+        if self.upper is not None:
+            parts.append(f"{field} {'<=' if self.upper_inclusive else '<'} {literal(self.upper)}")
+        return ' and '.join(parts) or f"{field} is not Null"
+
+
+def parse_query(text: str) -> SearchQuery:
+    """ Parses the ``text´´ of the search bar. Returns None if the text
+    is no query, which means it is searched as substring. """
+    text = text.strip()
+    if len(text) > 2 and text.startswith('/') and text.endswith('/'):
+        return SearchQuery(SearchQuery.REGEX, pattern=text[1:-1])
+
+    match = _COMPARISON.match(text)
+    if match:
+        operator, operand = match.groups()
+        if operator == '=':
+            return SearchQuery(SearchQuery.RANGE, operand, operand)
+        if operator.startswith('>'):
+            return SearchQuery(SearchQuery.RANGE, lower=operand, lower_inclusive=operator == '>=')
+        return SearchQuery(SearchQuery.RANGE, upper=operand, upper_inclusive=operator == '<=')
+
+    match = _RANGE.match(text)
+    if match and any(match.groups()):
+        lower, upper = match.groups()
+        return SearchQuery(SearchQuery.RANGE, lower or None, upper or None)
+
+    if len(text) > 1 and text.endswith('*') and '*' not in text[:-1]:
+        return SearchQuery(SearchQuery.PREFIX, pattern=text[:-1])
+    return None
@@ -8,11 +8,19 @@ class UVVSettings(QgsSettings):
     DEFAULTS = {
         'background_proc': 0,
         'copy_newline': 2,
+        'fuzzy_search': 2,
+        'histogram_bins': 20,
+        'memory_budget': 0,
+        'native_engines': 2,
+        'profiling': 0,
+        'profiling_memory': 0,
         'quote_char': '\'',
         'quote_char_custom': '',
         'sep_char': ',',
         'sep_char_custom': '',
         'sync_layer': 2,
+        'top_k': 100,
+        'top_k_verify': 0,
         'value_sort': 2
     }
 
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import heapq
+import math
+
+
+class HyperLogLog:
+    """ Estimates the number of distinct values in a fixed amount of
+    memory, with a standard error of about 1.04 / sqrt(2 ** precision),
+    i.e. 1.6 % for the default precision.
+    """
+
+    def __init__(self, precision: int = 12):
+        """ Constructor.
+
+        @param precision: Number of bits used to select a register
+        """
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+        self._shift = 64 - precision
+        self._mask = (1 << self._shift) - 1
+
+    def add(self, value: str) -> None:
+        """ Adds a value, hashed with the (SipHash) hash of strings """
+        h = hash(value) & 0xFFFFFFFFFFFFFFFF
+        idx = h >> self._shift
+        rest = h & self._mask
+        rank = self._shift - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def update(self, values) -> None:
+        """ Adds several values """
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        """ Returns the estimated number of distinct values """
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # linear counting for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """ Finds the most frequent values of a stream with a fixed number of
+    counters (Space-Saving algorithm). Every value occurring more than
+    n / capacity times is guaranteed to be kept. The count of a kept value
+    overestimates its real count by at most its error.
+    """
+
+    def __init__(self, capacity: int):
+        """ Constructor.
+
+        @param capacity: Number of counters
+        """
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        # min-heap of (count, value), entries with an outdated count are
+        # refreshed lazily when the minimum is needed
+        self._heap = []
+        self.total = 0
+
+    def add(self, value, count: int = 1) -> None:
+        """ Counts ``value´´ ``count´´ times """
+        self.total += count
+        counts = self.counts
+        if value in counts:
+            counts[value] += count
+            return
+        if len(counts) < self.capacity:
+            counts[value] = count
+            self.errors[value] = 0
+            heapq.heappush(self._heap, (count, value))
+            return
+        # replace the value with the minimum count
+        heap = self._heap
+        while True:
+            min_count, min_value = heap[0]
+            current = counts[min_value]
+            if current == min_count:
+                break
+            heapq.heapreplace(heap, (current, min_value))
+        heapq.heappop(heap)
+        del counts[min_value]
+        del self.errors[min_value]
+        counts[value] = min_count + count
+        self.errors[value] = min_count
+        heapq.heappush(heap, (min_count + count, value))
+
+    def update(self, values) -> None:
+        """ Counts several values """
+        for value in values:
+            self.add(value)
+
+    def top(self, k: int = None) -> list:
+        """ Returns the ``k´´ most frequent values as tuples of the value,
+        the estimated count and the maximum overestimation """
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return [(value, count, self.errors[value]) for value, count in ranked[:k]]
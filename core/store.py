@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Approximate memory of one entry in the value dictionary besides the
+# value itself (hash table slot, key reference and count object)
+ENTRY_OVERHEAD = 100
+
+
+class UniqueValueStore:
+    """ Memory-bounded store for unique values and their counts.
+
+    Values are deduplicated in a dictionary until its estimated size
+    exceeds ``memory_budget´´ bytes. Then the dictionary is flushed as
+    a run into a temporary SQLite database, which merges the runs by its
+    primary key, and deduplication starts again in memory. The store
+    supports the set operations used by the dockwidget, so it can
+    replace the plain set of unique values.
+    """
+
+    def __init__(self, memory_budget: int = 0, numeric: bool = False):
+        """ Constructor.
+
+        @param memory_budget: Maximum estimated size of the values held in
+            memory in bytes, 0 for no limit
+        @type memory_budget: int
+        @param numeric: Whether the values are sorted numerically
+        @type numeric: bool
+        """
+        self.memory_budget = memory_budget
+        self.numeric = numeric
+        self._counts = {}
+        self._memory = 0
+        self._db = None
+        self._path = None
+        self.runs = 0
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, value) -> bool:
+        if value in self._counts:
+            return True
+        if self._db is not None:
+            row = self._db.execute("SELECT 1 FROM uv WHERE value = ?", (value,)).fetchone()
+            return row is not None
+        return False
+
+    def __del__(self):
+        self.close()
+
+    def __iand__(self, values):
+        """ Keeps only the ``values´´ in the store (intersection) """
+        values = set(values)
+        self.flush()
+        if self._db is None:
+            self._counts = {v: c for v, c in self._counts.items() if v in values}
+        else:
+            self._db.execute("CREATE TEMP TABLE keep (value TEXT PRIMARY KEY)")
+            self._db.executemany("INSERT INTO keep VALUES (?)", ((v,) for v in values))
+            self._db.execute("DELETE FROM uv WHERE value NOT IN (SELECT value FROM keep)")
+            self._db.execute("DROP TABLE keep")
+        return self
+
+    def __isub__(self, values):
+        """ Removes the ``values´´ from the store (difference) """
+        for value in values:
+            self.discard(value)
+        return self
+
+    def __iter__(self):
+        """ Iterates the values in arbitrary order """
+        self.flush()
+        if self._db is None:
+            return iter(list(self._counts))
+        return self._iter_query("SELECT value FROM uv")
+
+    def __len__(self) -> int:
+        if self._db is None:
+            return len(self._counts)
+        self.flush()
+        return self._db.execute("SELECT COUNT(*) FROM uv").fetchone()[0]
+
+    @property
+    def spilled(self) -> bool:
+        """ True if values were written to disk """
+        return self._db is not None
+
+    def add(self, value: str, count: int = 1) -> None:
+        """ Adds ``value´´ to the store and increases its count """
+        counts = self._counts
+        if value in counts:
+            counts[value] += count
+        else:
+            counts[value] = count
+            if self.memory_budget:
+                self._memory += sys.getsizeof(value) + ENTRY_OVERHEAD
+                if self._memory > self.memory_budget:
+                    self._spill()
+
+    def update(self, values) -> None:
+        """ Adds all ``values´´ to the store """
+        if not self.memory_budget:
+            counts = self._counts
+            for value in values:
+                counts[value] = counts.get(value, 0) + 1
+        else:
+            for value in values:
+                self.add(value)
+
+    def count(self, value: str) -> int:
+        """ Returns the number of occurrences of ``value´´ """
+        if self._db is not None:
+            self.flush()
+            row = self._db.execute("SELECT count FROM uv WHERE value = ?", (value,)).fetchone()
+            return row[0] if row else 0
+        return self._counts.get(value, 0)
+
+    def discard(self, value: str) -> None:
+        """ Removes ``value´´ from the store if present """
+        self._counts.pop(value, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM uv WHERE value = ?", (value,))
+
+    def remove(self, value: str) -> None:
+        """ Removes ``value´´ from the store, raises KeyError if missing """
+        if value not in self:
+            raise KeyError(value)
+        self.discard(value)
+
+    def flush(self) -> None:
+        """ Writes the values held in memory to disk, if the store
+        was already spilled
+        """
+        if self._db is not None and self._counts:
+            self._spill()
+
+    def sorted_values(self, key=None, reverse: bool = False):
+        """ Returns an iterator over the sorted values. Values written to
+        disk are sorted by SQLite and are read lazily.
+
+        @param key: Sort key as returned by get_sort_key
+        @param reverse: Sort descending if True
+        """
+        self.flush()
+        if self._db is None:
+            return iter(sorted(self._counts, key=key, reverse=reverse))
+        order = "DESC" if reverse else "ASC"
+        if key in (int, float):
+            sql = f"SELECT value FROM uv ORDER BY CAST(value AS REAL) {order}"
+        else:
+            sql = f"SELECT value FROM uv ORDER BY value {order}"
+        return self._iter_query(sql)
+
+    def most_common(self, n: int = None) -> [(str, int)]:
+        """ Returns the ``n´´ most common values with their counts """
+        self.flush()
+        if self._db is None:
+            items = sorted(self._counts.items(), key=lambda i: i[1], reverse=True)
+            return items[:n] if n else items
+        sql = "SELECT value, count FROM uv ORDER BY count DESC"
+        if n:
+            sql += f" LIMIT {int(n)}"
+        return self._db.execute(sql).fetchall()
+
+    def close(self) -> None:
+        """ Closes and deletes the temporary database """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._path is not None:
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._path = None
+
+    def _iter_query(self, sql: str, batch_size: int = 10000):
+        """ Lazily yields the first column of the rows of ``sql´´ """
+        cursor = self._db.execute(sql)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield row[0]
+
+    def _spill(self) -> None:
+        """ Writes the values held in memory as a new run to the temporary
+        database, where it is merged with the former runs
+        """
+        if self._db is None:
+            fd, self._path = tempfile.mkstemp(prefix='uvv_', suffix='.sqlite')
+            os.close(fd)
+            self._db = sqlite3.connect(self._path)
+            self._db.execute("PRAGMA journal_mode = OFF")
+            self._db.execute("PRAGMA synchronous = OFF")
+            self._db.execute("CREATE TABLE uv (value TEXT PRIMARY KEY, count INTEGER) WITHOUT ROWID")
+        # Sorting the run first makes the inserts into the b-tree sequential
+        self._db.executemany("INSERT INTO uv VALUES (?, ?) "
+                             "ON CONFLICT(value) DO UPDATE SET count = count + excluded.count",
+                             sorted(self._counts.items()))
+        self._db.commit()
+        self._counts = {}
+        self._memory = 0
+        self.runs += 1
+
+
+class SpilledValueIndex:
+    """ Answers the range, prefix and regular expression queries of the
+    search bar with SQL on a spilled UniqueValueStore, like a
+    SortedValueIndex but without loading all values into memory. Only the
+    matching values are returned, sorted by their typed value.
+    """
+
+    def __init__(self, store: UniqueValueStore):
+        """ Constructor.
+
+        @param store: The spilled store
+        """
+        store.flush()
+        self.store = store
+        self.key = float if store.numeric else str
+        self._column = "CAST(value AS REAL)" if store.numeric else "value"
+
+    def __len__(self):
+        return len(self.store)
+
+    def _select(self, condition: str = '', params=()) -> list:
+        """ Returns the values matching the SQL ``condition´´ in sort order """
+        where = f" WHERE {condition}" if condition else ''
+        sql = f"SELECT value FROM uv{where} ORDER BY {self._column}"
+        return [row[0] for row in self.store._db.execute(sql, params)]
+
+    def between(self, lower=None, upper=None, lower_inclusive=True, upper_inclusive=True) -> list:
+        """ Returns the values between ``lower´´ and ``upper´´, None for
+        an open bound. The bounds are converted with the key function. """
+        conditions, params = [], []
+        if lower is not None:
+            conditions.append(f"{self._column} {'>=' if lower_inclusive else '>'} ?")
+            params.append(self.key(lower))
+        if upper is not None:
+            conditions.append(f"{self._column} {'<=' if upper_inclusive else '<'} ?")
+            params.append(self.key(upper))
+        return self._select(' AND '.join(conditions), params)
+
+    def prefixed(self, prefix: str) -> list:
+        """ Returns the values starting with ``prefix´´ """
+        if self.key is not str:
+            return self._select("substr(value, 1, ?) = ?", (len(prefix), prefix))
+        # the strings are compared by their UTF-8 bytes, i.e. by code points
+        return self._select("value >= ? AND value < ?", (prefix, prefix + '\U0010ffff'))
+
+    def matching(self, pattern) -> list:
+        """ Returns the values matching the compiled regular expression
+        ``pattern´´, reading the values in batches """
+        sql = f"SELECT value FROM uv ORDER BY {self._column}"
+        return [value for value in self.store._iter_query(sql) if pattern.search(value)]
+
+
+class ExtentValueCache:
+    """ Cache for the values of the features within a map extent.
+
+    Holds the value of every feature id that was within the extent of the
+    last calculation. For any extent contained in this extent, the values
+    can be looked up by the feature ids, so no attributes have to be
+    fetched again. The key identifies layer, field and subset string the
+    values were calculated for.
+    """
+
+    def __init__(self):
+        """ Constructor."""
+        self.key = None
+        self.extent = None
+        self._fid_values = {}
+
+    def covers(self, key, extent) -> bool:
+        """ Returns True if the values for ``extent´´ can be taken from
+        the cache, i.e. ``key´´ is unchanged and the cached extent
+        contains ``extent´´
+
+        @param key: Tuple of layer id, field name and subset string
+        @param extent: Extent in the CRS of the layer
+        @type extent: QgsRectangle
+        """
+        return (self.extent is not None and key == self.key
+                and self.extent.contains(extent))
+
+    def invalidate(self) -> None:
+        """ Clears the cache, e.g. when features of the layer changed """
+        self.key = None
+        self.extent = None
+        self._fid_values = {}
+
+    def update(self, key, extent, fid_values: dict) -> None:
+        """ Replaces the cache with the values of a new calculation """
+        self.key = key
+        self.extent = extent
+        self._fid_values = fid_values
+
+    def feature_ids(self, value: str) -> {int}:
+        """ Returns the ids of the cached features with ``value´´ """
+        return {fid for fid, fid_value in self._fid_values.items() if fid_value == value}
+
+    def values(self, fids) -> {str}:
+        """ Returns the set of values of the features with ``fids´´ """
+        fid_values = self._fid_values
+        return {fid_values[fid] for fid in fids if fid in fid_values}
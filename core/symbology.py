@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from qgis.PyQt.QtCore import QDate, QDateTime, QTime, Qt
+from qgis.core import (NULL,
+                       QgsCategorizedSymbolRenderer,
+                       QgsRandomColorRamp,
+                       QgsRendererCategory,
+                       QgsSymbol)
+
+from unique_values_viewer.core.utils import FieldTypes
+
+
+def category_value(value: str, field_type: FieldTypes):
+    """ Returns the displayed ``value´´ as value of a renderer category,
+    which is matched with the attribute values by their string. Numbers,
+    booleans, dates and times are converted, so their strings match the
+    ones of QGIS, e.g. times with milliseconds. """
+    if value == 'NULL':
+        return NULL
+    try:
+        if field_type == FieldTypes.INTEGER:
+            return int(value)
+        if field_type == FieldTypes.DECIMAL:
+            return float(value)
+    except ValueError:
+        return value
+    if field_type == FieldTypes.BOOLEAN:
+        return value.lower() == 'true'
+    # the values are displayed in ISO format
+    parse = {FieldTypes.DATETIME: QDateTime.fromString,
+             FieldTypes.DATE: QDate.fromString,
+             FieldTypes.TIME: QTime.fromString}.get(field_type)
+    if parse is not None:
+        parsed = parse(value, Qt.ISODate)
+        if parsed.isValid():
+            return parsed
+    return value
+
+
+def categorized_renderer(layer, field_name: str, field_type: FieldTypes, values, counts=None):
+    """ Returns a categorized renderer of the layer with a category for each
+    of the ``values´´ of ``field_name´´, with random colors. The categories
+    are created from the values, the layer is not scanned again to classify
+    its features.
+
+    @param layer: The vector layer
+    @type layer: QgsVectorLayer
+    @param field_type: Type of the field
+    @param values: The values as displayed, in the order of the legend
+    @param counts: Number of features per value, added to the labels if known
+    @return: The renderer
+    @rtype: QgsCategorizedSymbolRenderer
+    """
+    counts = counts or {}
+    ramp = QgsRandomColorRamp()
+    ramp.setTotalColorCount(len(values))
+    categories = []
+    for i, value in enumerate(values):
+        symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+        symbol.setColor(ramp.color(i / max(len(values) - 1, 1)))
+        label = f"{value} ({counts[value]})" if value in counts else value
+        categories.append(QgsRendererCategory(category_value(value, field_type), symbol, label))
+    return QgsCategorizedSymbolRenderer(field_name, categories)
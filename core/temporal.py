@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+from qgis.PyQt.QtCore import Qt, QDate, QDateTime, QTime, QVariant
+
+YEAR = 'Year'
+MONTH = 'Month'
+DAY = 'Day'
+HOUR = 'Hour'
+UNITS = (YEAR, MONTH, DAY, HOUR)
+
+# Kinds of temporal fields, used to build the expression of a bucket
+DATE_KIND = 'date'
+DATETIME_KIND = 'datetime'
+TIME_KIND = 'time'
+
+# Number of components (year, month, day, hour) of the key of a bucket
+_KEY_LENGTH = {YEAR: 1, MONTH: 2, DAY: 3, HOUR: 4}
+
+
+def field_kind(field) -> str:
+    """ Returns the kind of a temporal ``field´´ or None for other fields
+
+    @param field: The field
+    @type field: QgsField
+    """
+    return {QVariant.Date: DATE_KIND,
+            QVariant.DateTime: DATETIME_KIND,
+            QVariant.Time: TIME_KIND}.get(field.type())
+
+
+def bucket_key(value, unit: str):
+    """ Returns the key of the bucket containing a date, datetime or time
+    ``value´´, i.e. a tuple of the calendar components up to ``unit´´,
+    e.g. (2021, 5) for May 2021. Returns None for NULL values and values
+    that cannot be assigned, e.g. times for a year bucket.
+
+    @param value: Attribute value of a temporal field
+    @type value: QDateTime, QDate, QTime or str in ISO format
+    @param unit: One of YEAR, MONTH, DAY or HOUR
+    """
+    if isinstance(value, str):
+        value = QDateTime.fromString(value, Qt.ISODate)
+    if isinstance(value, QDateTime):
+        if value.isNull():
+            return None
+        day, hour = value.date(), value.time().hour()
+    elif isinstance(value, QDate):
+        if value.isNull():
+            return None
+        day, hour = value, 0
+    elif isinstance(value, QTime):
+        if value.isNull() or unit != HOUR:
+            return None
+        return (value.hour(),)
+    else:
+        return None
+    return (day.year(), day.month(), day.day(), hour)[:_KEY_LENGTH[unit]]
+
+
+def count_buckets(values, unit: str) -> Counter:
+    """ Counts ``values´´ per bucket of ``unit´´ in a single pass, the
+    count of NULL values is stored with the key None """
+    return Counter(bucket_key(value, unit) for value in values)
+
+
+def bucket_label(key: tuple, kind: str) -> str:
+    """ Returns the text displayed for the bucket with ``key´´ of a
+    field of ``kind´´ """
+    if kind == TIME_KIND:
+        return '{:02d}:00'.format(*key)
+    if len(key) == 4:
+        return '{:04d}-{:02d}-{:02d} {:02d}:00'.format(*key)
+    if len(key) == 3:
+        return '{:04d}-{:02d}-{:02d}'.format(*key)
+    if len(key) == 2:
+        return '{:04d}-{:02d}'.format(*key)
+    return '{:04d}'.format(*key)
+
+
+def bucket_range(key: tuple, unit: str) -> (datetime, datetime):
+    """ Returns the start (inclusive) and the end (exclusive) of the
+    bucket with ``key´´ as datetimes """
+    year, month, day, hour = key + (1, 1, 0)[len(key) - 1:]
+    start = datetime(year, month, day, hour)
+    if unit == YEAR:
+        end = datetime(year + 1, 1, 1)
+    elif unit == MONTH:
+        end = datetime(year + month // 12, month % 12 + 1, 1)
+    elif unit == DAY:
+        end = start + timedelta(days=1)
+    else:
+        end = start + timedelta(hours=1)
+    return start, end
+
+
+def bucket_expression(field_name: str, key: tuple, unit: str, kind: str) -> str:
+    """ Returns a filter expression for the features within the bucket
+    with ``key´´
+
+    @param field_name: Name of the temporal field
+    @param key: Key of the bucket as returned by bucket_key
+    @param unit: One of YEAR, MONTH, DAY or HOUR
+    @param kind: Kind of the field, DATE_KIND, DATETIME_KIND or TIME_KIND
+    """
+    if kind == TIME_KIND:
+        hour = key[0]
+        expr = f"\"{field_name}\" >= to_time('{hour:02d}:00:00')"
+        if hour < 23:
+            expr += f" and \"{field_name}\" < to_time('{hour + 1:02d}:00:00')"
+        return expr
+
+    start, end = bucket_range(key, unit)
+    if kind == DATE_KIND:
+        start, end = start.date().isoformat(), end.date().isoformat()
+        function = 'to_date'
+    else:
+        start, end = start.isoformat(), end.isoformat()
+        function = 'to_datetime'
+    return (f"\"{field_name}\" >= {function}('{start}') and "
+            f"\"{field_name}\" < {function}('{end}')")
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from enum import Flag, auto
-from qgis.core import QgsVectorLayer
+from qgis.PyQt.QtCore import Qt, QDate, QDateTime, QTime
+from qgis.core import NULL, QgsVectorLayer
 
 __author__ = 'malik@blesius.com'
 __date__ = '2021-05-02'
@@ -45,6 +46,11 @@ def get_sort_key(field_type: FieldTypes) -> type:
         return None
 
 
+def is_null(value) -> bool:
+    """ Returns True if ``value´´ is None or a NULL QVariant """
+    return value is None or value == NULL
+
+
 def is_expression_field(layer, field_name) -> bool:
     """ Returns true if a field is an expression/virtual field, otherwise
         return false.
@@ -91,6 +97,16 @@ def match_field_type(field_type: str) -> FieldTypes:
         return FieldTypes.UNSUPPORTED
 
 
+def value_to_str(value) -> str:
+    """ Converts an attribute value of any field type to the string that
+    is displayed, date and time values are converted to ISO format
+    @param value: Attribute value
+    """
+    if isinstance(value, (QDateTime, QDate, QTime)):
+        return 'NULL' if value.isNull() else value.toString(Qt.ISODate)
+    return str(value)
+
+
 def main():
     print("Test utils.py ...")
     ftype = 'uint'
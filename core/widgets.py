@@ -4,14 +4,25 @@ __author__ = 'malik@blesius.com'
 __date__ = '2021-05-04'
 __copyright__ = 'Copyright 2021, Malik Blesius'
 
+from itertools import islice
+
 from qgis.core import QgsApplication
 
+from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import (QAbstractItemView,
                                  QListWidget,
                                  QListWidgetItem)
 
 from unique_values_viewer.core.settings import UVVSettings
 
+# Item data roles: the value of an item if it differs from its text and the
+# filter expression and bounds of items that represent a range of values,
+# e.g. a bin
+VALUE_ROLE = Qt.UserRole
+EXPRESSION_ROLE = Qt.UserRole + 1
+EXPANDED_ROLE = Qt.UserRole + 2
+RANGE_ROLE = Qt.UserRole + 3
+
 
 def delete_list_widget_items(items, parent) -> None:
     """ Removes and deletes a list of ``items´´ from a ``parent´´
@@ -28,8 +39,22 @@ def delete_list_widget_items(items, parent) -> None:
         del del_item
 
 
+def item_value(item) -> str:
+    """ Returns the value represented by a list widget ``item´´, which is
+    its text unless a different value is stored in VALUE_ROLE
+
+    @param item: The list widget item
+    @type item: QListWidgetItem
+    """
+    value = item.data(VALUE_ROLE)
+    return item.text() if value is None else value
+
+
 class UVVListWidget(QListWidget):
 
+    # Number of items that are added at once when values are added lazily
+    PAGE_SIZE = 10000
+
     @property
     def no_selection(self) -> bool:
         """ Getter method for no_selection"""
@@ -54,23 +79,78 @@ class UVVListWidget(QListWidget):
             raise TypeError
         self._sorting_enabled = sorting
 
+    @property
+    def total_count(self) -> int:
+        """ Number of items including the ones not added yet """
+        return self.count() + self._pending_count
+
     def __init__(self, parent=None):
         """ Constructor."""
         super().__init__(parent)
         self._no_selection = False
         self._sorting_enabled = True
+        self._pending = None
+        self._pending_count = 0
         self.settings = UVVSettings()
+        self.verticalScrollBar().valueChanged.connect(self._scrolled)
+
+    def _scrolled(self, value: int) -> None:
+        """ Adds the next page of items when scrolled to the end """
+        scrollbar = self.verticalScrollBar()
+        if self._pending is not None and value >= scrollbar.maximum() - scrollbar.pageStep():
+            self.fetchNextPage()
+
+    def addItemsLazily(self, values, total: int) -> None:
+        """ Adds the first page of ``values´´ as items, the following pages
+        are added when the user scrolls down. Thus, millions of values do
+        not have to be converted to items at once.
+
+        @param values: Iterable of the values as strings
+        @param total: Number of values in ``values´´
+        """
+        self._pending = iter(values)
+        self._pending_count = total
+        self.fetchNextPage()
+
+    def clear(self) -> None:
+        """ Removes all items and discards values not added yet """
+        self._pending = None
+        self._pending_count = 0
+        super().clear()
+
+    def fetchAll(self) -> None:
+        """ Adds all values that were not added yet """
+        if self._pending is not None:
+            self.addItems(list(self._pending))
+            self._pending = None
+            self._pending_count = 0
+
+    def fetchNextPage(self) -> None:
+        """ Adds the next page of values as items """
+        if self._pending is None:
+            return None
+        page = list(islice(self._pending, self.PAGE_SIZE))
+        self.addItems(page)
+        self._pending_count -= len(page)
+        if len(page) < self.PAGE_SIZE or self._pending_count <= 0:
+            self._pending = None
+            self._pending_count = 0
+
+    def selectAll(self) -> None:
+        """ Adds all pending values before selecting all items """
+        self.fetchAll()
+        super().selectAll()
 
     def copy_values(self):
         """ Copies the selected values of the ListWidget to the clipboard """
         items = self.selectedItems()
         separator = self.settings.get_sep_char()
         if len(items) == 1:
-            values = items[0].text()
+            values = item_value(items[0])
         elif self.settings.value('copy_newline') == 2:
-            values = '\n'.join([item.text() + separator for item in items])
+            values = '\n'.join([item_value(item) + separator for item in items])
         else:
-            values = separator.join([item.text() for item in items])
+            values = separator.join([item_value(item) for item in items])
         QgsApplication.clipboard().setText(values)
 
     def copy_values_quoted(self):
@@ -81,11 +161,11 @@ class UVVListWidget(QListWidget):
         quote_char = self.settings.get_quote_char()
         separator = self.settings.get_sep_char()
         if len(items) == 1:
-            str_values = quote_char + items[0].text() + quote_char
+            str_values = quote_char + item_value(items[0]) + quote_char
         elif self.settings.value('copy_newline') == 2:
-            str_values = '\n'.join([quote_char + item.text() + quote_char + separator for item in items])
+            str_values = '\n'.join([quote_char + item_value(item) + quote_char + separator for item in items])
         else:
-            str_values = separator.join([quote_char + item.text() + quote_char for item in items])
+            str_values = separator.join([quote_char + item_value(item) + quote_char for item in items])
         QgsApplication.clipboard().setText(str_values)
 
     def setExtendedSelection(self):
@@ -94,10 +174,10 @@ class UVVListWidget(QListWidget):
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setStyleSheet("QListWidget {font-style:normal;}")
 
-    def setNoSelection(self):
+    def setNoSelection(self, text: str = "No features selected"):
         """ """
         self.no_selection = True
-        self.addItem(QListWidgetItem("No features selected"))
+        self.addItem(QListWidgetItem(text))
         self.setSelectionMode(QAbstractItemView.NoSelection)
         self.setStyleSheet("QListWidget {font-style:italic;}")
 
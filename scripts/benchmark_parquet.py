@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+""" Benchmarks the Parquet engine of the plugin against the generic path
+on a locally generated file. The generic path is simulated by reading every
+row into Python objects and counting them one by one, as the feature
+iterator does. Requires pyarrow, but not QGIS.
+
+Usage: python scripts/benchmark_parquet.py [rows] [row group size]
+"""
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# core/parquet.py does not depend on QGIS, load it without the plugin package
+PARQUET_MODULE = os.path.join(os.path.dirname(__file__), os.pardir, 'core', 'parquet.py')
+spec = importlib.util.spec_from_file_location('parquet', PARQUET_MODULE)
+parquet = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(parquet)
+
+
+def generate(path: str, rows: int, row_group_size: int) -> None:
+    """ Writes a file with a category column of 500 distinct strings with
+    NULL values and a sorted numeric column, like a timestamp or an id """
+    rng = random.Random(42)
+    categories = [f'category {i}' for i in range(500)]
+    table = pa.table({
+        'category': [None if rng.random() < 0.01 else rng.choice(categories) for _ in range(rows)],
+        'measure': sorted(rng.uniform(0, 1000) for _ in range(rows)),
+    })
+    pq.write_table(table, path, row_group_size=row_group_size)
+
+
+def generic_value_counts(path: str, column: str) -> Counter:
+    """ Counts the values row by row """
+    return Counter(pq.read_table(path, columns=[column]).column(0).to_pylist())
+
+
+def generic_range_counts(path: str, column: str, lower: float, upper: float) -> Counter:
+    """ Counts the values within the range row by row """
+    values = pq.read_table(path, columns=[column]).column(0).to_pylist()
+    return Counter(v for v in values if v is not None and lower <= v < upper)
+
+
+def measure(label: str, function, *args):
+    """ Prints the best time of three runs of ``function´´ and returns its result """
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    print(f'{label:<40} {best * 1000:10.1f} ms')
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    row_group_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'benchmark.parquet')
+        generate(path, rows, row_group_size)
+        print(f'{rows} rows in row groups of {row_group_size}, {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+
+        generic = measure('unique values, generic', generic_value_counts, path, 'category')
+        native = measure('unique values, dictionary pages', parquet.parquet_value_counts, path, 'category')
+        assert generic == native
+
+        lower, upper = 100.0, 110.0
+        metadata = pq.ParquetFile(path).metadata
+        groups = parquet.row_groups_in_range(metadata, 'measure', lower, upper)
+        print(f'range [{lower}, {upper}) overlaps {len(groups)} of {metadata.num_row_groups} row groups')
+        generic = measure('range values, generic', generic_range_counts, path, 'measure', lower, upper)
+        native = measure('range values, row group statistics', parquet.parquet_range_counts,
+                         path, 'measure', lower, upper)
+        assert generic == native
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+#!/bin/bash
+# Precompiles the Qt Designer .ui files to Python modules, so the plugin
+# does not need to parse the XML with uic.loadUiType when it is loaded.
+# Run from the plugin root directory after changing a .ui file.
+PYUIC=${PYUIC:-pyuic5}
+
+for UI_FILE in *.ui
+do
+    PY_FILE="${UI_FILE%.ui}_base.py"
+    echo "Compiling: ${UI_FILE} -> ${PY_FILE}"
+    ${PYUIC} ${UI_FILE} -o ${PY_FILE}
+    # Use the qgis.PyQt wrappers and import QGIS widgets from qgis.gui
+    sed -i \
+        -e 's/^from PyQt5 import /from qgis.PyQt import /' \
+        -e 's/^from qgs[a-z]* import \(Qgs[A-Za-z]*\)$/from qgis.gui import \1/' \
+        ${PY_FILE}
+done
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+""" Tests of the values of WFS and OGC API Features layers against a local
+server serving canned responses. Run from the QGIS plugins directory with
+
+    python -m unittest unique_values_viewer.test.test_remote
+"""
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from qgis.core import QgsApplication
+
+from unique_values_viewer.core.remote import (ETAG_CACHE,
+                                              RemoteError,
+                                              RemoteSource,
+                                              RemoteValuesTask,
+                                              ResponseCache,
+                                              fetch)
+from unique_values_viewer.core.utils import FieldTypes
+
+# the values of the canned layer, None is NULL
+VALUES = ['a', 'b', None, 'a', 'c', 'd', 'b', 'e']
+
+WFS_PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<wfs:ValueCollection xmlns:wfs="http://www.opengis.net/wfs/2.0"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    numberMatched="{matched}" numberReturned="{returned}">
+{members}
+</wfs:ValueCollection>"""
+
+
+class CannedHandler(BaseHTTPRequestHandler):
+    """ Serves pages of VALUES as WFS GetPropertyValue responses (/wfs), as
+    OGC API Features items with numberMatched and offset links (/oapif) and
+    with opaque next links only (/cursor). Responses have an ETag and are
+    answered with 304 Not Modified if it matches If-None-Match. """
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, body: bytes, content_type: str) -> None:
+        etag = f'"{hash(body)}"'
+        CannedHandler.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key.lower(): values[0] for key, values in parse_qs(url.query).items()}
+        base = f"http://{self.server.server_address[0]}:{self.server.server_address[1]}"
+
+        if url.path == '/wfs':
+            start, count = int(query['startindex']), int(query['count'])
+            page = VALUES[start:start + count]
+            members = '\n'.join('<wfs:member xsi:nil="true"/>' if value is None
+                                else f'<wfs:member>{value}</wfs:member>' for value in page)
+            body = WFS_PAGE.format(matched=len(VALUES), returned=len(page), members=members)
+            self._respond(body.encode(), 'application/xml')
+
+        elif url.path.endswith('/items'):
+            cursor = url.path.startswith('/cursor')
+            start = int(query.get('cursor' if cursor else 'offset', 0))
+            count = int(query.get('limit', 3))
+            page = VALUES[start:start + count]
+            document = {'type': 'FeatureCollection',
+                        'features': [{'type': 'Feature', 'properties': {'name': value}} for value in page],
+                        'links': []}
+            if start + count < len(VALUES):
+                parameter = 'cursor' if cursor else 'offset'
+                document['links'].append({'rel': 'next', 'href': f"{base}{url.path}?f=json&limit={count}&"
+                                                                 f"{parameter}={start + count}"})
+            if not cursor:
+                document['numberMatched'] = len(VALUES)
+            self._respond(json.dumps(document).encode(), 'application/geo+json')
+
+        else:
+            self.send_error(404)
+
+
+class RemoteTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QgsApplication([], False)
+        cls.app.initQgis()
+        cls.server = HTTPServer(('127.0.0.1', 0), CannedHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ETAG_CACHE.clear()
+        CannedHandler.requests = []
+
+    def source(self, path: str, provider: str) -> RemoteSource:
+        return RemoteSource(f"url='{self.base}{path}' typename='layer' version='2.0.0'", provider)
+
+    def fetch_values(self, source: RemoteSource, page_size: int) -> set:
+        """ Runs the task in this thread with pages of ``page_size´´ """
+        task = RemoteValuesTask(source, 'name', FieldTypes.STRING)
+        page_url = source.page_url
+        source.page_url = lambda field, start, count=page_size: page_url(field, start, count)
+        pages = []
+        task.pageFetched.connect(pages.append)
+        self.assertTrue(task.run(), task.error)
+        self.assertIsNone(task.error)
+        # every value is emitted once
+        self.assertEqual(sorted(value for page in pages for value in page), sorted(task.values))
+        return task.values
+
+    def test_parse_value_collection(self):
+        source = self.source('/wfs', 'WFS')
+        content = WFS_PAGE.format(matched=8, returned=2, members='<wfs:member>x</wfs:member>\n'
+                                                                  '<wfs:member xsi:nil="true"/>')
+        values, matched, next_url = source.parse(content.encode(), 'name')
+        self.assertEqual(values, ['x', None])
+        self.assertEqual(matched, 8)
+        self.assertIsNone(next_url)
+
+    def test_parse_exception_report(self):
+        source = self.source('/wfs', 'WFS')
+        content = b'<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1"><ows:Exception>' \
+                  b'<ows:ExceptionText>Unknown request</ows:ExceptionText></ows:Exception></ows:ExceptionReport>'
+        with self.assertRaises(RemoteError) as context:
+            source.parse(content, 'name')
+        self.assertIn('Unknown request', str(context.exception))
+
+    def test_parse_features(self):
+        source = self.source('/oapif', 'OAPIF')
+        content = json.dumps({'features': [{'properties': {'name': 'x'}}, {'properties': {'name': None}}],
+                              'numberMatched': 5,
+                              'links': [{'rel': 'next', 'href': 'http://next'}]})
+        values, matched, next_url = source.parse(content.encode(), 'name')
+        self.assertEqual(values, ['x', None])
+        self.assertEqual(matched, 5)
+        self.assertEqual(next_url, 'http://next')
+
+    def test_wfs_values(self):
+        values = self.fetch_values(self.source('/wfs', 'WFS'), 3)
+        self.assertEqual(values, {'a', 'b', 'c', 'd', 'e', 'NULL'})
+        # the first page and the remaining pages by offset
+        self.assertEqual(len(CannedHandler.requests), 3)
+
+    def test_oapif_values_by_offset(self):
+        values = self.fetch_values(self.source('/oapif', 'OAPIF'), 3)
+        self.assertEqual(values, {'a', 'b', 'c', 'd', 'e', 'NULL'})
+        self.assertEqual(len(CannedHandler.requests), 3)
+
+    def test_oapif_values_by_next_links(self):
+        values = self.fetch_values(self.source('/cursor', 'OAPIF'), 3)
+        self.assertEqual(values, {'a', 'b', 'c', 'd', 'e', 'NULL'})
+        self.assertTrue(all('cursor=' in path for path, _ in CannedHandler.requests[1:]))
+        self.assertEqual(len(CannedHandler.requests), 3)
+
+    def test_not_modified(self):
+        url = self.source('/wfs', 'WFS').page_url('name', 0, 3)
+        content = fetch(url)
+        self.assertEqual(len(ETAG_CACHE), 1)
+        # the second request is revalidated and answered with 304
+        self.assertEqual(fetch(url), content)
+        (_, first), (_, second) = CannedHandler.requests
+        self.assertIsNone(first)
+        self.assertIsNotNone(second)
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_size=10)
+        cache.put('a', b'1', b'aaaa')
+        cache.put('b', b'1', b'bbbb')
+        cache.get('a')
+        cache.put('c', b'1', b'cccc')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), (b'1', b'aaaa'))
+        self.assertEqual(cache.size, 8)
+
+    def test_skips_large_responses(self):
+        cache = ResponseCache(max_size=10)
+        cache.put('a', b'1', b'a' * 11)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
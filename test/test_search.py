@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+""" Tests of the queries of the search bar. Run from the QGIS plugins
+directory with
+
+    python -m unittest unique_values_viewer.test.test_search
+"""
+
+__author__ = 'malik@blesius.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2021, Malik Blesius'
+
+import unittest
+
+from unique_values_viewer.core.search import SearchQuery, SortedValueIndex, parse_query
+
+try:
+    from qgis.core import QgsExpression, QgsExpressionContext, QgsFeature, QgsField, QgsFields
+    from qgis.PyQt.QtCore import QVariant
+except ImportError:
+    QgsExpression = None
+
+
+def quoted(value) -> str:
+    """ Literal of a string bound, as passed to SearchQuery.expression """
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+class ParseQueryTest(unittest.TestCase):
+
+    def test_substring(self):
+        self.assertIsNone(parse_query('abc'))
+        self.assertIsNone(parse_query('*'))
+        self.assertIsNone(parse_query('a*b*'))
+        self.assertIsNone(parse_query('//'))
+        self.assertIsNone(parse_query('..'))
+
+    def test_prefix(self):
+        query = parse_query(' abc* ')
+        self.assertEqual(query.kind, SearchQuery.PREFIX)
+        self.assertEqual(query.pattern, 'abc')
+
+    def test_regex(self):
+        query = parse_query('/^a.c$/')
+        self.assertEqual(query.kind, SearchQuery.REGEX)
+        self.assertEqual(query.pattern, '^a.c$')
+
+    def test_comparisons(self):
+        query = parse_query('>= 5')
+        self.assertEqual((query.kind, query.lower, query.upper), (SearchQuery.RANGE, '5', None))
+        self.assertTrue(query.lower_inclusive)
+        query = parse_query('<5')
+        self.assertEqual((query.lower, query.upper), (None, '5'))
+        self.assertFalse(query.upper_inclusive)
+        query = parse_query('= a')
+        self.assertEqual((query.lower, query.upper), ('a', 'a'))
+
+    def test_range(self):
+        query = parse_query('1..10')
+        self.assertEqual((query.kind, query.lower, query.upper), (SearchQuery.RANGE, '1', '10'))
+        self.assertTrue(query.lower_inclusive and query.upper_inclusive)
+        query = parse_query('..b')
+        self.assertEqual((query.lower, query.upper), (None, 'b'))
+
+    def test_matches(self):
+        index = SortedValueIndex(['b', 'ab', 'abc', 'Abd', 'c'])
+        self.assertEqual(parse_query('ab*').matches(index), ['ab', 'abc'])
+        self.assertEqual(parse_query('b..c').matches(index), ['b', 'c'])
+        self.assertEqual(parse_query('/^a/').matches(index), ['ab', 'abc'])
+        self.assertEqual(parse_query('/[/').matches(index), [])
+
+
+@unittest.skipIf(QgsExpression is None, 'QGIS is not available')
+class ExpressionTest(unittest.TestCase):
+
+    def evaluate(self, query: SearchQuery, value, field_name: str = 'name') -> bool:
+        """ Evaluates the expression of the ``query´´ for a feature with the ``value´´ """
+        fields = QgsFields()
+        fields.append(QgsField(field_name, QVariant.String))
+        feature = QgsFeature(fields)
+        feature.setAttribute(0, value)
+        expression = QgsExpression(query.expression(field_name, quoted))
+        self.assertFalse(expression.hasParserError(), expression.parserErrorString())
+        context = QgsExpressionContext()
+        context.setFields(fields)
+        context.setFeature(feature)
+        return bool(expression.evaluate(context))
+
+    def test_prefix_is_case_sensitive(self):
+        query = parse_query('Ab*')
+        self.assertTrue(self.evaluate(query, 'Abc'))
+        self.assertFalse(self.evaluate(query, 'abc'))
+        self.assertFalse(self.evaluate(query, 'A'))
+
+    def test_prefix_is_no_pattern(self):
+        query = parse_query("a_'%\\*")
+        self.assertTrue(self.evaluate(query, "a_'%\\x"))
+        self.assertFalse(self.evaluate(query, "ab'%\\x"))
+
+    def test_prefix_outside_basic_plane(self):
+        self.assertTrue(self.evaluate(parse_query('\U0001f600a*'), '\U0001f600ab'))
+
+    def test_quoted_column(self):
+        self.assertTrue(self.evaluate(parse_query('a*'), 'ab', field_name='my "field"'))
+
+    def test_regex(self):
+        query = parse_query("/^it's\\d$/")
+        self.assertTrue(self.evaluate(query, "it's1"))
+        self.assertFalse(self.evaluate(query, "it's"))
+
+    def test_range(self):
+        self.assertEqual(parse_query('b..c').expression('name', quoted), "\"name\" >= 'b' and \"name\" <= 'c'")
+        self.assertEqual(parse_query('= b').expression('name', quoted), "\"name\" = 'b'")
+        self.assertEqual(SearchQuery(SearchQuery.RANGE).expression('name', quoted), '"name" is not Null')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,7 @@
 
 from __future__ import absolute_import
 import os.path
+import time
 
 from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt
 from qgis.PyQt.QtGui import QIcon
@@ -35,8 +36,7 @@ from qgis.core import Qgis, QgsMessageLog
 # Initialize Qt resources from file resources.py
 from .resources import *
 
-# Import the code for the DockWidget
-from .unique_values_viewer_dockwidget import UniqueValuesViewerDockWidget
+# The DockWidget is imported when it is opened for the first time
 from unique_values_viewer.core.settings import UVVSettings
 
 
@@ -51,6 +51,10 @@ class UniqueValuesViewer:
             application at run time.
         :type iface: QgsInterface
         """
+        t0 = time.perf_counter()
+        # Load times of the plugin in seconds, see log_startup_time
+        self.startup_time = {}
+
         # Save reference to the QGIS interface
         self.iface = iface
 
@@ -80,10 +84,10 @@ class UniqueValuesViewer:
         # Settings
         self.settings = UVVSettings()
 
-        # Dockwidget
-        self.dockwidget = UniqueValuesViewerDockWidget(self.iface,
-                                                       self.plugin_dir,
-                                                       self.settings)
+        # Dockwidget, created on first use to keep the startup of QGIS fast
+        self.dockwidget = None
+
+        self.startup_time['init'] = time.perf_counter() - t0
 
     # noinspection PyMethodMayBeStatic
     def tr(self, message):
@@ -102,17 +106,19 @@ class UniqueValuesViewer:
 
     def initGui(self, add_to_menu=True, add_to_toolbar=True):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
+        t0 = time.perf_counter()
 
         icon_path = self.plugin_dir + '/resources/icons/icon.svg'
 
-        self.showHideAction = QAction(QIcon(icon_path), u'UniqueValuesViewer', self.dockwidget)
+        self.showHideAction = QAction(QIcon(icon_path), u'UniqueValuesViewer', self.iface.mainWindow())
         self.showHideAction.setObjectName(u"mUniqueValuesViewer")
         self.showHideAction.setToolTip(f"<b>Unique Values Viewer<b>")
         self.showHideAction.setShortcut(self.shortcut)
+        self.showHideAction.setCheckable(True)
+        self.showHideAction.toggled.connect(self.toggle_dockwidget)
 
         self.actions.append(self.showHideAction)
 
-        self.dockwidget.setToggleVisibilityAction(self.showHideAction)
         self.iface.registerMainWindowAction(self.showHideAction, self.shortcut)
 
         # Insert Plugin Button before the Statistical Summary Widget
@@ -122,7 +128,39 @@ class UniqueValuesViewer:
         if add_to_menu:
             self.iface.addPluginToMenu(self.menu, self.showHideAction)
 
+        self.startup_time['initGui'] = time.perf_counter() - t0
+        self.log_startup_time()
+
+    def create_dockwidget(self):
+        """Imports and creates the dockwidget and adds it to the QGIS interface."""
+        t0 = time.perf_counter()
+
+        from .unique_values_viewer_dockwidget import UniqueValuesViewerDockWidget
+        self.dockwidget = UniqueValuesViewerDockWidget(self.iface,
+                                                       self.plugin_dir,
+                                                       self.settings)
         self.iface.addDockWidget(Qt.RightDockWidgetArea, self.dockwidget)
+        self.dockwidget.setToggleVisibilityAction(self.showHideAction)
+        self.dockwidget.setUserVisible(True)
+
+        QgsMessageLog.logMessage(f"UniqueValuesViewer dockwidget created in "
+                                 f"{(time.perf_counter() - t0) * 1000:.1f} ms",
+                                 level=Qgis.Info)
+
+    def log_startup_time(self):
+        """Logs the time needed to load the plugin when QGIS starts."""
+        details = ', '.join(f"{key} {value * 1000:.1f} ms"
+                            for key, value in self.startup_time.items())
+        total = sum(self.startup_time.values()) * 1000
+        QgsMessageLog.logMessage(f"UniqueValuesViewer loaded in {total:.1f} ms ({details})",
+                                 level=Qgis.Info)
+
+    def toggle_dockwidget(self, checked):
+        """Creates the dockwidget when the showHideAction is toggled for
+        the first time, afterwards the dockwidget handles the action."""
+        if checked and self.dockwidget is None:
+            self.showHideAction.toggled.disconnect(self.toggle_dockwidget)
+            self.create_dockwidget()
 
     def onClosePlugin(self):
         """Cleanup necessary items here when plugin dockwidget is closed"""
@@ -147,3 +185,8 @@ class UniqueValuesViewer:
             self.iface.removeToolBarIcon(action)
             self.iface.unregisterMainWindowAction(action)
             self.iface.attributesToolBar().removeAction(action)
+
+        if self.dockwidget is not None:
+            self.iface.removeDockWidget(self.dockwidget)
+            self.dockwidget.deleteLater()
+            self.dockwidget = None
@@ -8,36 +8,86 @@ __date__ = '2020-09-18'
 __copyright__ = 'Copyright 2021, Malik Blesius'
 
 import traceback
-import os
+from collections import Counter
 
-from qgis.PyQt import uic
-from qgis.PyQt.QtCore import Qt, QEvent, pyqtSignal
+from qgis.PyQt.QtCore import Qt, QEvent, QTimer, pyqtSignal
 from qgis.PyQt.QtWidgets import (QAction,
+                                 QFileDialog,
+                                 QInputDialog,
                                  QListWidgetItem,
+                                 QMessageBox,
                                  QToolButton,
                                  QMenu)
 from qgis.gui import QgsDockWidget
 from qgis.core import (Qgis,
                        QgsApplication,
+                       QgsCoordinateTransform,
+                       QgsCsException,
+                       QgsExpression,
+                       QgsFeatureRequest,
+                       QgsFields,
+                       QgsMemoryProviderUtils,
                        QgsMessageLog,
                        QgsProject,
-                       QgsVectorLayer)
-
+                       QgsVectorDataProvider,
+                       QgsVectorFileWriter,
+                       QgsVectorLayer,
+                       QgsVectorLayerFeatureSource)
+
+from unique_values_viewer.core.dialogs import (CrossFilterDialog,
+                                               DuplicatesDialog,
+                                               GroupStatisticsDialog,
+                                               LayerProfileDialog,
+                                               MultiLayerDialog,
+                                               PointCloudValuesDialog)
+from unique_values_viewer.core.aggregates import GroupAggregates, group_aggregates
+from unique_values_viewer.core.columnar import arrow_value_counts
+from unique_values_viewer.core.delimited import delimited_value_counts
+from unique_values_viewer.core.diagnostics import UVVProfiler
+from unique_values_viewer.core.expressions import ExpressionFieldEvaluator
+from unique_values_viewer.core.extract import ExtractFeaturesTask
+from unique_values_viewer.core.joins import join_for_field, joined_unique_values
+from unique_values_viewer.core.numeric import NumericSummary, format_number, numeric_summary
+from unique_values_viewer.core.ogr_sql import grouped_aggregates, grouped_value_counts, ogr_layer_source
+from unique_values_viewer.core.parquet import is_parquet, parquet_range_counts, parquet_value_counts
+from unique_values_viewer.core.pointcloud import point_clouds_supported
+from unique_values_viewer.core.sketches import SpaceSaving
+from unique_values_viewer.core.remote import REMOTE_PROVIDERS, RemoteSource, RemoteValuesTask
+from unique_values_viewer.core.search import FuzzyIndex, SortedValueIndex, normalize, parse_query, stream_search
+from unique_values_viewer.core.store import ExtentValueCache, SpilledValueIndex, UniqueValueStore
+from unique_values_viewer.core.symbology import categorized_renderer
+from unique_values_viewer.core.temporal import (DAY, HOUR, MONTH, YEAR,
+                                                DATE_KIND, DATETIME_KIND, TIME_KIND,
+                                                bucket_expression,
+                                                bucket_label,
+                                                count_buckets,
+                                                field_kind)
 from unique_values_viewer.core.utils import (FieldTypes,
                                              match_field_type,
                                              is_expression_field,
-                                             get_sort_key)
+                                             is_null,
+                                             get_sort_key,
+                                             value_to_str)
 from unique_values_viewer.core.widgets import (delete_list_widget_items,
-                                               NullItem)
-
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'unique_values_viewer_dockwidget.ui'))
+                                               item_value,
+                                               NullItem,
+                                               EXPANDED_ROLE,
+                                               EXPRESSION_ROLE,
+                                               RANGE_ROLE,
+                                               VALUE_ROLE)
+from unique_values_viewer.unique_values_viewer_dockwidget_base import Ui_UVVDockWidget
+
+# The UI is precompiled with scripts/compile-ui.sh instead of loading
+# the .ui file with uic.loadUiType, which is slow when the plugin loads
+FORM_CLASS = Ui_UVVDockWidget
 
 # TODO: Make plugin able to work with other data providers
 EXCLUDE_PROVIDERS = {
     'arcgisfeatureserver',
     'arcgismapserver',
+    'copc',
     'DB2',
+    'ept',
     'gdal',
     'geonode',
     'mdal',
@@ -48,10 +98,22 @@ EXCLUDE_PROVIDERS = {
     'pdal',
     'spatialite',
     'wcs',
-    'WFS',
     'wms'
 }
 
+# Modes of the value mode combo box
+UNIQUE_VALUES_MODE = 0
+HISTOGRAM_MODE = 1
+YEAR_MODE = 2
+MONTH_MODE = 3
+DAY_MODE = 4
+HOUR_MODE = 5
+TOP_K_MODE = 6
+TEMPORAL_MODES = {YEAR_MODE: YEAR, MONTH_MODE: MONTH, DAY_MODE: DAY, HOUR_MODE: HOUR}
+
+# Number of features changed at once in the data source when replacing a value
+EDIT_BATCH_SIZE = 10000
+
 
 class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
     """DockWidget for the plugin."""
@@ -98,15 +160,106 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
 
     @unique_values.setter
     def unique_values(self, unique_values):
-        self._unique_values = set(unique_values)
+        self._search_index = None
+        self._fuzzy_index = None
+        old_values = getattr(self, "_unique_values", None)
+        if isinstance(old_values, UniqueValueStore) and old_values is not unique_values:
+            old_values.close()
+        if isinstance(unique_values, UniqueValueStore):
+            self._unique_values = unique_values
+        else:
+            self._unique_values = set(unique_values)
 
     @unique_values.deleter
     def unique_values(self):
+        self._search_index = None
+        self._fuzzy_index = None
         if hasattr(self, "_unique_values"):
+            if isinstance(self._unique_values, UniqueValueStore):
+                self._unique_values.close()
             del self._unique_values
         else:
             QgsMessageLog.logMessage("Unique values have already been cleared!", level=Qgis.Warning)
 
+    @property
+    def all_features_scope(self) -> bool:
+        """True if the unique values are calculated for all (filtered)
+        features of the layer, not only the selected or visible ones."""
+        return (self.selectedOnlyBtn.isChecked() is False and
+                self.extentOnlyBtn.isChecked() is False)
+
+    @property
+    def histogram_mode(self) -> bool:
+        """True if a histogram of a numeric field is shown instead of the
+        unique values."""
+        return self.valueModeBox.currentIndex() == HISTOGRAM_MODE
+
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        """The normalized unique values in the current sort order for the
+        fuzzy search, built on first use after the values changed."""
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self.ordered_values())
+        return self._fuzzy_index
+
+    @property
+    def search_index(self) -> SortedValueIndex:
+        """The unique values sorted by their typed value for searching,
+        built on first use after the values changed. Values written to
+        disk under the memory budget are searched with SQL instead."""
+        if self._search_index is None:
+            if self.values_spilled:
+                self._search_index = SpilledValueIndex(self.unique_values)
+            else:
+                numeric = get_sort_key(self.field_type) is not None
+                self._search_index = SortedValueIndex(self.unique_values, float if numeric else None)
+        return self._search_index
+
+    @property
+    def values_spilled(self) -> bool:
+        """True if the unique values exceeded the memory budget and were
+        written to disk, so they must not be loaded into memory at once."""
+        return isinstance(self.unique_values, UniqueValueStore) and self.unique_values.spilled
+
+    @property
+    def value_count(self) -> int:
+        """The number of values of the active field including the NULL
+        value, also when only the results of a search are shown."""
+        if self.search_results_shown:
+            return len(self.unique_values) + (1 if self.field_contains_null else 0)
+        if self.top_k_mode:
+            # -1 if not all values are among the most frequent ones
+            return self.distinct_count
+        return self.listWidget.total_count
+
+    @property
+    def values_editable(self) -> bool:
+        """True if the values of the active field can be replaced: they are
+        values, not bins or buckets, of a field of the data source and the
+        data source allows to change attribute values."""
+        layer = self.active_layer
+        idx = layer.fields().indexFromName(self.active_field)
+        return (self.values_styleable and not layer.readOnly()
+                and layer.fields().fieldOrigin(idx) == QgsFields.OriginProvider
+                and bool(layer.dataProvider().capabilities() & QgsVectorDataProvider.ChangeAttributeValues))
+
+    @property
+    def values_styleable(self) -> bool:
+        """True if the items of the list widget are values of the active
+        field, which can be categories of a renderer, not bins or buckets."""
+        return not self.histogram_mode and self.temporal_unit is None
+
+    @property
+    def temporal_unit(self) -> str:
+        """The unit of the buckets if the values of a date/time field are
+        rolled up, otherwise None."""
+        return TEMPORAL_MODES.get(self.valueModeBox.currentIndex())
+
+    @property
+    def top_k_mode(self) -> bool:
+        """True if only the most frequent values are shown."""
+        return self.valueModeBox.currentIndex() == TOP_K_MODE
+
     @property
     def project(self):
         """Getter method for the current QGIS project instance."""
@@ -129,20 +282,59 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         self._field_type = None
 
         self._unique_values = set()
+        self._search_index = None
+        self._fuzzy_index = None
+        self.search_results_shown = False
+        # number of distinct values in top-K mode, -1 if unknown
+        self.distinct_count = -1
+        # task fetching the values of a WFS or OGC API Features layer
+        self.remote_task = None
+        # running tasks extracting features to a new layer
+        self.extract_tasks = []
+        # number of features per value of the last calculation, if counted
+        self.value_counts = {}
 
         self.field_contains_null = None
         self.no_features_selected = True
 
+        # values of the features within the last visible extent and a timer
+        # to update the values only once the user stopped panning/zooming
+        self.extent_cache = ExtentValueCache()
+        self.extent_timer = QTimer(self)
+        self.extent_timer.setSingleShot(True)
+        self.extent_timer.setInterval(300)
+        self.extent_timer.timeout.connect(self.update_values)
+
+        # values of all features of fields profiled with 'Profile Layer',
+        # by layer id, field name and subset string
+        self.value_cache = {}
+
+        # opt-in instrumentation of the hot paths
+        self.profiler = UVVProfiler(self.settings.value('profiling', type=int) == 2,
+                                    self.settings.value('profiling_memory', type=int) == 2)
+        self.profiler.finished_callback = self.show_diagnostics
+        self.profilingBtn.setCheckState(self.settings.value('profiling', type=int))
+        self.profilingMemoryBtn.setCheckState(self.settings.value('profiling_memory', type=int))
+        self.fuzzySearchBtn.setCheckState(self.settings.value('fuzzy_search', type=int))
+        self.nativeEnginesBtn.setCheckState(self.settings.value('native_engines', type=int))
+        self.memoryBudgetSpin.setValue(self.settings.value('memory_budget', type=int))
+        self.histogramBinsSpin.setValue(self.settings.value('histogram_bins', type=int))
+        self.topKSpin.setValue(self.settings.value('top_k', type=int))
+        self.verifyTopKBtn.setCheckState(self.settings.value('top_k_verify', type=int))
+        self.valueModeBox.setEnabled(False)
+
         # install event filter for context menu
         self.listWidget.installEventFilter(self)
 
         # init signal/slot connections and additional UI elements
         self._init_connections()
         self._init_sort()
+        self._init_tools()
 
         # init other connections
         self.project.cleared.connect(self.change_project)  # Minimum QGIS-Version 3.2
         self.iface.currentLayerChanged.connect(self.sync_iface_layer_changed)
+        self.iface.mapCanvas().extentsChanged.connect(self.canvas_extent_changed)
 
         # set iface active layer to current combobox layer
         # can be None, for example if no layer is selected and
@@ -159,10 +351,12 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         # comboboxes
         self.mMapLayerComboBox.layerChanged.connect(self.change_layer)
         self.mFieldComboBox.fieldChanged.connect(self.change_field)
+        self.valueModeBox.currentIndexChanged.connect(self.change_value_mode)
 
         # checkboxes
         self.liveUpdateBtn.toggled.connect(self.change_live_update)
         self.selectedOnlyBtn.toggled.connect(self.change_only_selected_features)
+        self.extentOnlyBtn.toggled.connect(self.change_only_visible_extent)
 
         # search bar/filterLineEdit
         self.valueSearch.textChanged.connect(self.search_values)
@@ -173,10 +367,22 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         self.sortOptionBtn.stateChanged.connect(self.change_sorting)
         self.syncLayerBtn.stateChanged.connect(self.change_sync_layer)
         self.newLineBtn.stateChanged.connect(lambda v: self.setting_changed('copy_newline', v))
+        self.fuzzySearchBtn.stateChanged.connect(lambda v: self.setting_changed('fuzzy_search', v))
+        self.nativeEnginesBtn.stateChanged.connect(lambda v: self.setting_changed('native_engines', v))
         self.quoteCharBox.currentTextChanged.connect(lambda v: self.setting_changed('quote_char', v))
         self.sepCharBox.currentTextChanged.connect(lambda v: self.setting_changed('sep_char', v))
+        self.memoryBudgetSpin.valueChanged.connect(lambda v: self.setting_changed('memory_budget', v))
+        self.histogramBinsSpin.valueChanged.connect(lambda v: self.setting_changed('histogram_bins', v))
+        self.topKSpin.valueChanged.connect(lambda v: self.setting_changed('top_k', v))
+        self.verifyTopKBtn.stateChanged.connect(lambda v: self.setting_changed('top_k_verify', v))
         self.resetDefaultsBtn.clicked.connect(self.reset_settings)
 
+        # diagnostics
+        self.profilingBtn.stateChanged.connect(self.change_profiling)
+        self.profilingMemoryBtn.stateChanged.connect(self.change_profiling_memory)
+        self.exportDiagnosticsBtn.clicked.connect(self.export_diagnostics)
+        self.clearDiagnosticsBtn.clicked.connect(self.clear_diagnostics)
+
     def _init_sort(self) -> None:
         """Creates the sort action for the values in the listWidget
         and inserts it into placeholder in the UI.
@@ -190,12 +396,70 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         self.sortValuesBtn.setDefaultAction(self.sort_action)
         self.sortBtnPlaceholder.insertWidget(-1, self.sortValuesBtn)
 
+    def _init_tools(self) -> None:
+        """Creates the menu with additional tools and sets it for the
+        tool button next to the sort button."""
+        self.tools_menu = QMenu(self)
+        self.tools_menu.addAction(QgsApplication.getThemeIcon('/mActionAddLayer.svg'),
+                                  self.tr('Values of Several Layers…'),
+                                  self.open_multi_layer_dialog)
+        self.tools_menu.addAction(self.tr('Find Duplicate Values…'),
+                                  self.open_duplicates_dialog)
+        self.tools_menu.addAction(self.tr('Profile Layer…'),
+                                  self.open_profile_dialog)
+        self.tools_menu.addAction(self.tr('Cross Filter Two Fields…'),
+                                  self.open_cross_filter_dialog)
+        self.tools_menu.addAction(self.tr('Statistics of Another Field…'),
+                                  self.open_group_statistics_dialog)
+        if point_clouds_supported():
+            self.tools_menu.addAction(QgsApplication.getThemeIcon('/mIconPointCloudLayer.svg'),
+                                      self.tr('Point Cloud Values…'),
+                                      self.open_point_cloud_dialog)
+        self.tools_menu.addSeparator()
+        self.search_action = self.tools_menu.addAction(QgsApplication.getThemeIcon('/mIconSelected.svg'),
+                                                       self.tr('Select Features Matching Search'),
+                                                       self.select_search_matches)
+        self.search_action.setEnabled(False)
+        self.toolButton.setMenu(self.tools_menu)
+        self.toolButton.setPopupMode(QToolButton.InstantPopup)
+        self.toolButton.setIcon(QgsApplication.getThemeIcon('/mActionOptions.svg'))
+        self.toolButton.setToolTip(self.tr('Tools'))
+
+    def add_remote_values(self, task, values: list) -> None:
+        """Adds the ``values´´ of a page fetched by ``task´´ to the list
+        widget while the remaining pages are loading.
+
+        Parameters:
+            task(RemoteValuesTask): The task that fetched the page
+            values(List[str]): New values of the page
+        """
+        if task is not self.remote_task:
+            return None
+        if 'NULL' in values:
+            values.remove('NULL')
+            self.field_contains_null = True
+            self.listWidget.insertItem(0, self.listWidget.null_item)
+        self.listWidget.addItems(values)
+        count = len(task.values)
+        self.valuesLbl.setText(self.tr("Unique values [{} …]").format(count))
+
     def add_to_selection(self) -> None:
         """Adds values corresponding to selected list widget
         items to current selection.
         """
-        expr = self.build_expression()
-        self.active_layer.selectByExpression(expr, behavior=QgsVectorLayer.AddToSelection)
+        with self.profiler.run('Add to selection', **self.profile_info()):
+            with self.profiler.stage('expression'):
+                expr = self.build_expression()
+            with self.profiler.stage('selection'):
+                self.select_by_expression(expr, behavior=QgsVectorLayer.AddToSelection)
+
+    def attribute_request(self, idx: int) -> QgsFeatureRequest:
+        """Returns a feature request fetching only the field with index
+        ``idx´´ and no geometry."""
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([idx])
+        return request
 
     def build_expression(self) -> str:
         """Builds a filter expression based on the selected unique values
@@ -205,6 +469,11 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         Returns:
             The expression to use in the expression builder for selection.
         """
+        # items of value ranges, e.g. histogram bins, carry their own expression
+        range_items = [item for item in self.listWidget.selectedItems()
+                       if item.data(EXPRESSION_ROLE) is not None]
+        if range_items:
+            return self.build_range_expression(range_items)
 
         # check if active_field contains NULL-Values through null_item of list widget
         if self.listWidget.null_item.isSelected():
@@ -221,7 +490,7 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             expr = f"\"{self.active_field}\" is Null"
         # build expression in case all but the NULL-Value are selected
         elif ((self.field_contains_null and not null_item_was_selected)
-              and (len(items) == self.listWidget.count() - 1)):
+              and (len(items) == self.value_count - 1)):
             expr = f"\"{self.active_field}\" is not Null"
         # build expressions for any other case for field types
         else:
@@ -235,29 +504,29 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             # string fields
             if self.field_type is FieldTypes.STRING:
                 for item in items:
-                    if "'" in item.text():
-                        text = item.text().replace("'", "''")
+                    if "'" in item_value(item):
+                        text = item_value(item).replace("'", "''")
                         expr += f"'{text}',"
                     else:
-                        expr += f"'{item.text()}',"
+                        expr += f"'{item_value(item)}',"
             # fields with date and time
             elif (self.field_type | FieldTypes.DATE is FieldTypes.DATETIME
                   or self.field_type | FieldTypes.TIME is FieldTypes.DATETIME):
                 for item in items:
-                    expr += f"'{item.text()}',"
+                    expr += f"'{item_value(item)}',"
             # numeric fields
             elif (self.field_type | FieldTypes.INTEGER is FieldTypes.NUMERIC
                   or self.field_type | FieldTypes.DECIMAL is FieldTypes.NUMERIC):
                 for item in items:
-                    expr += f"{item.text()},"
+                    expr += f"{item_value(item)},"
             # boolean fields
             elif self.field_type is FieldTypes.BOOLEAN:
                 # Boolean field can only hold true, false or None/NULL
                 if len(items) == 1:
-                    expr = f"(\"{self.active_field}\" is {items[0].text()} "
+                    expr = f"(\"{self.active_field}\" is {item_value(items[0])} "
                 elif len(items) == 2:
-                    expr = f"(\"{self.active_field}\" is {items[0].text()}" \
-                           f" or \"{self.active_field}\" is {items[1].text()} "
+                    expr = f"(\"{self.active_field}\" is {item_value(items[0])}" \
+                           f" or \"{self.active_field}\" is {item_value(items[1])} "
                 else:
                     return None
             else:
@@ -274,6 +543,165 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             self.listWidget.null_item.setSelected(True)
         return expr
 
+    def build_range_expression(self, range_items) -> str:
+        """Builds a filter expression for the selected ``range_items´´, e.g.
+        histogram bins, which store the expression of their range. Other
+        selected items, like the NULL item or values of an expanded bin,
+        are added by build_expression.
+
+        Parameters:
+            range_items(List[QListWidgetItem]): Selected items with an expression
+        """
+        parts = [f"({item.data(EXPRESSION_ROLE)})" for item in range_items]
+        for item in range_items:
+            item.setSelected(False)
+        if self.listWidget.selectedItems():
+            parts.append(f"({self.build_expression()})")
+        for item in range_items:
+            item.setSelected(True)
+        return ' or '.join(parts)
+
+    def cancel_remote_task(self) -> None:
+        """Cancels fetching the values of a WFS or OGC API Features layer."""
+        if self.remote_task is not None:
+            task, self.remote_task = self.remote_task, None
+            task.cancel()
+
+    def cache_key(self, field_name: str = None) -> tuple:
+        """Returns the key of the values of ``field_name´´, by default the
+        active field, of the active layer in the value cache."""
+        return (self.active_layer.id(), field_name or self.active_field,
+                self.active_layer.subsetString())
+
+    def calc_group_aggregates(self, other_field: str) -> dict:
+        """Returns the GroupAggregates of ``other_field´´ per value of the
+        active field for the features in scope: number of features, sum,
+        mean, minimum, maximum and number of distinct values. Computed by
+        a GROUP BY query on supported data sources, otherwise in a single
+        pass over the features fetching only both fields.
+
+        Parameters:
+            other_field(str): Name of the aggregated field
+        """
+        fields = self.active_layer.fields()
+        idx_a = fields.indexFromName(self.active_field)
+        idx_b = fields.indexFromName(other_field)
+        numeric = match_field_type(fields.at(idx_b).typeName()) in (FieldTypes.INTEGER, FieldTypes.DECIMAL)
+        with self.profiler.run('Group statistics', **self.profile_info()):
+            groups = self.native_group_aggregates(idx_a, idx_b, numeric)
+            if groups is None:
+                request = self.attribute_request(idx_a)
+                request.setSubsetOfAttributes([idx_a, idx_b])
+                features = self.profiler.iterate('fetch', self.scoped_features(request))
+                with self.profiler.stage('aggregate'):
+                    groups = group_aggregates(features, idx_a, idx_b, numeric)
+        return groups
+
+    def calc_histogram(self) -> NumericSummary:
+        """Returns the summary and histogram of the numeric active field for
+        the features in scope, or None if no features are in scope.
+
+        For all features of a field of the data provider, the range of the
+        values is taken from the provider, so the values are streamed once
+        into the bins without collecting them. Otherwise the values are
+        collected and the quantiles are exact.
+        """
+        idx = self.active_layer.fields().indexFromName(self.active_field)
+        if (self.selectedOnlyBtn.isChecked() is True and
+                self.active_layer.selectedFeatureCount() == 0):
+            self.no_features_selected = True
+            return None
+
+        minimum = maximum = None
+        if (self.all_features_scope and
+                self.active_layer.fields().fieldOrigin(idx) == QgsFields.OriginProvider):
+            with self.profiler.stage('fetch'):
+                minimum = self.active_layer.minimumValue(idx)
+                maximum = self.active_layer.maximumValue(idx)
+            if is_null(minimum) or is_null(maximum):
+                minimum = maximum = None
+            else:
+                minimum, maximum = float(minimum), float(maximum)
+
+        features = self.profiler.iterate('fetch', self.scoped_features(self.attribute_request(idx)))
+        values = (feat.attributes()[idx] for feat in features)
+        with self.profiler.stage('histogram'):
+            summary = numeric_summary((None if is_null(v) else float(v) for v in values),
+                                      self.settings.value('histogram_bins', type=int),
+                                      minimum, maximum)
+        self.no_features_selected = summary.count + summary.null_count == 0
+        return None if self.no_features_selected else summary
+
+    def calc_temporal_buckets(self) -> Counter:
+        """Returns the number of features per bucket of the temporal unit
+        for the date/time active field, counted in a single pass over the
+        native date/time values of the features in scope, or None if no
+        features are in scope. NULL values are counted with the key None.
+        """
+        idx = self.active_layer.fields().indexFromName(self.active_field)
+        if (self.selectedOnlyBtn.isChecked() is True and
+                self.active_layer.selectedFeatureCount() == 0):
+            self.no_features_selected = True
+            return None
+
+        features = self.profiler.iterate('fetch', self.scoped_features(self.attribute_request(idx)))
+        with self.profiler.stage('dedup'):
+            counts = count_buckets((feat.attributes()[idx] for feat in features),
+                                   self.temporal_unit)
+        self.no_features_selected = not counts
+        return None if self.no_features_selected else counts
+
+    def calc_top_values(self) -> list:
+        """Returns the most frequent values of the active field for the
+        features in scope as tuples of value, count and maximum
+        overestimation of the count, or None if no features are in scope.
+
+        The values are counted in one pass with a fixed number of
+        Space-Saving counters, so the memory does not depend on the number
+        of distinct values. Optionally the counts of the winners are
+        verified exactly in a second pass. Sets distinct_count if all
+        values fitted into the counters. Supported data sources count the
+        values exactly with a single query instead.
+        """
+        idx = self.active_layer.fields().indexFromName(self.active_field)
+        if (self.selectedOnlyBtn.isChecked() is True and
+                self.active_layer.selectedFeatureCount() == 0):
+            self.no_features_selected = True
+            return None
+
+        k = self.settings.value('top_k', type=int)
+        counts = self.native_value_counts(idx, limit=k)
+        if counts is not None:
+            self.no_features_selected = not counts
+            if self.no_features_selected:
+                return None
+            # the query counts exactly, all values are known if less than k
+            self.distinct_count = len(counts) if len(counts) < k else -1
+            return [(value, count, 0) for value, count in counts.most_common()]
+
+        counters = SpaceSaving(max(10 * k, 1000))
+        features = self.profiler.iterate('fetch', self.scoped_features(self.attribute_request(idx)))
+        with self.profiler.stage('dedup'):
+            counters.update(value_to_str(feat.attributes()[idx]) for feat in features)
+        self.no_features_selected = counters.total == 0
+        if self.no_features_selected:
+            return None
+
+        # no value was evicted, so all counts are exact
+        exact = len(counters.counts) < counters.capacity
+        self.distinct_count = len(counters.counts) if exact else -1
+        top = counters.top(k)
+        if not exact and self.settings.value('top_k_verify', type=int) == 2:
+            winners = {value for value, _, _ in top}
+            features = self.profiler.iterate('verify', self.scoped_features(self.attribute_request(idx)))
+            with self.profiler.stage('dedup'):
+                counts = Counter(value for value in (value_to_str(feat.attributes()[idx])
+                                                     for feat in features)
+                                 if value in winners)
+            top = sorted(((value, counts[value], 0) for value in winners),
+                         key=lambda item: item[1], reverse=True)
+        return top
+
     def calc_unique_values(self) -> {str}:
         """Returns the unique values from the active field as set of strings,
         either calculated for all or only for the selected features.
@@ -285,45 +713,93 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         """
         # Get index for active_field
         idx = self.active_layer.fields().indexFromName(self.active_field)
+        memory_budget = self.settings.value('memory_budget', type=int) * 1024 * 1024
+        join = join_for_field(self.active_layer, self.active_field)
 
         # Get unique values from all (filtered) features
         if self.selectedOnlyBtn.isChecked() is False:
 
             self.no_features_selected = None
 
-            if not is_expression_field(self.active_layer, self.active_field):
-                # Get unique values by qgis built_in function
-                v_set = self.active_layer.uniqueValues(idx)  # does not work for virtual fields
+            if self.extentOnlyBtn.isChecked() is True:
+                str_set = self.calc_unique_values_in_extent(idx)
+                if not str_set:
+                    self.no_features_selected = True
+                    return set()
+
+            elif self.cache_key() in self.value_cache:
+                str_set = set(self.value_cache[self.cache_key()])
+
+            elif memory_budget:
+                request = self.attribute_request(idx)
+                str_set = self.calc_unique_values_bounded(self.active_layer.getFeatures(request),
+                                                          idx, memory_budget)
+
+            elif join is not None:
+                str_set = self.calc_unique_values_joined(*join)
+
+            elif not is_expression_field(self.active_layer, self.active_field):
+                # Get unique values directly from supported data sources
+                # or by qgis built_in function
+                counts = self.native_value_counts(idx)
+                if counts is not None:
+                    self.value_counts = counts
+                    str_set = set(counts)
+                else:
+                    with self.profiler.stage('fetch'):
+                        v_set = self.active_layer.uniqueValues(idx)  # does not work for virtual fields
+                    self.profiler.count_features(self.active_layer.featureCount())
 
-                # If field contains datetime values, then convert them to string with toString method
-                # and check if Field Format in QgsEditorWidgetSetup was changed
-                if (self.field_type | FieldTypes.DATE is FieldTypes.DATETIME
-                        or self.field_type | FieldTypes.TIME is FieldTypes.DATETIME):
+                    # If field contains datetime values, then convert them to string with toString method
+                    # and check if Field Format in QgsEditorWidgetSetup was changed
+                    with self.profiler.stage('format'):
+                        if (self.field_type | FieldTypes.DATE is FieldTypes.DATETIME
+                                or self.field_type | FieldTypes.TIME is FieldTypes.DATETIME):
 
-                    str_set = {str(v) if v.isNull() else v.toString(Qt.ISODate) for v in v_set}
-                else:
-                    str_set = {str(v) for v in v_set}
+                            str_set = {str(v) if v.isNull() else v.toString(Qt.ISODate) for v in v_set}
+                        else:
+                            str_set = {str(v) for v in v_set}
 
             else:
-                # QgsMessageLog.logMessage("Virtual field", level=Qgis.Info)
                 # Get unique values "manually" for virtual fields because built_in does not support it
-                str_set = {str(feat.attributes()[idx])
-                           for feat in self.active_layer.getFeatures()}
+                str_set = self.calc_unique_values_virtual(idx)
 
         # Get unique values from selected features in case at least one feature is selected
         elif self.active_layer.selectedFeatureCount() != 0:
 
             self.no_features_selected = False
 
+            request = self.attribute_request(idx)
+            if self.extentOnlyBtn.isChecked() is True:
+                request.setFilterRect(self.visible_extent())
+            features = self.active_layer.getSelectedFeatures(request)
+
+            if memory_budget:
+                str_set = self.calc_unique_values_bounded(features, idx, memory_budget)
+
+            elif join is not None:
+                str_set = self.calc_unique_values_joined(*join, selected_only=True)
+
+            elif is_expression_field(self.active_layer, self.active_field):
+                str_set = self.calc_unique_values_virtual(idx, selected_only=True)
+
             # If field contains datetime values, then convert them to string with toString method
-            if (self.field_type | FieldTypes.DATE is FieldTypes.DATETIME
+            elif (self.field_type | FieldTypes.DATE is FieldTypes.DATETIME
                     or self.field_type | FieldTypes.TIME is FieldTypes.DATETIME):
-                v_set = {feat.attributes()[idx]
-                         for feat in self.active_layer.getSelectedFeatures()}
-                str_set = {str(v) if v.isNull() else v.toString(Qt.ISODate) for v in v_set}
+                features = self.profiler.iterate('fetch', features)
+                with self.profiler.stage('dedup'):
+                    v_set = {feat.attributes()[idx] for feat in features}
+                with self.profiler.stage('format'):
+                    str_set = {str(v) if v.isNull() else v.toString(Qt.ISODate) for v in v_set}
             else:
-                str_set = {str(feat.attributes()[idx])
-                           for feat in self.active_layer.getSelectedFeatures()}
+                counts = self.native_value_counts(idx)
+                if counts is not None:
+                    self.value_counts = counts
+                    str_set = set(counts)
+                else:
+                    features = self.profiler.iterate('fetch', features)
+                    with self.profiler.stage('dedup'):
+                        str_set = {str(feat.attributes()[idx]) for feat in features}
 
         # Return an empty set in case no features were selected when option was checked
         else:
@@ -342,6 +818,114 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
 
         return str_set
 
+    def calc_unique_values_bounded(self, features, idx: int, memory_budget: int) -> UniqueValueStore:
+        """Returns the unique values of ``features´´ as UniqueValueStore, which
+        writes the values to disk once they exceed ``memory_budget´´ bytes.
+
+        Parameters:
+            features(QgsFeatureIterator): Features to get the values from
+            idx(int): Index of the active field
+            memory_budget(int): Memory budget for the values in bytes
+        """
+        store = UniqueValueStore(memory_budget, numeric=get_sort_key(self.field_type) is not None)
+        features = self.profiler.iterate('fetch', features)
+        with self.profiler.stage('dedup'):
+            store.update(value_to_str(feat.attributes()[idx]) for feat in features)
+            store.flush()
+        if store.spilled:
+            QgsMessageLog.logMessage(f"Unique values exceeded the memory budget and were "
+                                     f"merged from {store.runs} runs on disk",
+                                     level=Qgis.Info)
+        return store
+
+    def calc_unique_values_joined(self, join_info, join_field, selected_only: bool = False) -> {str}:
+        """Returns the unique values of a joined field by a semi-join of
+        the join layer with the join keys of all or the selected features,
+        without fetching the joined attributes of every feature.
+
+        Parameters:
+            join_info(QgsVectorLayerJoinInfo): The join of the active field
+            join_field(QgsField): The field of the join layer
+            selected_only(bool): Use the join keys of the selected features only
+        """
+        target_idx = self.active_layer.fields().indexFromName(join_info.targetFieldName())
+        with self.profiler.stage('fetch'):
+            if selected_only:
+                request = self.attribute_request(target_idx)
+                if self.extentOnlyBtn.isChecked() is True:
+                    request.setFilterRect(self.visible_extent())
+                target_keys = {feat.attributes()[target_idx]
+                               for feat in self.active_layer.getSelectedFeatures(request)}
+            else:
+                target_keys = self.active_layer.uniqueValues(target_idx)
+        with self.profiler.stage('dedup'):
+            v_set = joined_unique_values(join_info, join_field, target_keys)
+        with self.profiler.stage('format'):
+            return {value_to_str(v) for v in v_set}
+
+    def calc_unique_values_virtual(self, idx: int, selected_only: bool = False) -> {str}:
+        """Returns the unique values of a virtual field by evaluating its
+        expression with an ExpressionFieldEvaluator, which fetches only the
+        referenced columns and evaluates the expression once per distinct
+        combination of input values, if possible.
+
+        Parameters:
+            idx(int): Index of the virtual field
+            selected_only(bool): Use the selected features only
+        """
+        evaluator = ExpressionFieldEvaluator(self.active_layer, idx)
+        request = evaluator.request()
+        if selected_only:
+            if self.extentOnlyBtn.isChecked() is True:
+                request.setFilterRect(self.visible_extent())
+            features = self.active_layer.getSelectedFeatures(request)
+        else:
+            features = self.active_layer.getFeatures(request)
+        features = self.profiler.iterate('fetch', features)
+        with self.profiler.stage('dedup'):
+            str_set = evaluator.unique_values(features)
+        self.profiler.annotate('evaluations', evaluator.evaluations)
+        return str_set
+
+    def calc_unique_values_in_extent(self, idx: int) -> {str}:
+        """Returns the unique values of the features within the visible map
+        extent. The features are requested by a filter rectangle, so the
+        spatial index of the provider is used, and without geometry.
+
+        When the extent is contained in the extent of the last calculation
+        and neither the layer, its subset string nor the field changed, only
+        the feature ids are requested and the values are looked up from the
+        cached values of the last calculation.
+
+        Parameters:
+            idx(int): Index of the active field
+        """
+        extent = self.visible_extent()
+        key = (self.active_layer.id(), self.active_field, self.active_layer.subsetString())
+        request = QgsFeatureRequest()
+        request.setFilterRect(extent)
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+
+        if self.extent_cache.covers(key, extent):
+            request.setNoAttributes()
+            features = self.profiler.iterate('fetch', self.active_layer.getFeatures(request))
+            with self.profiler.stage('dedup'):
+                return self.extent_cache.values(feat.id() for feat in features)
+
+        request.setSubsetOfAttributes([idx])
+        features = self.profiler.iterate('fetch', self.active_layer.getFeatures(request))
+        with self.profiler.stage('dedup'):
+            fid_values = {feat.id(): value_to_str(feat.attributes()[idx]) for feat in features}
+            self.extent_cache.update(key, extent, fid_values)
+            return set(fid_values.values())
+
+    def canvas_extent_changed(self) -> None:
+        """(Re)starts the timer to update the values when the extent of
+        the map canvas changed and 'Visible extent only' is checked."""
+        if (self.extentOnlyBtn.isChecked() is True and
+                self.liveUpdateBtn.isChecked() is True):
+            self.extent_timer.start()
+
     def change_field(self) -> None:
         """Changes the active_field property of the DockWidget Plugin Class."""
         # evaluate if new field is the same as the old field
@@ -364,6 +948,8 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             ftype = self.active_layer.fields()[idx].typeName()
             self.field_type = match_field_type(ftype)
 
+            self.update_value_modes(self.active_layer.fields()[idx])
+
             if self.field_type is FieldTypes.UNSUPPORTED:
                 self.iface.messageBar().pushMessage("Unsupported field type:",
                                                     f"{ftype}",
@@ -444,6 +1030,8 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         self.clear_listWidget()
         self.liveUpdateBtn.setChecked(False)
         self.selectedOnlyBtn.setChecked(False)
+        self.extentOnlyBtn.setChecked(False)
+        self.invalidate_caches()
         self.enable_updates(True)
 
     def change_only_selected_features(self) -> None:
@@ -468,6 +1056,27 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                     else:
                         self.update_values()
 
+    def change_only_visible_extent(self) -> None:
+        """Changes whether only features within the visible map extent will
+        be used for calculation of unique values."""
+        if self.active_layer is not None and self.liveUpdateBtn.isChecked() is True:
+            self.update_values()
+
+    def change_profiling(self, state: int) -> None:
+        """Enables/disables the instrumentation of the hot paths.
+        :param state: Checkstate of the QCheckbox that is connected
+        """
+        self.profiler.enabled = state == 2  # Qt.Checked
+        self.settings.setValue('profiling', state)
+
+    def change_profiling_memory(self, state: int) -> None:
+        """Switches the profiling between measuring the times and the peak
+        memory, which are recorded in separate runs.
+        :param state: Checkstate of the QCheckbox that is connected
+        """
+        self.profiler.trace_memory = state == 2  # Qt.Checked
+        self.settings.setValue('profiling_memory', state)
+
     def change_sorting(self, state: int) -> None:
         """ Changes the sorting option for the ListWidgetItems
         :param state: Checkstate of the QCheckbox that is connected
@@ -499,6 +1108,15 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             else:
                 self.settings.setValue('sync_layer', state)
 
+    def change_value_mode(self) -> None:
+        """Switches between the unique values, the histogram and the temporal
+        buckets of the active field and updates the values if live update
+        is active."""
+        self.clear_listWidget()
+        self.unique_values = set()
+        if self.liveUpdateBtn.isChecked() is True:
+            self.update_values()
+
     def change_live_update(self) -> None:
         """Changes the widget to update the unique values automatically
         when active Field, Layer or Feature Selection changes.
@@ -524,10 +1142,13 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         widget items and changes the values label.
         """
         self.listWidget.clear()
+        self.search_results_shown = False
         self.sortValuesBtn.setEnabled(False)
+        self.value_counts = {}
         # Create a new null item, because it will be deleted by clearing
         self.listWidget.null_item = NullItem()
         self.valuesLbl.setText(self.tr("Unique values"))
+        self.valuesLbl.setToolTip('')
 
     def clear_listWidget_button(self) -> None:
         """Clears the list widget when clicked on the clear button
@@ -542,6 +1163,11 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             # triggers self.active_layer.selectionChanged
             self.active_layer.removeSelection()
 
+    def clear_diagnostics(self) -> None:
+        """Removes all recorded profiling runs."""
+        self.profiler.clear()
+        self.diagnosticsText.clear()
+
     def clear_connections(self) -> None:
         """Clears connections between active layer and dockwidget buttons."""
         if self.liveUpdateBtn.isChecked() is True:
@@ -568,6 +1194,7 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                 self.active_layer.selectionChanged.connect(self.update_values)
 
         self.active_layer.willBeDeleted.connect(self.clear_connections)
+        self.active_layer.dataChanged.connect(self.invalidate_caches)
         self.mFieldComboBox.setLayer(self.active_layer)
 
     def copy_features(self) -> None:
@@ -578,33 +1205,43 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         # get selected unique values
         items = self.listWidget.selectedItems()
 
-        # check if all unique values are selected
-        if (len(items) == self.listWidget.count() and
-                self.selectedOnlyBtn.isChecked() is False):
-            self.active_layer.selectAll()
-        else:
-            # Build expression for selection
-            expr = self.build_expression()
-
-            # Check if 'Selected features only' is checked
-            if self.selectedOnlyBtn.isChecked() is True:
-                self.active_layer.selectByExpression(expr,
-                                                     behavior=QgsVectorLayer.IntersectSelection)
+        with self.profiler.run('Copy features', **self.profile_info()):
+            # check if all unique values are selected
+            if (len(items) == self.value_count and
+                    self.all_features_scope):
+                with self.profiler.stage('selection'):
+                    self.active_layer.selectAll()
             else:
-                self.active_layer.selectByExpression(expr)
+                # Build expression for selection
+                with self.profiler.stage('expression'):
+                    expr = self.build_expression()
 
-        # Copy Features
-        self.iface.setActiveLayer(self.active_layer)
-        self.iface.copySelectionToClipboard(self.active_layer)
+                # Check if 'Selected features only' is checked
+                with self.profiler.stage('selection'):
+                    if self.selectedOnlyBtn.isChecked() is True:
+                        self.select_by_expression(expr,
+                                                  behavior=QgsVectorLayer.IntersectSelection)
+                    else:
+                        self.select_by_expression(expr)
 
-        # Restore the original selection
-        self.active_layer.selectByIds(selected_ids)
+            # Copy Features
+            with self.profiler.stage('copy'):
+                self.iface.setActiveLayer(self.active_layer)
+                self.iface.copySelectionToClipboard(self.active_layer)
+
+            # Restore the original selection
+            with self.profiler.stage('selection'):
+                self.active_layer.selectByIds(selected_ids)
 
     def disconnect_active_layer(self) -> None:
         """ Disconnects the active layer from all slots """
+        # changes of the data are not noticed any more
+        self.value_cache.clear()
+        self.cancel_remote_task()
         try:
-            # disconnect active layer from willBeDeleted
+            # disconnect active layer from willBeDeleted and dataChanged
             self.active_layer.willBeDeleted.disconnect(self.clear_connections)
+            self.active_layer.dataChanged.disconnect(self.invalidate_caches)
             # Try to disconnect old current layer from selection change ...
             if (self.liveUpdateBtn.isChecked() is True and
                     self.selectedOnlyBtn.isChecked() is True):
@@ -621,10 +1258,12 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             self.getValuesBtn.setEnabled(True)
             self.liveUpdateBtn.setEnabled(True)
             self.selectedOnlyBtn.setEnabled(True)
+            self.extentOnlyBtn.setEnabled(True)
         else:
             self.getValuesBtn.setEnabled(False)
             self.liveUpdateBtn.setEnabled(False)
             self.selectedOnlyBtn.setEnabled(False)
+            self.extentOnlyBtn.setEnabled(False)
 
     def eventFilter(self, source, event):
         """ Creates the event filter for the ContextMenu event """
@@ -649,10 +1288,27 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                     context_menu.addAction(QgsApplication.getThemeIcon('/mActionEditCopy.svg'),
                                            self.tr('Copy Features'),
                                            self.copy_features)
+                    extract_menu = context_menu.addMenu(self.tr('Extract Features with This Value'))
+                    extract_menu.addAction(self.tr('To Temporary Layer'),
+                                           self.extract_features)
+                    extract_menu.addAction(self.tr('To GeoPackage…'),
+                                           self.extract_features_to_file)
+                    if (items[0].data(EXPRESSION_ROLE) is not None and
+                            not items[0].data(EXPANDED_ROLE)):
+                        context_menu.addAction(self.tr('Expand Bin'),
+                                               self.expand_bin)
+                    if self.values_styleable:
+                        context_menu.addAction(QgsApplication.getThemeIcon('/symbologyEdit.svg'),
+                                               self.tr('Style by Value'),
+                                               self.style_by_values)
+                    if items[0] is not self.listWidget.null_item and self.values_editable:
+                        context_menu.addAction(QgsApplication.getThemeIcon('/mActionEditTable.svg'),
+                                               self.tr('Replace Value…'),
+                                               self.replace_value)
                     context_menu.addSeparator()
                     # Selection Actions when all values are selected
-                    if (len(items) == self.listWidget.count() and
-                            self.selectedOnlyBtn.isChecked() is False):
+                    if (len(items) == self.value_count and
+                            self.all_features_scope):
                         if (self.active_layer.selectedFeatureCount() ==
                                 self.active_layer.featureCount()):
                             context_menu.addAction(QgsApplication.getThemeIcon('/mActionDeselectActiveLayer.svg'),
@@ -683,7 +1339,7 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                         context_menu.addAction(self.tr('Filter Layer by value'),
                                                self.filter_layer)
                     context_menu.addSeparator()
-                    if self.listWidget.count() > 1:
+                    if self.listWidget.total_count > 1:
                         context_menu.addAction(self.tr("Select All Values"),
                                                self.listWidget.selectAll)
                         context_menu.addAction(self.tr("Switch Selected Values"),
@@ -700,10 +1356,19 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                     context_menu.addAction(QgsApplication.getThemeIcon("/mActionEditCopy.svg"),
                                            self.tr("Copy Features"),
                                            self.copy_features)
+                    extract_menu = context_menu.addMenu(self.tr("Extract Features with These Values"))
+                    extract_menu.addAction(self.tr("To Temporary Layer"),
+                                           self.extract_features)
+                    extract_menu.addAction(self.tr("To GeoPackage…"),
+                                           self.extract_features_to_file)
+                    if self.values_styleable:
+                        context_menu.addAction(QgsApplication.getThemeIcon("/symbologyEdit.svg"),
+                                               self.tr("Style by These Values"),
+                                               self.style_by_values)
                     context_menu.addSeparator()
                     # Feature Selection Actions for "all values are selected"
-                    if (len(items) == self.listWidget.count() and
-                            self.selectedOnlyBtn.isChecked() is False):
+                    if (len(items) == self.value_count and
+                            self.all_features_scope):
                         if (self.active_layer.selectedFeatureCount() ==
                                 self.active_layer.featureCount()):
                             context_menu.addAction(QgsApplication.getThemeIcon("/mActionDeselectActiveLayer.svg"),
@@ -746,24 +1411,207 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                 return True
         return super(UniqueValuesViewerDockWidget, self).eventFilter(source, event)
 
+    def expand_bin(self) -> None:
+        """Inserts the distinct values of the selected histogram bin or
+        time bucket with their number of features below the bin."""
+        bin_item = self.listWidget.selectedItems()[0]
+        idx = self.active_layer.fields().indexFromName(self.active_field)
+        request = self.attribute_request(idx)
+        request.setFilterExpression(bin_item.data(EXPRESSION_ROLE))
+
+        with self.profiler.run('Expand bin', **self.profile_info()):
+            # only histogram bins have a numeric range, time buckets do not
+            bin_range = bin_item.data(RANGE_ROLE)
+            counts = None if bin_range is None else self.native_range_counts(idx, *bin_range)
+            if counts is None:
+                features = self.profiler.iterate('fetch', self.scoped_features(request))
+                with self.profiler.stage('dedup'):
+                    counts = Counter(feat.attributes()[idx] for feat in features)
+            with self.profiler.stage('populate'):
+                row = self.listWidget.row(bin_item)
+                for value in sorted(counts, reverse=True):
+                    text = value_to_str(value)
+                    item = QListWidgetItem(f"    {text} ({counts[value]})")
+                    item.setData(VALUE_ROLE, text)
+                    self.listWidget.insertItem(row + 1, item)
+                bin_item.setData(EXPANDED_ROLE, True)
+
+    def expression_literal(self, value: str) -> str:
+        """Returns ``value´´ as literal for expressions on the active field,
+        i.e. numbers unquoted, dates and times converted and strings quoted.
+
+        Parameters:
+            value(str): The value as entered or displayed
+        """
+        if self.field_type in (FieldTypes.INTEGER, FieldTypes.DECIMAL):
+            float(value)  # raises ValueError for no numbers
+            return value
+        quoted = value.replace("'", "''")
+        kind = field_kind(self.active_layer.fields().field(self.active_field))
+        if kind is not None:
+            return f"to_{kind}('{quoted}')"
+        return f"'{quoted}'"
+
+    def export_diagnostics(self) -> None:
+        """Exports the recorded profiling runs to a JSON file."""
+        path, _ = QFileDialog.getSaveFileName(self,
+                                              self.tr('Export Diagnostics'),
+                                              'uvv_diagnostics.json',
+                                              self.tr('JSON files (*.json)'))
+        if path:
+            self.profiler.export_json(path)
+
+    def extract_features(self, path: str = None) -> None:
+        """Writes the features with the selected values in the scope of
+        the calculation to a new temporary layer or GeoPackage in a
+        background task. Unlike copy_features, the selection of the layer
+        is not changed and the features are not copied to the clipboard.
+
+        Parameters:
+            path(str): Path of the GeoPackage, None for a temporary layer
+        """
+        layer = self.active_layer
+        items = self.listWidget.selectedItems()
+        name = f"{layer.name()} {item_value(items[0])}" if len(items) == 1 else f"{layer.name()} extract"
+        if items[0] is self.listWidget.null_item:
+            name = f"{layer.name()} NULL"
+
+        expression = None
+        if not (len(items) == self.value_count and self.all_features_scope):
+            expression = self.build_expression()
+        request = self.scope_request(QgsFeatureRequest())
+        # the ids of the selection would replace a filter expression
+        if expression is not None and request.filterType() != QgsFeatureRequest.FilterFids:
+            request.setFilterExpression(expression)
+            expression = None
+        total = (layer.selectedFeatureCount() if self.selectedOnlyBtn.isChecked() is True
+                 else layer.featureCount())
+
+        if path is None:
+            target = QgsMemoryProviderUtils.createMemoryLayer(name, layer.fields(), layer.wkbType(), layer.crs())
+            sink = target.dataProvider()
+        else:
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = 'GPKG'
+            options.layerName = name
+            options.fileEncoding = 'UTF-8'
+            sink = QgsVectorFileWriter.create(path, layer.fields(), layer.wkbType(), layer.crs(),
+                                              self.project.transformContext(), options)
+            if sink.hasError() != QgsVectorFileWriter.NoError:
+                self.iface.messageBar().pushMessage("Extract features:", sink.errorMessage(),
+                                                    level=Qgis.Critical)
+                return None
+            target = None
+
+        task = ExtractFeaturesTask(QgsVectorLayerFeatureSource(layer), request, sink, layer.fields(),
+                                   expression, total)
+        task.taskCompleted.connect(lambda: self.finish_extract(task, target, path, name))
+        task.taskTerminated.connect(lambda: self.finish_extract(task, None, path, name))
+        # the python object of the task has to be kept alive
+        self.extract_tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def extract_features_to_file(self) -> None:
+        """Asks for a GeoPackage and extracts the features with the
+        selected values to it."""
+        path, _ = QFileDialog.getSaveFileName(self,
+                                              self.tr('Extract Features'),
+                                              f"{self.active_layer.name()}.gpkg",
+                                              self.tr('GeoPackage (*.gpkg)'))
+        if path:
+            self.extract_features(path)
+
+    def finish_extract(self, task, target, path: str, name: str) -> None:
+        """Adds the layer of the extracted features to the project, or
+        reports why the extraction failed.
+
+        Parameters:
+            task(ExtractFeaturesTask): The finished or terminated task
+            target(QgsVectorLayer): The temporary layer, None for a GeoPackage
+                or a terminated task
+            path(str): Path of the GeoPackage, None for a temporary layer
+            name(str): Name of the new layer
+        """
+        self.extract_tasks.remove(task)
+        # deleting the file writer closes the file
+        task.sink = None
+        if task.error is not None:
+            self.iface.messageBar().pushMessage("Extract features:", task.error, level=Qgis.Critical)
+            return None
+        if task.isCanceled():
+            return None
+        if target is None and path is not None:
+            target = QgsVectorLayer(f"{path}|layername={name}", name, 'ogr')
+        if target is not None:
+            self.project.addMapLayer(target)
+            self.iface.messageBar().pushMessage("Extract features:", f"{task.count} features written to {name}",
+                                                level=Qgis.Info, duration=3)
+
+    def finish_remote_values(self, task) -> None:
+        """Shows all values fetched by ``task´´ in the current sort order.
+        If the server does not support the requests, the values are
+        calculated from the features instead.
+
+        Parameters:
+            task(RemoteValuesTask): The finished or terminated task
+        """
+        if task is not self.remote_task:
+            return None
+        self.remote_task = None
+        if task.isCanceled():
+            # canceled in the task manager, the pages shown are incomplete
+            self.clear_listWidget()
+            self.valuesLbl.setText(self.tr("Unique values [canceled]"))
+            return None
+        if task.error is not None:
+            QgsMessageLog.logMessage(f"Fetching values failed, using features: {task.error}",
+                                     level=Qgis.Warning)
+            self.clear_listWidget()
+            with self.profiler.run('Update values', **self.profile_info()):
+                self._update_values()
+            return None
+
+        values = set(task.values)
+        self.field_contains_null = 'NULL' in values
+        values.discard('NULL')
+        self.no_features_selected = not values and not self.field_contains_null
+        if self.no_features_selected:
+            self.listWidget.clear()
+            self.set_no_features()
+            return None
+        self.unique_values = values
+        self.show_values()
+        self.valuesLbl.setText(self.tr("Unique values [{}]").format(self.value_count))
+        if self.sortOptionBtn.isChecked() is True:
+            self.sortValuesBtn.setEnabled(True)
+
     def filter_layer(self) -> None:
         """Filter layer based on selected unique values in dockwidget."""
-        expr = self.build_expression()
-        self.active_layer.setSubsetString(expr)
-        # Remove non-filtered values from listWidget and unique values property
-        # when live update is not active
-        if not self.liveUpdateBtn.isChecked() is True:
-            self.valueSearch.clearValue()
-            items = self.listWidget.selectedItems()
-            self.listWidget.switchSelectedItems()
-            delete_list_widget_items(self.listWidget.selectedItems(), self.listWidget)
-            self.intersect_values(items)
+        with self.profiler.run('Filter layer', **self.profile_info()):
+            with self.profiler.stage('expression'):
+                expr = self.build_expression()
+            with self.profiler.stage('filter'):
+                self.active_layer.setSubsetString(expr)
+            # Remove non-filtered values from listWidget and unique values property
+            # when live update is not active
+            if not self.liveUpdateBtn.isChecked() is True:
+                self.valueSearch.clearValue()
+                items = self.listWidget.selectedItems()
+                with self.profiler.stage('populate'):
+                    self.listWidget.switchSelectedItems()
+                    delete_list_widget_items(self.listWidget.selectedItems(), self.listWidget)
+                self.intersect_values(items)
+
+    def invalidate_caches(self) -> None:
+        """Discards cached values when the data of the layer changed."""
+        self.extent_cache.invalidate()
+        self.value_cache.clear()
 
     def intersect_values(self, items) -> None:
         """Intersects values corresponding to ``items´´ with unique values property
         @param items: List[QListWidgetItem]
         """
-        values_to_intersect = {item.text() for item in items}
+        values_to_intersect = {item_value(item) for item in items}
         self.unique_values &= values_to_intersect
 
     def keyPressEvent(self, event) -> None:
@@ -775,14 +1623,227 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
               {Qt.Key_Return, Qt.Key_Enter}):
             self.listWidget.setFocus()
 
+    def native_engines_usable(self, *indexes) -> bool:
+        """Returns True if the values of the active field and the fields
+        with ``indexes´´ may be read directly from the data source: the
+        option is enabled, the active field is a string or number, all
+        fields come from the provider, the layer has no unsaved changes and
+        the values are not restricted to the visible extent.
+
+        Parameters:
+            indexes(int): Indexes of the fields
+        """
+        layer = self.active_layer
+        return (self.settings.value('native_engines', type=int) == 2
+                and self.extentOnlyBtn.isChecked() is False
+                and self.field_type in (FieldTypes.STRING, FieldTypes.INTEGER, FieldTypes.DECIMAL)
+                and all(layer.fields().fieldOrigin(idx) == QgsFields.OriginProvider for idx in indexes)
+                and not (layer.editBuffer() is not None and layer.editBuffer().isModified()))
+
+    def native_group_aggregates(self, idx_a: int, idx_b: int, numeric: bool) -> dict:
+        """Returns the GroupAggregates of the field with index ``idx_b´´ per
+        value of the active field computed by a GROUP BY query on the data
+        source of the active layer, or None if it is not supported.
+
+        Parameters:
+            idx_a(int): Index of the active field
+            idx_b(int): Index of the aggregated field
+            numeric(bool): True if the aggregated field is numeric
+        """
+        layer = self.active_layer
+        source = ogr_layer_source(layer)
+        if source is None or not self.native_engines_usable(idx_a, idx_b):
+            return None
+        fids = layer.selectedFeatureIds() if self.selectedOnlyBtn.isChecked() is True else None
+        with self.profiler.stage('fetch'):
+            rows = grouped_aggregates(*source, self.active_field, layer.fields().at(idx_b).name(), fids=fids)
+        if rows is None:
+            return None
+        self.profiler.annotate('engine', 'ogr_sql')
+        return {'NULL' if value is None else str(value):
+                GroupAggregates(count, total if numeric else None, minimum, maximum, distinct, value_count)
+                for value, (count, total, minimum, maximum, distinct, value_count) in rows.items()}
+
+    def native_range_counts(self, idx: int, lower: float, upper: float, include_upper: bool) -> Counter:
+        """Returns the number of features per value of the numeric active
+        field within a range, read from the row groups of a Parquet file
+        whose statistics overlap the range, or None if the active layer is
+        not a Parquet file or the scope of the calculation is not supported.
+
+        Parameters:
+            idx(int): Index of the active field
+            lower(float): Lower bound of the range
+            upper(float): Upper bound of the range
+            include_upper(bool): True if the upper bound belongs to the range
+        """
+        layer = self.active_layer
+        if (self.settings.value('native_engines', type=int) != 2
+                or not self.all_features_scope
+                or layer.fields().fieldOrigin(idx) != QgsFields.OriginProvider
+                or (layer.editBuffer() is not None and layer.editBuffer().isModified())):
+            return None
+        source = ogr_layer_source(layer)
+        if source is None or source[2] or not is_parquet(source[0]):
+            return None
+        with self.profiler.stage('fetch'):
+            counts = parquet_range_counts(source[0], self.active_field, lower, upper, include_upper)
+        if counts is not None:
+            self.profiler.annotate('engine', 'parquet')
+            self.profiler.count_features(sum(counts.values()))
+        return counts
+
+    def native_value_counts(self, idx: int, limit: int = None) -> Counter:
+        """Returns the number of features per value of the active field
+        as strings, read directly from the data source of the active layer,
+        or None if the data source or the scope of the calculation is not
+        supported. The caller then falls back to the features.
+
+        Parquet files are counted from their dictionary pages, GeoPackage,
+        Shapefile and FlatGeobuf layers by a GROUP BY query, other OGR
+        layers from their Arrow stream (GDAL >= 3.6) and delimited text
+        layers by parsing only the column of the field.
+
+        Parameters:
+            idx(int): Index of the active field
+            limit(int): Maximum number of values, the most frequent first
+        """
+        layer = self.active_layer
+        if not self.native_engines_usable(idx):
+            return None
+        fids = layer.selectedFeatureIds() if self.selectedOnlyBtn.isChecked() is True else None
+        source = ogr_layer_source(layer)
+        counts = None
+        if layer.dataProvider().name() == 'delimitedtext':
+            if fids is None and not layer.subsetString():
+                engine = 'csv'
+                with self.profiler.stage('fetch'):
+                    counts = delimited_value_counts(layer.source(), self.active_field, self.field_type)
+        elif source is not None:
+            path, layer_name, subset = source
+            with self.profiler.stage('fetch'):
+                if is_parquet(path) and fids is None and not subset:
+                    engine = 'parquet'
+                    counts = parquet_value_counts(path, self.active_field)
+                if counts is None:
+                    engine = 'ogr_sql'
+                    counts = grouped_value_counts(*source, self.active_field, fids=fids, limit=limit)
+                if counts is None:
+                    engine = 'arrow'
+                    counts = arrow_value_counts(*source, self.active_field, fids=fids)
+        if counts is None:
+            return None
+        self.profiler.annotate('engine', engine)
+        if engine != 'ogr_sql':
+            self.profiler.count_features(sum(counts.values()))
+            if limit is not None:
+                counts = Counter(dict(counts.most_common(limit)))
+        elif limit is None:
+            self.profiler.count_features(sum(counts.values()))
+        with self.profiler.stage('format'):
+            return Counter({'NULL' if value is None else str(value): count
+                            for value, count in counts.items()})
+
+    def open_cross_filter_dialog(self) -> None:
+        """Opens the dialog with linked values of two fields of the active
+        layer, using the features in the scope of the calculation."""
+        if self.active_layer is not None:
+            dialog = CrossFilterDialog(self.active_layer, self.active_field,
+                                       self.scoped_features, self.select_by_expression, self)
+            dialog.show()
+
+    def open_duplicates_dialog(self) -> None:
+        """Opens the dialog listing clusters of duplicate values among the
+        calculated unique values."""
+        if not self.unique_values:
+            self.iface.messageBar().pushMessage("Duplicate values:",
+                                                "Calculate the unique values first",
+                                                level=Qgis.Info,
+                                                duration=2)
+            return None
+        idx = self.active_layer.fields().indexFromName(self.active_field)
+        request = self.scope_request(self.attribute_request(idx))
+        dialog = DuplicatesDialog(self.active_layer, self.active_field, self.unique_values,
+                                  request, self.select_values, self)
+        dialog.show()
+
+    def open_profile_dialog(self) -> None:
+        """Opens the dialog profiling all fields of the active layer."""
+        if self.active_layer is not None:
+            dialog = LayerProfileDialog(self.active_layer, self.show_profiled_field, self)
+            dialog.show()
+
+    def open_group_statistics_dialog(self) -> None:
+        """Opens the dialog with aggregates of another field per value of
+        the active field, using the features in the scope of the calculation."""
+        if self.active_layer is not None and self.active_field:
+            dialog = GroupStatisticsDialog(self.active_layer, self.active_field,
+                                           self.calc_group_aggregates, self.select_values, self)
+            dialog.show()
+
+    def open_multi_layer_dialog(self) -> None:
+        """Opens the dialog to combine the unique values of several layers."""
+        dialog = MultiLayerDialog(self.active_field, self)
+        dialog.exec_()
+
+    def open_point_cloud_dialog(self) -> None:
+        """Opens the dialog with the values of an attribute of a point cloud layer."""
+        dialog = PointCloudValuesDialog(self)
+        dialog.show()
+
+    def ordered_values(self):
+        """Returns the unique values in the order shown in the list widget."""
+        if self.listWidget.sorting_enabled:
+            return self.sorted_values(self.unique_values, self.sort_action.reverse)
+        return iter(self.unique_values)
+
+    def profile_info(self) -> dict:
+        """Returns information about the active layer and field that is
+        stored together with a profiling run."""
+        if not self.profiler.enabled or self.active_layer is None:
+            return {}
+        if self.selectedOnlyBtn.isChecked() is True:
+            scope = 'selected features'
+        else:
+            scope = 'all features'
+        if self.extentOnlyBtn.isChecked() is True:
+            scope += ' in visible extent'
+        return {'layer': self.active_layer.name(),
+                'provider': self.active_layer.dataProvider().name(),
+                'feature_count': self.active_layer.featureCount(),
+                'field': self.active_field,
+                'field_type': self.field_type.name if self.field_type else None,
+                'scope': scope}
+
+    def remote_source(self):
+        """Returns the source of the active layer if it is a WFS or OGC API
+        Features layer whose values of the active field can be requested
+        directly from the server, otherwise None.
+        """
+        layer = self.active_layer
+        provider = layer.dataProvider().name()
+        idx = layer.fields().indexFromName(self.active_field)
+        if (provider not in REMOTE_PROVIDERS
+                or self.settings.value('native_engines', type=int) != 2
+                or not self.all_features_scope
+                or layer.subsetString()
+                or self.field_type not in (FieldTypes.STRING, FieldTypes.INTEGER, FieldTypes.DECIMAL)
+                or layer.fields().fieldOrigin(idx) != QgsFields.OriginProvider
+                or (layer.editBuffer() is not None and layer.editBuffer().isModified())):
+            return None
+        source = RemoteSource(layer.source(), provider)
+        return source if source.supported else None
+
     def remove_from_selection(self) -> None:
         """ Removes the selected items from the listWidget and the corresponding
         features from the feature selection of the active layer. Also removes
         corresponding values from the unique values property.
         """
-        expr = self.build_expression()
-        self.active_layer.selectByExpression(expr,
-                                             behavior=QgsVectorLayer.RemoveFromSelection)
+        with self.profiler.run('Remove from selection', **self.profile_info()):
+            with self.profiler.stage('expression'):
+                expr = self.build_expression()
+            with self.profiler.stage('selection'):
+                self.select_by_expression(expr,
+                                          behavior=QgsVectorLayer.RemoveFromSelection)
 
         items = self.listWidget.selectedItems()
         delete_list_widget_items(items, self.listWidget)
@@ -793,9 +1854,109 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         @param items: List[QListWidgetItem]
         """
         # create set of selected values from selected items
-        values_to_remove = {item.text() for item in items}
+        values_to_remove = {item_value(item) for item in items}
         self.unique_values -= values_to_remove
 
+    def replace_item_value(self, item, old: str, new: str) -> None:
+        """Shows the value ``new´´ instead of ``old´´ in the list widget
+        without calculating the values again. The item is removed if the
+        value ``new´´ is already listed.
+
+        Parameters:
+            item(QListWidgetItem): The item of the value ``old´´
+            old(str): The replaced value
+            new(str): The new value
+        """
+        count = self.value_counts.pop(old, None)
+        if new in self.unique_values:
+            delete_list_widget_items([item], self.listWidget)
+            if count is None or new not in self.value_counts:
+                self.value_counts.pop(new, None)
+            else:
+                self.value_counts[new] += count
+                if self.top_k_mode:
+                    for i in range(self.listWidget.count()):
+                        if item_value(self.listWidget.item(i)) == new:
+                            self.listWidget.item(i).setText(f"{new} ({self.value_counts[new]})")
+                            break
+        else:
+            # the text of the most frequent values ends with the count
+            item.setText(new + item.text()[len(old):])
+            if item.data(VALUE_ROLE) is not None:
+                item.setData(VALUE_ROLE, new)
+            if count is not None:
+                self.value_counts[new] = count
+
+        values = self.unique_values
+        values.discard(old)
+        values.add(new)
+        self.unique_values = values  # discards the search indexes
+        if not self.top_k_mode:
+            self.valuesLbl.setText(self.tr("Unique values [{}]").format(self.value_count))
+
+    def replace_value(self) -> None:
+        """Replaces the selected value of the active field by a new value
+        in the features in the scope of the calculation. In edit mode the
+        values are changed in the edit buffer with a single undo command,
+        otherwise they are changed in the data source in batches after a
+        confirmation. The value is replaced in the list widget afterwards."""
+        layer = self.active_layer
+        item = self.listWidget.selectedItems()[0]
+        old = item_value(item)
+        text, ok = QInputDialog.getText(self, self.tr("Replace Value"),
+                                        self.tr("Replace {} by:").format(old), text=old)
+        if not ok or text == old:
+            return None
+        idx = layer.fields().indexFromName(self.active_field)
+        try:
+            new_value = layer.fields().at(idx).convertCompatible(text)
+        except ValueError as e:
+            self.iface.messageBar().pushMessage("Replace value:", str(e), level=Qgis.Warning)
+            return None
+
+        with self.profiler.run('Replace value', **self.profile_info()):
+            with self.profiler.stage('fetch'):
+                fids = self.value_feature_ids(old)
+            if not fids:
+                return None
+
+            with self.profiler.stage('edit'):
+                if layer.isEditable():
+                    # the old value is passed, so it is not fetched for every feature
+                    old_value = layer.getFeature(fids[0]).attribute(idx)
+                    layer.beginEditCommand(self.tr("Replace {} by {}").format(old, text))
+                    if all(layer.changeAttributeValues(fid, {idx: new_value}, {idx: old_value})
+                           for fid in fids):
+                        layer.endEditCommand()
+                    else:
+                        layer.destroyEditCommand()
+                        self.iface.messageBar().pushMessage("Replace value:", "The values could not be changed",
+                                                            level=Qgis.Critical)
+                        return None
+                else:
+                    answer = QMessageBox.question(
+                        self, self.tr("Replace Value"),
+                        self.tr("The layer is not in edit mode. Change the value of {} features directly "
+                                "in the data source? This cannot be undone.").format(len(fids)))
+                    if answer != QMessageBox.Yes:
+                        return None
+                    provider = layer.dataProvider()
+                    changed = all(provider.changeAttributeValues({fid: {idx: new_value}
+                                                                  for fid in fids[start:start + EDIT_BATCH_SIZE]})
+                                  for start in range(0, len(fids), EDIT_BATCH_SIZE))
+                    # the layer does not notice changes of its data source
+                    self.invalidate_caches()
+                    layer.triggerRepaint()
+                    if not changed:
+                        self.iface.messageBar().pushMessage("Replace value:", "; ".join(provider.errors()),
+                                                            level=Qgis.Critical)
+                        # some batches may have been changed
+                        self.update_values()
+                        return None
+
+            with self.profiler.stage('populate'):
+                self.replace_item_value(item, old, value_to_str(new_value))
+
     def reset_settings(self) -> None:
         """Restores the default settings."""
         self.enable_updates(False)
@@ -803,21 +1964,90 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
 
         self.sortOptionBtn.setCheckState(self.settings.value('value_sort', type=int))
         self.syncLayerBtn.setCheckState(self.settings.value('sync_layer', type=int))
+        self.fuzzySearchBtn.setCheckState(self.settings.value('fuzzy_search', type=int))
+        self.nativeEnginesBtn.setCheckState(self.settings.value('native_engines', type=int))
+        self.profilingBtn.setCheckState(self.settings.value('profiling', type=int))
+        self.profilingMemoryBtn.setCheckState(self.settings.value('profiling_memory', type=int))
+        self.memoryBudgetSpin.setValue(self.settings.value('memory_budget', type=int))
+        self.histogramBinsSpin.setValue(self.settings.value('histogram_bins', type=int))
+        self.topKSpin.setValue(self.settings.value('top_k', type=int))
+        self.verifyTopKBtn.setCheckState(self.settings.value('top_k_verify', type=int))
         self.runTasksBtn.setCheckState(self.settings.value('background_proc', type=int))
         self.newLineBtn.setCheckState(self.settings.value('copy_newline', type=int))
         self.quoteCharBox.setCurrentText(self.settings.value('quote_char'))
         self.sepCharBox.setCurrentText(self.settings.value('sep_char'))
 
+    def scope_request(self, request: QgsFeatureRequest) -> QgsFeatureRequest:
+        """Restricts ``request´´ to the scope of the calculation, i.e. the
+        selected features and/or the features in the visible extent. The
+        request can be used with a feature source in a background task.
+
+        Parameters:
+            request(QgsFeatureRequest): Request for the features
+        """
+        if self.extentOnlyBtn.isChecked() is True:
+            request.setFilterRect(self.visible_extent())
+        if self.selectedOnlyBtn.isChecked() is True:
+            request.setFilterFids(self.active_layer.selectedFeatureIds())
+        return request
+
+    def scoped_features(self, request: QgsFeatureRequest):
+        """Returns the features of the active layer matching ``request´´
+        within the scope of the calculation, i.e. all (filtered) or the
+        selected features and optionally only the ones in the visible extent.
+
+        Parameters:
+            request(QgsFeatureRequest): Request for the features
+        """
+        if self.extentOnlyBtn.isChecked() is True:
+            request.setFilterRect(self.visible_extent())
+        if self.selectedOnlyBtn.isChecked() is True:
+            # the ids of the selection would replace a filter expression
+            if request.filterType() == QgsFeatureRequest.FilterExpression:
+                selected = set(self.active_layer.selectedFeatureIds())
+                return (feat for feat in self.active_layer.getFeatures(request)
+                        if feat.id() in selected)
+            return self.active_layer.getSelectedFeatures(request)
+        return self.active_layer.getFeatures(request)
+
     def search_values(self) -> None:
         """Searches ListWidget for matching values and updates it to
         only show the matching ones."""
         text = self.valueSearch.text()
+        query = parse_query(text)
+        self.search_action.setEnabled(query is not None and self.active_layer is not None)
 
         # disable sort option while searching is active
         self.sortValuesBtn.setEnabled(False)
 
+        # Show all values again when the text was removed
+        if not text:
+            self.show_items()
+
+        # Ranges, comparisons, prefixes and regular expressions are answered
+        # by binary search on the typed values, the fuzzy search by the
+        # normalized values. The results are shown page by page instead of
+        # hiding the other items.
+        elif (self.unique_values and self.valueModeBox.currentIndex() == UNIQUE_VALUES_MODE
+              and (query is not None or self.fuzzySearchBtn.isChecked() is True)):
+            with self.profiler.run('Search values', **self.profile_info()):
+                with self.profiler.stage('search'):
+                    if query is not None:
+                        results = query.matches(self.search_index)
+                    elif self.values_spilled:
+                        # an index of all normalized values would exceed the memory budget
+                        results = stream_search(self.ordered_values(), text)
+                    else:
+                        results = self.fuzzy_index.search(text)
+                with self.profiler.stage('populate'):
+                    self.show_search_results(results,
+                                             query is None and normalize(text) in 'null')
+
         # Only search if text is not empty
-        if text:
+        else:
+            # search all values, not only the ones added to the widget yet
+            self.listWidget.fetchAll()
+
             # TODO: Improve Search, some ideas:
             # - remember which items were selected, so that search can be used to
             #   look for different values and select them one by one with Return Key
@@ -841,24 +2071,95 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                 if item.isHidden():
                     item.setHidden(False)
 
+    def select_search_matches(self) -> None:
+        """Selects the features matching the query of the search bar, e.g.
+        all features with values in a range, without selecting the values."""
+        query = parse_query(self.valueSearch.text())
+        if query is None:
+            return None
+        try:
+            expr = query.expression(self.active_field, self.expression_literal)
+        except ValueError:
+            self.iface.messageBar().pushMessage("Search:",
+                                                "The search values do not match the field type",
+                                                level=Qgis.Warning,
+                                                duration=2)
+            return None
+        with self.profiler.run('Select search matches', **self.profile_info()):
+            with self.profiler.stage('selection'):
+                if self.selectedOnlyBtn.isChecked() is True:
+                    self.select_by_expression(expr, behavior=QgsVectorLayer.IntersectSelection)
+                else:
+                    self.select_by_expression(expr)
+        QgsMessageLog.logMessage(f"Selection Expression: {expr}", level=Qgis.Info)
+
+    def select_values(self, values) -> None:
+        """Selects the features with one of the ``values´´ of the active field.
+
+        Parameters:
+            values(List[str]): The values as displayed
+        """
+        literals = ','.join(self.expression_literal(value) for value in values if value != 'NULL')
+        parts = [f"\"{self.active_field}\" in ({literals})"] if literals else []
+        if 'NULL' in values:
+            parts.append(f"\"{self.active_field}\" is NULL")
+        expr = ' or '.join(parts)
+        if not expr:
+            return None
+        if self.selectedOnlyBtn.isChecked() is True:
+            self.select_by_expression(expr, behavior=QgsVectorLayer.IntersectSelection)
+        else:
+            self.select_by_expression(expr)
+
     def select_features(self) -> None:
         """Select features corresponding to selected values from the listWidget."""
         items = self.listWidget.selectedItems()
-        # Select all features if all values are selected
-        if (len(items) == self.listWidget.count() and
-                self.selectedOnlyBtn.isChecked() is False):
-            self.active_layer.selectAll()
-        else:
-            expr = self.build_expression()
-            if self.selectedOnlyBtn.isChecked() is False:
-                self.active_layer.selectByExpression(expr)
+        with self.profiler.run('Select features', **self.profile_info()):
+            # Select all features if all values are selected
+            if (len(items) == self.value_count and
+                    self.all_features_scope):
+                with self.profiler.stage('selection'):
+                    self.active_layer.selectAll()
             else:
-                self.active_layer.selectByExpression(expr,
-                                                     behavior=QgsVectorLayer.IntersectSelection)
-                self.listWidget.switchSelectedItems()
-                delete_list_widget_items(self.listWidget.selectedItems(), self.listWidget)
-                self.intersect_values(items)
-            QgsMessageLog.logMessage(f"Selection Expression: {expr}", level=Qgis.Info)
+                with self.profiler.stage('expression'):
+                    expr = self.build_expression()
+                with self.profiler.stage('selection'):
+                    if self.selectedOnlyBtn.isChecked() is False:
+                        self.select_by_expression(expr)
+                    else:
+                        self.select_by_expression(expr,
+                                                  behavior=QgsVectorLayer.IntersectSelection)
+                if self.selectedOnlyBtn.isChecked() is True:
+                    with self.profiler.stage('populate'):
+                        self.listWidget.switchSelectedItems()
+                        delete_list_widget_items(self.listWidget.selectedItems(), self.listWidget)
+                    self.intersect_values(items)
+                QgsMessageLog.logMessage(f"Selection Expression: {expr}", level=Qgis.Info)
+
+    def select_by_expression(self, expr: str, behavior=QgsVectorLayer.SetSelection) -> None:
+        """Selects the features matching ``expr´´ with ``behavior´´. If
+        'Visible extent only' is checked, only features within the visible
+        map extent are selected."""
+        if self.extentOnlyBtn.isChecked() is True:
+            request = QgsFeatureRequest()
+            request.setFilterExpression(expr)
+            request.setFilterRect(self.visible_extent())
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setNoAttributes()
+            fids = [feat.id() for feat in self.active_layer.getFeatures(request)]
+            self.active_layer.selectByIds(fids, behavior)
+        else:
+            self.active_layer.selectByExpression(expr, behavior)
+
+    def set_no_features(self) -> None:
+        """Disables the selection of the list widget and adds a placeholder
+        item when no features are in the scope of the calculation."""
+        if self.selectedOnlyBtn.isChecked() is True:
+            self.listWidget.setNoSelection()
+        elif self.extentOnlyBtn.isChecked() is True:
+            self.listWidget.setNoSelection("No features in visible extent")
+        else:
+            self.listWidget.setNoSelection("No features")
 
     def setting_changed(self, key: str, value: str) -> None:
         """Change the setting ``key´´ to ``value´´.
@@ -869,16 +2170,60 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         """
         self.settings.setValue(key, value)
 
+    def show_profiled_field(self, layer, field_name: str, values) -> None:
+        """Shows the values of a field profiled with 'Profile Layer'. The
+        values of all features are cached, so they are not calculated again.
+
+        Parameters:
+            layer(QgsVectorLayer): The profiled layer
+            field_name(str): Name of the field
+            values(set): The values as strings, None if there were too many
+        """
+        self.mMapLayerComboBox.setLayer(layer)
+        if self.active_layer is None or self.active_layer.id() != layer.id():
+            return None
+        if values is not None:
+            self.value_cache[self.cache_key(field_name)] = values
+        changed = field_name != self.active_field
+        self.mFieldComboBox.setField(field_name)
+        # change_field only updates the values with live update
+        if not (changed and self.liveUpdateBtn.isChecked() is True):
+            self.update_values()
+
+    def show_search_results(self, values: list, show_null: bool = False) -> None:
+        """Shows only the ``values´´ found by a search in the list widget,
+        added page by page like all values.
+
+        Parameters:
+            values(list): The values found, in the order they are shown
+            show_null(bool): Whether the NULL item matches the search
+        """
+        self.listWidget.clear()
+        self.listWidget.null_item = NullItem()
+        if show_null and self.field_contains_null:
+            self.listWidget.addItem(self.listWidget.null_item)
+        self.listWidget.addItemsLazily(values, len(values))
+        self.search_results_shown = True
+
+    def show_values(self) -> None:
+        """Shows all unique values in the list widget in the current sort order."""
+        self.listWidget.clear()
+        self.search_results_shown = False
+        self.listWidget.null_item = NullItem()
+        if self.field_contains_null:
+            self.listWidget.addItem(self.listWidget.null_item)
+        self.listWidget.addItemsLazily(self.ordered_values(), len(self.unique_values))
+
     def sort_values(self) -> None:
         """Sorts the values in the ListWidget.
         Based on the sort button, ascending or descending sorting is used."""
-        if not self.listWidget.sorting_enabled:
+        # bins, time buckets and most frequent values keep their order
+        if (not self.listWidget.sorting_enabled or self.histogram_mode
+                or self.temporal_unit is not None or self.top_k_mode):
             return None
 
         elif self.unique_values and len(self.unique_values) > 1:
 
-            sort_key = get_sort_key(self.field_type)
-
             # Change sort icon
             if self.sort_action.reverse:
                 self.sortValuesBtn.setIcon(QgsApplication.getThemeIcon('/sort.svg'))
@@ -888,29 +2233,84 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             # Reverse sort order
             self.sort_action.reverse = not self.sort_action.reverse
 
-            # Get a sorted list of unique values
-            unique_values_list = sorted(self.unique_values,
-                                        key=sort_key,
-                                        reverse=self.sort_action.reverse)
+            with self.profiler.run('Sort values', **self.profile_info()):
+                # Get a sorted list of unique values
+                with self.profiler.stage('sort'):
+                    unique_values_list = self.sorted_values(self.unique_values,
+                                                            self.sort_action.reverse)
 
-            # Update ListWidget with sorted values
-            self.clear_listWidget()
-            if self.field_contains_null:
-                self.listWidget.addItem(self.listWidget.null_item)
-            self.listWidget.addItems(unique_values_list)
-            self.valuesLbl.setText(f"Unique values [{len(self.unique_values)}]")
-            self.sortValuesBtn.setEnabled(True)
+                # Update ListWidget with sorted values
+                with self.profiler.stage('populate'):
+                    self.clear_listWidget()
+                    if self.field_contains_null:
+                        self.listWidget.addItem(self.listWidget.null_item)
+                    self.listWidget.addItemsLazily(unique_values_list, len(self.unique_values))
+                self._fuzzy_index = None
+                self.valuesLbl.setText(f"Unique values [{len(self.unique_values)}]")
+                self.sortValuesBtn.setEnabled(True)
+
+    def sorted_values(self, values, reverse: bool):
+        """Returns ``values´´ sorted by the sort key of the active field.
+        Values of a UniqueValueStore are sorted by the store."""
+        sort_key = get_sort_key(self.field_type)
+        if isinstance(values, UniqueValueStore):
+            return values.sorted_values(sort_key, reverse)
+        return sorted(values, key=sort_key, reverse=reverse)
+
+    def show_diagnostics(self) -> None:
+        """Shows the report of the last profiling run in the diagnostics
+        section of the settings tab and the message log."""
+        report = self.profiler.report()
+        self.diagnosticsText.setPlainText(report)
+        QgsMessageLog.logMessage(report, 'UniqueValuesViewer', level=Qgis.Info)
 
     def show_items(self) -> None:
-        """Makes all items of the listWidget unhidden."""
+        """Makes all items of the listWidget unhidden, or shows all values
+        again if only the results of a search were shown."""
         # disable sort option while searching is active
         if self.sortOptionBtn.isChecked() is True:
             self.sortValuesBtn.setEnabled(True)
 
+        if self.search_results_shown:
+            self.show_values()
+            return None
+
         for i in range(self.listWidget.count()):
             if self.listWidget.item(i).isHidden():
                 self.listWidget.item(i).setHidden(False)
 
+    def start_remote_values(self, source: RemoteSource) -> None:
+        """Fetches the values of the active field from the server of a WFS
+        or OGC API Features layer in a background task. The values are
+        added to the list widget page by page as they arrive.
+
+        Parameters:
+            source(RemoteSource): Source of the active layer
+        """
+        self.unique_values = set()
+        self.field_contains_null = False
+        self.valuesLbl.setText(self.tr("Unique values [loading …]"))
+        task = RemoteValuesTask(source, self.active_field, self.field_type)
+        task.pageFetched.connect(lambda values: self.add_remote_values(task, values))
+        task.taskCompleted.connect(lambda: self.finish_remote_values(task))
+        task.taskTerminated.connect(lambda: self.finish_remote_values(task))
+        self.remote_task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def style_by_values(self) -> None:
+        """Styles the active layer with a categorized renderer with a
+        category for each selected value in the order of the list widget.
+        The categories are created from the values, so the layer is not
+        scanned again, and the labels show the number of features if the
+        values were counted by the last calculation."""
+        items = sorted(self.listWidget.selectedItems(), key=self.listWidget.row)
+        values = ['NULL' if item is self.listWidget.null_item else item_value(item) for item in items]
+        renderer = categorized_renderer(self.active_layer, self.active_field, self.field_type,
+                                        values, self.value_counts)
+        self.active_layer.setRenderer(renderer)
+        self.active_layer.triggerRepaint()
+        self.iface.layerTreeView().refreshLayerSymbology(self.active_layer.id())
+
     def sync_iface_layer_changed(self, layer) -> None:
         """Sets the new active layer of the QGIS interface to be the
         current layer in the combobox if its data provider is not in
@@ -927,6 +2327,75 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
                 self.clear_listWidget()
                 self.mMapLayerComboBox.setLayer(layer)
 
+    def value_feature_ids(self, value: str) -> list:
+        """Returns the ids of the features in the scope of the calculation
+        with ``value´´ of the active field. If the values of the features in
+        the visible extent are cached, the ids are looked up by their values,
+        otherwise only the features matching ``value´´ are fetched.
+
+        Parameters:
+            value(str): The selected value
+        """
+        idx = self.active_layer.fields().indexFromName(self.active_field)
+        key = (self.active_layer.id(), self.active_field, self.active_layer.subsetString())
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        if (self.extentOnlyBtn.isChecked() is True and
+                self.extent_cache.covers(key, self.visible_extent())):
+            fids = self.extent_cache.feature_ids(value)
+            request.setNoAttributes()
+            return [feat.id() for feat in self.scoped_features(request) if feat.id() in fids]
+        field = QgsExpression.quotedColumnRef(self.active_field)
+        if value == 'NULL':
+            request.setFilterExpression(f"{field} is Null")
+        else:
+            request.setFilterExpression(f"{field} = {self.expression_literal(value)}")
+        request.setSubsetOfAttributes([idx])
+        return [feat.id() for feat in self.scoped_features(request)]
+
+    def visible_extent(self):
+        """Returns the visible extent of the map canvas in the CRS of
+        the active layer."""
+        canvas = self.iface.mapCanvas()
+        transform = QgsCoordinateTransform(canvas.mapSettings().destinationCrs(),
+                                           self.active_layer.crs(),
+                                           self.project)
+        try:
+            return transform.transformBoundingBox(canvas.extent())
+        except QgsCsException:
+            return self.active_layer.extent()
+
+    def update_value_modes(self, field) -> None:
+        """Enables the value modes available for the type of ``field´´:
+        the histogram for numeric fields and the temporal buckets for date
+        and time fields. Falls back to the unique values if the current
+        mode is not available.
+
+        Parameters:
+            field(QgsField): The active field
+        """
+        available = {UNIQUE_VALUES_MODE, TOP_K_MODE}
+        if self.field_type in (FieldTypes.INTEGER, FieldTypes.DECIMAL):
+            available.add(HISTOGRAM_MODE)
+        kind = field_kind(field)
+        if kind == DATE_KIND:
+            # dates have no hours
+            available.update({YEAR_MODE, MONTH_MODE, DAY_MODE})
+        elif kind == DATETIME_KIND:
+            available.update({YEAR_MODE, MONTH_MODE, DAY_MODE, HOUR_MODE})
+        elif kind == TIME_KIND:
+            available.add(HOUR_MODE)
+
+        model = self.valueModeBox.model()
+        for mode in range(self.valueModeBox.count()):
+            model.item(mode).setEnabled(mode in available)
+        # the values are updated by the caller
+        self.valueModeBox.blockSignals(True)
+        if self.valueModeBox.currentIndex() not in available:
+            self.valueModeBox.setCurrentIndex(UNIQUE_VALUES_MODE)
+        self.valueModeBox.blockSignals(False)
+        self.valueModeBox.setEnabled(len(available) > 1)
+
     def update_values(self) -> None:
         """Updates the values in the list widget."""
         # Only do something if the plugin widget is visible to the user
@@ -934,8 +2403,9 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
         # layer is changed
         if self.isUserVisible():
             # Clear listWidget and search bar before updating values
-            self.valueSearch.clearValue()
+            self.cancel_remote_task()
             self.clear_listWidget()
+            self.valueSearch.clearValue()
 
             # Reset selection mode of listWidget if it was previously changed
             # due to no features selected
@@ -946,44 +2416,151 @@ class UniqueValuesViewerDockWidget(QgsDockWidget, FORM_CLASS):
             if self.mMapLayerComboBox.currentLayer() is not None:
                 QgsMessageLog.logMessage("Update Values", level=Qgis.Info)
 
-                self.unique_values = set()
-                try:
-                    values = self.calc_unique_values()  # sets no_features_selected
+                source = self.remote_source()
+                if self.histogram_mode:
+                    with self.profiler.run('Update histogram', **self.profile_info()):
+                        self._update_histogram()
+                elif self.temporal_unit is not None:
+                    with self.profiler.run('Update time buckets', **self.profile_info()):
+                        self._update_temporal_buckets()
+                elif self.top_k_mode:
+                    with self.profiler.run('Update most frequent values', **self.profile_info()):
+                        self._update_top_values()
+                elif source is not None:
+                    self.start_remote_values(source)
+                else:
+                    with self.profiler.run('Update values', **self.profile_info()):
+                        self._update_values()
+
+    def _update_histogram(self) -> None:
+        """Calculates the histogram of the numeric active field and adds
+        the bins as items to the list widget. Each bin stores the
+        expression of its range, which is used to select its features."""
+        self.unique_values = set()
+        summary = self.calc_histogram()  # sets no_features_selected
+        if summary is None:
+            self.set_no_features()
+            return None
 
-                    # If no features are selected when ``Selected Features Only´´ is active
-                    # disable selection in listWidget and add placeholder item
-                    if self.no_features_selected:
-                        self.listWidget.setNoSelection()
+        field = self.active_field
+        last = len(summary.bins) - 1
+        with self.profiler.stage('populate'):
+            self.field_contains_null = summary.null_count > 0
+            if self.field_contains_null:
+                self.listWidget.null_item.setToolTip(f"{summary.null_count} features")
+                self.listWidget.addItem(self.listWidget.null_item)
+            for i, (lower, upper, count) in enumerate(summary.bins):
+                # the last bin includes the maximum
+                bracket, operator = (']', '<=') if i == last else (')', '<')
+                item = QListWidgetItem(f"[{lower:g}, {upper:g}{bracket} ({count})")
+                item.setData(EXPRESSION_ROLE, f"\"{field}\" >= {format_number(lower)} and "
+                                              f"\"{field}\" {operator} {format_number(upper)}")
+                item.setData(RANGE_ROLE, (lower, upper, i == last))
+                self.listWidget.addItem(item)
+        self.valuesLbl.setText(f"Histogram [{len(summary.bins)} bins]")
+        self.valuesLbl.setToolTip(summary.describe())
+
+    def _update_top_values(self) -> None:
+        """Calculates the most frequent values of the active field and adds
+        them with their number of features to the list widget, the most
+        frequent first."""
+        self.unique_values = set()
+        self.distinct_count = -1
+        top = self.calc_top_values()  # sets no_features_selected
+        if top is None:
+            self.set_no_features()
+            return None
 
-                    elif values:
-                        if self.field_contains_null:
-                            self.listWidget.addItem(self.listWidget.null_item)
-                            self.valuesLbl.setText(f"Unique values [{len(values) + 1}]")
-                        else:
-                            self.valuesLbl.setText(f"Unique values [{len(values)}]")
-                    # in case an empty list or None is returned by calc_unique_values
-                    else:
-                        self.listWidget.addItem(self.listWidget.null_item)
-                        self.valuesLbl.setText(f"Unique values [1]")
+        with self.profiler.stage('populate'):
+            self.field_contains_null = False
+            for value, count, error in top:
+                count_text = f"≈{count}" if error else str(count)
+                if value in ('NULL', 'None'):
+                    self.field_contains_null = True
+                    item = self.listWidget.null_item
+                    item.setText(f"{item.text()} ({count_text})")
+                else:
+                    item = QListWidgetItem(f"{value} ({count_text})")
+                    item.setData(VALUE_ROLE, value)
+                if error:
+                    item.setToolTip(f"At most {error} features less")
+                self.listWidget.addItem(item)
+        self.unique_values = {value for value, _, _ in top if value not in ('NULL', 'None')}
+        self.value_counts = {'NULL' if value == 'None' else value: count
+                             for value, count, error in top if not error}
+        self.valuesLbl.setText(f"Most frequent values [{len(top)}]")
+        if self.distinct_count >= 0:
+            self.valuesLbl.setToolTip(f"Distinct values: {self.distinct_count}")
+
+    def _update_temporal_buckets(self) -> None:
+        """Calculates the number of features per year, month, day or hour
+        of the date/time active field and adds the buckets as items to the
+        list widget. Each bucket stores the expression of its time range,
+        which is used to select its features."""
+        self.unique_values = set()
+        counts = self.calc_temporal_buckets()  # sets no_features_selected
+        if counts is None:
+            self.set_no_features()
+            return None
 
-                except SystemError:
-                    self.iface.messageBar().pushMessage("Error",
-                                                        "An error occurred when calculating the unique values",
-                                                        level=Qgis.Critical,
-                                                        duration=2)
-                    traceback.print_exc()
+        unit = self.temporal_unit
+        kind = field_kind(self.active_layer.fields().field(self.active_field))
+        with self.profiler.stage('populate'):
+            null_count = counts.pop(None, 0)
+            self.field_contains_null = null_count > 0
+            if self.field_contains_null:
+                self.listWidget.null_item.setToolTip(f"{null_count} features")
+                self.listWidget.addItem(self.listWidget.null_item)
+            for key in sorted(counts):
+                item = QListWidgetItem(f"{bucket_label(key, kind)} ({counts[key]})")
+                item.setData(EXPRESSION_ROLE, bucket_expression(self.active_field, key, unit, kind))
+                self.listWidget.addItem(item)
+        self.valuesLbl.setText(f"{unit}s [{len(counts)}]")
+        self.valuesLbl.setToolTip(f"Features: {sum(counts.values()) + null_count}\nNULL: {null_count}")
+
+    def _update_values(self) -> None:
+        """Calculates the unique values and adds them to the list widget."""
+        self.unique_values = set()
+        try:
+            values = self.calc_unique_values()  # sets no_features_selected
+
+            # If no features are selected when ``Selected Features Only´´ is active
+            # disable selection in listWidget and add placeholder item
+            if self.no_features_selected:
+                if self.selectedOnlyBtn.isChecked() is True:
+                    self.listWidget.setNoSelection()
                 else:
-                    if self.sortOptionBtn.isChecked() is True:
-                        self.sortValuesBtn.setEnabled(True)
-
-                    # Add unique values as items to listWidget
-                    if self.listWidget.sorting_enabled:
-                        sort_key = get_sort_key(self.field_type)
-                        self.listWidget.addItems(sorted(values,
-                                                        key=sort_key,
-                                                        reverse=self.sort_action.reverse))
-                    else:
-                        self.listWidget.addItems(list(values))
+                    self.listWidget.setNoSelection("No features in visible extent")
+
+            elif values:
+                if self.field_contains_null:
+                    self.listWidget.addItem(self.listWidget.null_item)
+                    self.valuesLbl.setText(f"Unique values [{len(values) + 1}]")
+                else:
+                    self.valuesLbl.setText(f"Unique values [{len(values)}]")
+            # in case an empty list or None is returned by calc_unique_values
+            else:
+                self.listWidget.addItem(self.listWidget.null_item)
+                self.valuesLbl.setText(f"Unique values [1]")
+
+        except SystemError:
+            self.iface.messageBar().pushMessage("Error",
+                                                "An error occurred when calculating the unique values",
+                                                level=Qgis.Critical,
+                                                duration=2)
+            traceback.print_exc()
+        else:
+            if self.sortOptionBtn.isChecked() is True:
+                self.sortValuesBtn.setEnabled(True)
+
+            # Add unique values as items to listWidget
+            if self.listWidget.sorting_enabled:
+                with self.profiler.stage('sort'):
+                    values_list = self.sorted_values(values, self.sort_action.reverse)
+            else:
+                values_list = iter(values)
+            with self.profiler.stage('populate'):
+                self.listWidget.addItemsLazily(values_list, len(values))
 
-                    # Update property
-                    self.unique_values = values
+            # Update property
+            self.unique_values = values
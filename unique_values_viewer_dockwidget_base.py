@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'unique_values_viewer_dockwidget.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_UVVDockWidget(object):
+    def setupUi(self, UVVDockWidget):
+        UVVDockWidget.setObjectName("UVVDockWidget")
+        UVVDockWidget.resize(321, 415)
+        UVVDockWidget.setFloating(False)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.gridLayout = QtWidgets.QGridLayout(self.dockWidgetContents)
+        self.gridLayout.setContentsMargins(2, 2, 2, 2)
+        self.gridLayout.setObjectName("gridLayout")
+        self.UVVTabWidget = QtWidgets.QTabWidget(self.dockWidgetContents)
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(247, 247, 247))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(120, 120, 120))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(160, 160, 160))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(247, 247, 247))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 128))
+        brush.setStyle(QtCore.Qt.NoBrush)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(247, 247, 247))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(120, 120, 120))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(160, 160, 160))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(247, 247, 247))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 128))
+        brush.setStyle(QtCore.Qt.NoBrush)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(120, 120, 120))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(247, 247, 247))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(120, 120, 120))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(160, 160, 160))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(120, 120, 120))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(120, 120, 120))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(240, 240, 240))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 128))
+        brush.setStyle(QtCore.Qt.NoBrush)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.PlaceholderText, brush)
+        self.UVVTabWidget.setPalette(palette)
+        self.UVVTabWidget.setObjectName("UVVTabWidget")
+        self.viewerTab = QtWidgets.QWidget()
+        self.viewerTab.setObjectName("viewerTab")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.viewerTab)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.fieldLbl = QtWidgets.QLabel(self.viewerTab)
+        self.fieldLbl.setObjectName("fieldLbl")
+        self.gridLayout_2.addWidget(self.fieldLbl, 4, 0, 1, 1)
+        self.searchLbl = QtWidgets.QLabel(self.viewerTab)
+        self.searchLbl.setObjectName("searchLbl")
+        self.gridLayout_2.addWidget(self.searchLbl, 6, 0, 1, 1)
+        self.valuesLbl = QtWidgets.QLabel(self.viewerTab)
+        self.valuesLbl.setObjectName("valuesLbl")
+        self.gridLayout_2.addWidget(self.valuesLbl, 12, 0, 1, 1)
+        self.valueModeBox = QtWidgets.QComboBox(self.viewerTab)
+        self.valueModeBox.setObjectName("valueModeBox")
+        self.valueModeBox.addItem("")
+        self.valueModeBox.addItem("")
+        self.valueModeBox.addItem("")
+        self.valueModeBox.addItem("")
+        self.valueModeBox.addItem("")
+        self.valueModeBox.addItem("")
+        self.valueModeBox.addItem("")
+        self.gridLayout_2.addWidget(self.valueModeBox, 12, 1, 1, 1)
+        self.mMapLayerComboBox = QgsMapLayerComboBox(self.viewerTab)
+        self.mMapLayerComboBox.setShowCrs(True)
+        self.mMapLayerComboBox.setObjectName("mMapLayerComboBox")
+        self.gridLayout_2.addWidget(self.mMapLayerComboBox, 1, 0, 1, 3)
+        self.mFieldComboBox = QgsFieldComboBox(self.viewerTab)
+        self.mFieldComboBox.setObjectName("mFieldComboBox")
+        self.gridLayout_2.addWidget(self.mFieldComboBox, 5, 0, 1, 2)
+        self.selectedOnlyBtn = QtWidgets.QCheckBox(self.viewerTab)
+        self.selectedOnlyBtn.setEnabled(True)
+        self.selectedOnlyBtn.setObjectName("selectedOnlyBtn")
+        self.gridLayout_2.addWidget(self.selectedOnlyBtn, 16, 0, 1, 1)
+        self.getValuesBtn = QtWidgets.QPushButton(self.viewerTab)
+        self.getValuesBtn.setObjectName("getValuesBtn")
+        self.gridLayout_2.addWidget(self.getValuesBtn, 5, 2, 1, 1)
+        self.layerLbl = QtWidgets.QLabel(self.viewerTab)
+        self.layerLbl.setObjectName("layerLbl")
+        self.gridLayout_2.addWidget(self.layerLbl, 0, 0, 1, 1)
+        self.listWidget = UVVListWidget(self.viewerTab)
+        self.listWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.listWidget.setObjectName("listWidget")
+        self.gridLayout_2.addWidget(self.listWidget, 13, 0, 1, 3)
+        self.clearBtn = QtWidgets.QPushButton(self.viewerTab)
+        self.clearBtn.setObjectName("clearBtn")
+        self.gridLayout_2.addWidget(self.clearBtn, 16, 2, 1, 1)
+        self.valueSearch = QgsFilterLineEdit(self.viewerTab)
+        self.valueSearch.setShowSearchIcon(True)
+        self.valueSearch.setProperty("qgisRelation", "")
+        self.valueSearch.setObjectName("valueSearch")
+        self.gridLayout_2.addWidget(self.valueSearch, 9, 0, 1, 3)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem, 16, 1, 1, 1)
+        self.extentOnlyBtn = QtWidgets.QCheckBox(self.viewerTab)
+        self.extentOnlyBtn.setObjectName("extentOnlyBtn")
+        self.gridLayout_2.addWidget(self.extentOnlyBtn, 17, 0, 1, 1)
+        self.liveUpdateBtn = QtWidgets.QCheckBox(self.viewerTab)
+        self.liveUpdateBtn.setObjectName("liveUpdateBtn")
+        self.gridLayout_2.addWidget(self.liveUpdateBtn, 18, 0, 1, 1)
+        self.sortBtnPlaceholder = QtWidgets.QHBoxLayout()
+        self.sortBtnPlaceholder.setObjectName("sortBtnPlaceholder")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.sortBtnPlaceholder.addItem(spacerItem1)
+        self.toolButton = QtWidgets.QToolButton(self.viewerTab)
+        self.toolButton.setObjectName("toolButton")
+        self.sortBtnPlaceholder.addWidget(self.toolButton)
+        self.gridLayout_2.addLayout(self.sortBtnPlaceholder, 12, 2, 1, 1)
+        self.UVVTabWidget.addTab(self.viewerTab, "")
+        self.settingsTab = QtWidgets.QWidget()
+        self.settingsTab.setObjectName("settingsTab")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.settingsTab)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.generalOptionsGrp = QgsCollapsibleGroupBox(self.settingsTab)
+        self.generalOptionsGrp.setObjectName("generalOptionsGrp")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.generalOptionsGrp)
+        self.verticalLayout_4.setContentsMargins(-1, 2, -1, -1)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.sortOptionBtn = QtWidgets.QCheckBox(self.generalOptionsGrp)
+        self.sortOptionBtn.setChecked(True)
+        self.sortOptionBtn.setObjectName("sortOptionBtn")
+        self.verticalLayout_4.addWidget(self.sortOptionBtn)
+        self.syncLayerBtn = QtWidgets.QCheckBox(self.generalOptionsGrp)
+        self.syncLayerBtn.setChecked(True)
+        self.syncLayerBtn.setObjectName("syncLayerBtn")
+        self.verticalLayout_4.addWidget(self.syncLayerBtn)
+        self.fuzzySearchBtn = QtWidgets.QCheckBox(self.generalOptionsGrp)
+        self.fuzzySearchBtn.setChecked(True)
+        self.fuzzySearchBtn.setObjectName("fuzzySearchBtn")
+        self.verticalLayout_4.addWidget(self.fuzzySearchBtn)
+        self.nativeEnginesBtn = QtWidgets.QCheckBox(self.generalOptionsGrp)
+        self.nativeEnginesBtn.setChecked(True)
+        self.nativeEnginesBtn.setObjectName("nativeEnginesBtn")
+        self.verticalLayout_4.addWidget(self.nativeEnginesBtn)
+        self.memoryBudgetLayout = QtWidgets.QHBoxLayout()
+        self.memoryBudgetLayout.setObjectName("memoryBudgetLayout")
+        self.memoryBudgetLbl = QtWidgets.QLabel(self.generalOptionsGrp)
+        self.memoryBudgetLbl.setObjectName("memoryBudgetLbl")
+        self.memoryBudgetLayout.addWidget(self.memoryBudgetLbl)
+        self.memoryBudgetSpin = QgsSpinBox(self.generalOptionsGrp)
+        self.memoryBudgetSpin.setMaximum(65536)
+        self.memoryBudgetSpin.setSingleStep(64)
+        self.memoryBudgetSpin.setObjectName("memoryBudgetSpin")
+        self.memoryBudgetLayout.addWidget(self.memoryBudgetSpin)
+        self.verticalLayout_4.addLayout(self.memoryBudgetLayout)
+        self.histogramBinsLayout = QtWidgets.QHBoxLayout()
+        self.histogramBinsLayout.setObjectName("histogramBinsLayout")
+        self.histogramBinsLbl = QtWidgets.QLabel(self.generalOptionsGrp)
+        self.histogramBinsLbl.setObjectName("histogramBinsLbl")
+        self.histogramBinsLayout.addWidget(self.histogramBinsLbl)
+        self.histogramBinsSpin = QgsSpinBox(self.generalOptionsGrp)
+        self.histogramBinsSpin.setMinimum(2)
+        self.histogramBinsSpin.setMaximum(1000)
+        self.histogramBinsSpin.setProperty("value", 20)
+        self.histogramBinsSpin.setObjectName("histogramBinsSpin")
+        self.histogramBinsLayout.addWidget(self.histogramBinsSpin)
+        self.verticalLayout_4.addLayout(self.histogramBinsLayout)
+        self.topKLayout = QtWidgets.QHBoxLayout()
+        self.topKLayout.setObjectName("topKLayout")
+        self.topKLbl = QtWidgets.QLabel(self.generalOptionsGrp)
+        self.topKLbl.setObjectName("topKLbl")
+        self.topKLayout.addWidget(self.topKLbl)
+        self.topKSpin = QgsSpinBox(self.generalOptionsGrp)
+        self.topKSpin.setMinimum(1)
+        self.topKSpin.setMaximum(10000)
+        self.topKSpin.setProperty("value", 100)
+        self.topKSpin.setObjectName("topKSpin")
+        self.topKLayout.addWidget(self.topKSpin)
+        self.verticalLayout_4.addLayout(self.topKLayout)
+        self.verifyTopKBtn = QtWidgets.QCheckBox(self.generalOptionsGrp)
+        self.verifyTopKBtn.setObjectName("verifyTopKBtn")
+        self.verticalLayout_4.addWidget(self.verifyTopKBtn)
+        self.verticalLayout.addWidget(self.generalOptionsGrp)
+        self.mGroupBox = QgsCollapsibleGroupBox(self.settingsTab)
+        self.mGroupBox.setObjectName("mGroupBox")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.mGroupBox)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem2, 0, 7, 1, 1)
+        self.sepCharLbl = QtWidgets.QLabel(self.mGroupBox)
+        self.sepCharLbl.setObjectName("sepCharLbl")
+        self.gridLayout_3.addWidget(self.sepCharLbl, 1, 0, 1, 1)
+        self.newLineBtn = QtWidgets.QCheckBox(self.mGroupBox)
+        self.newLineBtn.setChecked(True)
+        self.newLineBtn.setObjectName("newLineBtn")
+        self.gridLayout_3.addWidget(self.newLineBtn, 2, 0, 1, 1)
+        self.quoteCharLbl = QtWidgets.QLabel(self.mGroupBox)
+        self.quoteCharLbl.setObjectName("quoteCharLbl")
+        self.gridLayout_3.addWidget(self.quoteCharLbl, 0, 0, 1, 1)
+        self.sepCharBox = QtWidgets.QComboBox(self.mGroupBox)
+        self.sepCharBox.setEditable(False)
+        self.sepCharBox.setObjectName("sepCharBox")
+        self.sepCharBox.addItem("")
+        self.sepCharBox.addItem("")
+        self.sepCharBox.addItem("")
+        self.sepCharBox.addItem("")
+        self.sepCharBox.addItem("")
+        self.gridLayout_3.addWidget(self.sepCharBox, 1, 2, 1, 1)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem3, 2, 7, 1, 1)
+        self.quoteCharBox = QtWidgets.QComboBox(self.mGroupBox)
+        self.quoteCharBox.setEditable(False)
+        self.quoteCharBox.setObjectName("quoteCharBox")
+        self.quoteCharBox.addItem("")
+        self.quoteCharBox.addItem("")
+        self.quoteCharBox.addItem("")
+        self.quoteCharBox.addItem("")
+        self.quoteCharBox.addItem("")
+        self.quoteCharBox.addItem("")
+        self.gridLayout_3.addWidget(self.quoteCharBox, 0, 2, 1, 1)
+        self.quote_char_custom = QtWidgets.QLineEdit(self.mGroupBox)
+        self.quote_char_custom.setEnabled(False)
+        self.quote_char_custom.setObjectName("quote_char_custom")
+        self.gridLayout_3.addWidget(self.quote_char_custom, 0, 6, 1, 1)
+        self.sep_char_custom = QtWidgets.QLineEdit(self.mGroupBox)
+        self.sep_char_custom.setEnabled(False)
+        self.sep_char_custom.setObjectName("sep_char_custom")
+        self.gridLayout_3.addWidget(self.sep_char_custom, 1, 6, 1, 1)
+        self.verticalLayout.addWidget(self.mGroupBox)
+        self.mGroupBox_2 = QgsCollapsibleGroupBox(self.settingsTab)
+        self.mGroupBox_2.setObjectName("mGroupBox_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.mGroupBox_2)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.rawValuesRBtn = QtWidgets.QRadioButton(self.mGroupBox_2)
+        self.rawValuesRBtn.setChecked(True)
+        self.rawValuesRBtn.setObjectName("rawValuesRBtn")
+        self.dispOptionGrp = QtWidgets.QButtonGroup(UVVDockWidget)
+        self.dispOptionGrp.setObjectName("dispOptionGrp")
+        self.dispOptionGrp.addButton(self.rawValuesRBtn)
+        self.verticalLayout_2.addWidget(self.rawValuesRBtn)
+        self.formValuesRBtn = QtWidgets.QRadioButton(self.mGroupBox_2)
+        self.formValuesRBtn.setObjectName("formValuesRBtn")
+        self.dispOptionGrp.addButton(self.formValuesRBtn)
+        self.verticalLayout_2.addWidget(self.formValuesRBtn)
+        self.bothValuesRBtn = QtWidgets.QRadioButton(self.mGroupBox_2)
+        self.bothValuesRBtn.setObjectName("bothValuesRBtn")
+        self.dispOptionGrp.addButton(self.bothValuesRBtn)
+        self.verticalLayout_2.addWidget(self.bothValuesRBtn)
+        self.verticalLayout.addWidget(self.mGroupBox_2)
+        self.diagnosticsGrp = QgsCollapsibleGroupBox(self.settingsTab)
+        self.diagnosticsGrp.setProperty("collapsed", True)
+        self.diagnosticsGrp.setObjectName("diagnosticsGrp")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.diagnosticsGrp)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.profilingBtn = QtWidgets.QCheckBox(self.diagnosticsGrp)
+        self.profilingBtn.setObjectName("profilingBtn")
+        self.gridLayout_4.addWidget(self.profilingBtn, 0, 0, 1, 3)
+        self.profilingMemoryBtn = QtWidgets.QCheckBox(self.diagnosticsGrp)
+        self.profilingMemoryBtn.setObjectName("profilingMemoryBtn")
+        self.gridLayout_4.addWidget(self.profilingMemoryBtn, 1, 0, 1, 3)
+        self.diagnosticsText = QtWidgets.QPlainTextEdit(self.diagnosticsGrp)
+        self.diagnosticsText.setReadOnly(True)
+        self.diagnosticsText.setObjectName("diagnosticsText")
+        self.gridLayout_4.addWidget(self.diagnosticsText, 2, 0, 1, 3)
+        self.exportDiagnosticsBtn = QtWidgets.QPushButton(self.diagnosticsGrp)
+        self.exportDiagnosticsBtn.setObjectName("exportDiagnosticsBtn")
+        self.gridLayout_4.addWidget(self.exportDiagnosticsBtn, 3, 0, 1, 1)
+        self.clearDiagnosticsBtn = QtWidgets.QPushButton(self.diagnosticsGrp)
+        self.clearDiagnosticsBtn.setObjectName("clearDiagnosticsBtn")
+        self.gridLayout_4.addWidget(self.clearDiagnosticsBtn, 3, 1, 1, 1)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_4.addItem(spacerItem4, 3, 2, 1, 1)
+        self.verticalLayout.addWidget(self.diagnosticsGrp)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem5)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.resetDefaultsBtn = QtWidgets.QPushButton(self.settingsTab)
+        self.resetDefaultsBtn.setObjectName("resetDefaultsBtn")
+        self.horizontalLayout.addWidget(self.resetDefaultsBtn)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem6)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.UVVTabWidget.addTab(self.settingsTab, "")
+        self.gridLayout.addWidget(self.UVVTabWidget, 0, 0, 1, 1)
+        UVVDockWidget.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(UVVDockWidget)
+        self.UVVTabWidget.setCurrentIndex(1)
+        QtCore.QMetaObject.connectSlotsByName(UVVDockWidget)
+
+    def retranslateUi(self, UVVDockWidget):
+        _translate = QtCore.QCoreApplication.translate
+        UVVDockWidget.setWindowTitle(_translate("UVVDockWidget", "Unique Values Viewer"))
+        self.fieldLbl.setText(_translate("UVVDockWidget", "Target field"))
+        self.searchLbl.setText(_translate("UVVDockWidget", "Search values:"))
+        self.valuesLbl.setText(_translate("UVVDockWidget", "Unique values"))
+        self.valueModeBox.setToolTip(_translate("UVVDockWidget", "Show the unique values, a histogram of a numeric field, the values of a date/time field rolled up by years, months, days or hours or the most frequent values"))
+        self.valueModeBox.setItemText(0, _translate("UVVDockWidget", "Unique values"))
+        self.valueModeBox.setItemText(1, _translate("UVVDockWidget", "Histogram"))
+        self.valueModeBox.setItemText(2, _translate("UVVDockWidget", "Years"))
+        self.valueModeBox.setItemText(3, _translate("UVVDockWidget", "Months"))
+        self.valueModeBox.setItemText(4, _translate("UVVDockWidget", "Days"))
+        self.valueModeBox.setItemText(5, _translate("UVVDockWidget", "Hours"))
+        self.valueModeBox.setItemText(6, _translate("UVVDockWidget", "Most frequent values"))
+        self.selectedOnlyBtn.setToolTip(_translate("UVVDockWidget", "Return only unique values from selected features.\n"
+"This can affect performance."))
+        self.selectedOnlyBtn.setText(_translate("UVVDockWidget", "Selected features only"))
+        self.getValuesBtn.setToolTip(_translate("UVVDockWidget", "Calculate unique values for selected field"))
+        self.getValuesBtn.setText(_translate("UVVDockWidget", "Get values"))
+        self.layerLbl.setText(_translate("UVVDockWidget", "Layer"))
+        self.listWidget.setSortingEnabled(False)
+        self.clearBtn.setToolTip(_translate("UVVDockWidget", "Clear list of unique values"))
+        self.clearBtn.setText(_translate("UVVDockWidget", "Clear"))
+        self.valueSearch.setPlaceholderText(_translate("UVVDockWidget", "Search.."))
+        self.extentOnlyBtn.setToolTip(_translate("UVVDockWidget", "Return only unique values from features within the visible map extent."))
+        self.extentOnlyBtn.setText(_translate("UVVDockWidget", "Visible extent only"))
+        self.liveUpdateBtn.setToolTip(_translate("UVVDockWidget", "Automatically updates the unique values when field or layer change or the active layer is removed. Be careful with large datasets."))
+        self.liveUpdateBtn.setText(_translate("UVVDockWidget", "Update values automatically"))
+        self.toolButton.setText(_translate("UVVDockWidget", "..."))
+        self.UVVTabWidget.setTabText(self.UVVTabWidget.indexOf(self.viewerTab), _translate("UVVDockWidget", "Viewer"))
+        self.generalOptionsGrp.setTitle(_translate("UVVDockWidget", "General options"))
+        self.sortOptionBtn.setToolTip(_translate("UVVDockWidget", "Sort unique values displayed in the widget."))
+        self.sortOptionBtn.setText(_translate("UVVDockWidget", "Sort values"))
+        self.syncLayerBtn.setToolTip(_translate("UVVDockWidget", "Synchronises the active map layer with the combo box."))
+        self.syncLayerBtn.setText(_translate("UVVDockWidget", "Sync with active layer"))
+        self.fuzzySearchBtn.setToolTip(_translate("UVVDockWidget", "Searches values ignoring case and accents and also finds similar values with typos"))
+        self.fuzzySearchBtn.setText(_translate("UVVDockWidget", "Fuzzy search"))
+        self.nativeEnginesBtn.setToolTip(_translate("UVVDockWidget", "Reads the values of supported file formats directly with GDAL instead of iterating over the features. Falls back to the features if the data source is not supported."))
+        self.nativeEnginesBtn.setText(_translate("UVVDockWidget", "Read supported data sources directly"))
+        self.memoryBudgetLbl.setToolTip(_translate("UVVDockWidget", "Maximum memory used to deduplicate values. When exceeded, values are written to a temporary database on disk. 0 disables the limit."))
+        self.memoryBudgetLbl.setText(_translate("UVVDockWidget", "Memory budget"))
+        self.memoryBudgetSpin.setSpecialValueText(_translate("UVVDockWidget", "Unlimited"))
+        self.memoryBudgetSpin.setSuffix(_translate("UVVDockWidget", " MB"))
+        self.histogramBinsLbl.setToolTip(_translate("UVVDockWidget", "Number of bins of the histogram of numeric fields"))
+        self.histogramBinsLbl.setText(_translate("UVVDockWidget", "Histogram bins"))
+        self.topKLbl.setToolTip(_translate("UVVDockWidget", "Number of values shown as most frequent values"))
+        self.topKLbl.setText(_translate("UVVDockWidget", "Most frequent values"))
+        self.verifyTopKBtn.setToolTip(_translate("UVVDockWidget", "Counts the features of the most frequent values exactly in a second pass. Otherwise the counts may be overestimated for fields with many values."))
+        self.verifyTopKBtn.setText(_translate("UVVDockWidget", "Verify counts of most frequent values"))
+        self.mGroupBox.setTitle(_translate("UVVDockWidget", "Copy"))
+        self.sepCharLbl.setToolTip(_translate("UVVDockWidget", "The separation character that is used when copying more than one value from the list of values."))
+        self.sepCharLbl.setText(_translate("UVVDockWidget", "Separation Character"))
+        self.newLineBtn.setText(_translate("UVVDockWidget", "Place values in new line"))
+        self.quoteCharLbl.setToolTip(_translate("UVVDockWidget", "Character to wrap around when copying quoted values."))
+        self.quoteCharLbl.setText(_translate("UVVDockWidget", "Quoting Character"))
+        self.sepCharBox.setCurrentText(_translate("UVVDockWidget", ","))
+        self.sepCharBox.setItemText(0, _translate("UVVDockWidget", ","))
+        self.sepCharBox.setItemText(1, _translate("UVVDockWidget", ";"))
+        self.sepCharBox.setItemText(2, _translate("UVVDockWidget", "Space"))
+        self.sepCharBox.setItemText(3, _translate("UVVDockWidget", "Tab"))
+        self.sepCharBox.setItemText(4, _translate("UVVDockWidget", "Other"))
+        self.quoteCharBox.setCurrentText(_translate("UVVDockWidget", "\'"))
+        self.quoteCharBox.setItemText(0, _translate("UVVDockWidget", "\'"))
+        self.quoteCharBox.setItemText(1, _translate("UVVDockWidget", "\""))
+        self.quoteCharBox.setItemText(2, _translate("UVVDockWidget", "´"))
+        self.quoteCharBox.setItemText(3, _translate("UVVDockWidget", "`"))
+        self.quoteCharBox.setItemText(4, _translate("UVVDockWidget", "Space"))
+        self.quoteCharBox.setItemText(5, _translate("UVVDockWidget", "Other"))
+        self.mGroupBox_2.setTitle(_translate("UVVDockWidget", "Display"))
+        self.rawValuesRBtn.setText(_translate("UVVDockWidget", "Raw values"))
+        self.formValuesRBtn.setText(_translate("UVVDockWidget", "Formatted values"))
+        self.bothValuesRBtn.setText(_translate("UVVDockWidget", "Both"))
+        self.diagnosticsGrp.setTitle(_translate("UVVDockWidget", "Diagnostics"))
+        self.profilingBtn.setToolTip(_translate("UVVDockWidget", "Measures the time of each processing stage (fetching, deduplication, formatting, sorting, populating the list, building expressions and selecting) together with features/sec."))
+        self.profilingBtn.setText(_translate("UVVDockWidget", "Enable profiling"))
+        self.profilingMemoryBtn.setToolTip(_translate("UVVDockWidget", "Records the peak memory allocated by Python instead of the times. Tracing the memory slows down Python code, but not the data providers, so the times of these runs are not comparable and are not shown."))
+        self.profilingMemoryBtn.setText(_translate("UVVDockWidget", "Measure peak memory instead of times"))
+        self.diagnosticsText.setPlaceholderText(_translate("UVVDockWidget", "No profiling data recorded"))
+        self.exportDiagnosticsBtn.setToolTip(_translate("UVVDockWidget", "Export all recorded runs as JSON file"))
+        self.exportDiagnosticsBtn.setText(_translate("UVVDockWidget", "Export JSON"))
+        self.clearDiagnosticsBtn.setText(_translate("UVVDockWidget", "Clear"))
+        self.resetDefaultsBtn.setText(_translate("UVVDockWidget", "Reset to Defaults"))
+        self.UVVTabWidget.setTabText(self.UVVTabWidget.indexOf(self.settingsTab), _translate("UVVDockWidget", "Settings"))
+from qgis.gui import QgsCollapsibleGroupBox
+from qgis.gui import QgsFieldComboBox
+from qgis.gui import QgsFilterLineEdit
+from qgis.gui import QgsMapLayerComboBox
+from qgis.gui import QgsSpinBox
+from unique_values_viewer.core.widgets import UVVListWidget